@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the hot paths across the project.
+
+Runs every case at several input sizes, from a single call to 100,000
+records (or a million with --large), and reports records per second.
+Results can be saved as a JSON baseline, and a later run compared against
+it fails (exit status 1) when any case has slowed down by more than the
+threshold. Baselines depend on the machine, so compare runs made on the
+same one; a baseline recorded with a different Python, NumPy or machine is
+refused unless --ignore-environment is given.
+
+    python benchmark_suite.py --save baseline.json
+    python benchmark_suite.py --baseline baseline.json --threshold 0.2
+    python benchmark_suite.py --large --filter Library
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for directory in ('control-flow', 'fns_and_dsa', 'programming_paradigm', 'python_introduction'):
+    sys.path.insert(0, os.path.join(ROOT, directory))
+
+from arithmetic_operations import np, perform_operation, perform_operations  # noqa: E402
+from bank_account import AccountBook, BankAccount  # noqa: E402
+from library_management import Library  # noqa: E402
+from robust_division_calculator import safe_divide, safe_divide_many  # noqa: E402
+from simple_calculator import SimpleCalculator  # noqa: E402
+from temp_conversion_tool import TEMPERATURE_UNITS, convert_to_celsius  # noqa: E402
+
+DEFAULT_SIZES = (1, 1_000, 100_000)
+# Added by --large; a full run at these sizes takes minutes, not seconds.
+LARGE_SIZES = (1_000_000,)
+DEFAULT_THRESHOLD = 0.2
+
+# Each timing repeats a case until it has run for at least this long.
+MIN_SECONDS = 0.05
+
+
+def _numbers(size, seed, low=-1000, high=1000):
+    rng = random.Random(seed)
+    return [rng.uniform(low, high) for _ in range(size)]
+
+
+def _calculator_divide(size):
+    calc = SimpleCalculator()
+    numbers1, numbers2 = _numbers(size, 1), _numbers(size, 2)
+    return lambda: list(map(calc.divide, numbers1, numbers2))
+
+
+def _calculator_compiled(size):
+    expression = SimpleCalculator().compile("(a - b) * a / b")
+    rows = list(zip(_numbers(size, 1), _numbers(size, 2)))
+    return lambda: expression.evaluate_many(rows)
+
+
+def _perform_operation(size):
+    numbers1, numbers2 = _numbers(size, 1), _numbers(size, 2)
+    return lambda: [perform_operation(a, b, 'divide') for a, b in zip(numbers1, numbers2)]
+
+
+def _perform_operations(size):
+    numbers1, numbers2 = _numbers(size, 1), _numbers(size, 2)
+    if np is not None:
+        numbers1, numbers2 = np.array(numbers1), np.array(numbers2)
+    return lambda: perform_operations(numbers1, numbers2, 'divide')
+
+
+def _division_strings(size):
+    rng = random.Random(3)
+    numerators = [f"{rng.uniform(-1000, 1000):.2f}" for _ in range(size)]
+    denominators = [rng.choice(("0", "n/a")) if rng.random() < 0.05
+                    else str(rng.randint(1, 500)) for _ in range(size)]
+    return numerators, denominators
+
+
+def _safe_divide(size):
+    numerators, denominators = _division_strings(size)
+    return lambda: list(map(safe_divide, numerators, denominators))
+
+
+def _safe_divide_many(size):
+    numerators, denominators = _division_strings(size)
+    return lambda: safe_divide_many(numerators, denominators)
+
+
+def _bank_deposit_withdraw(size):
+    amounts = _numbers(size, 4, 1, 100)
+
+    def run():
+        account = BankAccount(0)
+        for amount in amounts:
+            account.deposit(amount)
+            account.withdraw(amount)
+    return run
+
+
+def _account_book_deposit(size):
+    book = AccountBook([100.0] * size)
+    amounts = _numbers(size, 4, 1, 100)
+    return lambda: book.deposit(amounts)
+
+
+def _library_check_out_return(size):
+    library = Library()
+    titles = [f"Title {index // 3}" for index in range(size)]
+    library.add_records((title, "Author") for title in titles)
+
+    def run():
+        for title in titles:
+            library.check_out_book(title)
+        for title in titles:
+            library.return_book(title)
+    return run
+
+
+def _convert_to_celsius(size):
+    values = _numbers(size, 5, -100, 200)
+    return lambda: list(map(convert_to_celsius, values))
+
+
+def _convert_many(size):
+    values = _numbers(size, 5, -100, 200)
+    if np is not None:
+        values = np.array(values)
+    return lambda: TEMPERATURE_UNITS.convert_many(values, 'F', 'C')
+
+
+# Case name -> function that takes a size and returns a callable processing
+# that many records. Setup happens outside the timing.
+CASES = {
+    'SimpleCalculator.divide': _calculator_divide,
+    'SimpleCalculator.compile': _calculator_compiled,
+    'perform_operation': _perform_operation,
+    'perform_operations': _perform_operations,
+    'safe_divide': _safe_divide,
+    'safe_divide_many': _safe_divide_many,
+    'BankAccount.deposit/withdraw': _bank_deposit_withdraw,
+    'AccountBook.deposit': _account_book_deposit,
+    'Library.check_out/return': _library_check_out_return,
+    'convert_to_celsius': _convert_to_celsius,
+    'ConversionRegistry.convert_many': _convert_many,
+}
+
+
+def measure(run, size, repeat=3):
+    """Time a case and return its best rate.
+
+    Args:
+        run (callable): Processes size records per call.
+        size (int): Records processed per call.
+        repeat (int): Number of timings; the fastest one counts.
+
+    Returns:
+        float: Records per second.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        seconds = time.perf_counter() - start
+        if seconds >= MIN_SECONDS:
+            break
+        loops *= 10
+    best = seconds
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        best = min(best, time.perf_counter() - start)
+    return size * loops / best
+
+
+def run_suite(sizes=DEFAULT_SIZES, pattern=None, repeat=3, report=None):
+    """Run every selected case at every size.
+
+    Args:
+        sizes (iterable): Input sizes.
+        pattern (str): Only run cases whose name contains this text.
+        repeat (int): Timings per case and size.
+        report (callable): Called with (key, rate) after each measurement.
+
+    Returns:
+        dict: Records per second keyed by "case@size".
+    """
+    results = {}
+    for name, setup in CASES.items():
+        if pattern and pattern not in name:
+            continue
+        for size in sizes:
+            key = f"{name}@{size}"
+            results[key] = measure(setup(size), size, repeat)
+            if report is not None:
+                report(key, results[key])
+    return results
+
+
+def find_regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Compare results with a baseline.
+
+    Args:
+        results (dict): Rates keyed like run_suite's result.
+        baseline (dict): Earlier rates with the same keys; keys missing from
+            either side are ignored.
+        threshold (float): Allowed slowdown, as a fraction of the baseline.
+
+    Returns:
+        dict: (baseline rate, new rate) for every key that regressed.
+    """
+    return {key: (baseline[key], rate) for key, rate in results.items()
+            if key in baseline and rate < baseline[key] * (1 - threshold)}
+
+
+def environment():
+    """Describe what the results depend on besides the code.
+
+    Returns:
+        dict: The Python version, whether NumPy is used and the machine type.
+    """
+    return {"python": platform.python_version(), "numpy": np is not None,
+            "machine": platform.machine()}
+
+
+def environment_differences(saved, current=None):
+    """List how a baseline's environment differs from this one.
+
+    Args:
+        saved (dict): A saved baseline, with the keys environment() returns.
+        current (dict): The environment to compare with; None means this one.
+
+    Returns:
+        list: One "name: saved -> current" string per difference.
+    """
+    if current is None:
+        current = environment()
+    return [f"{name}: {saved.get(name, 'unknown')} -> {value}"
+            for name, value in current.items() if saved.get(name) != value]
+
+
+def main(argv=None):
+    """Run the suite, optionally saving or checking a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="input sizes (default: 1 1000 100000)")
+    parser.add_argument("--large", action="store_true",
+                        help="also run every case at 1000000 records")
+    parser.add_argument("--filter", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timings per case; the fastest counts (default: 3)")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="JSON baseline to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed slowdown before a case fails (default: 0.2 = 20%%)")
+    parser.add_argument("--ignore-environment", action="store_true",
+                        help="compare with a baseline from a different Python, NumPy "
+                             "or machine, with a warning, instead of refusing")
+    args = parser.parse_args(argv)
+    if not 0 <= args.threshold < 1:
+        parser.error("--threshold must be at least 0 and below 1")
+
+    sizes = list(args.sizes)
+    if args.large:
+        sizes += [size for size in LARGE_SIZES if size not in sizes]
+
+    baseline = {}
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as file:
+                saved = json.load(file)
+        except (OSError, ValueError) as error:
+            parser.error(f"cannot read baseline {args.baseline}: {error}")
+        if not isinstance(saved, dict) or not isinstance(saved.get("results"), dict):
+            parser.error(f"{args.baseline} is not a baseline saved by --save "
+                         f"(no \"results\" object)")
+        differences = environment_differences(saved)
+        if differences:
+            message = (f"{args.baseline} was recorded in a different environment ("
+                       f"{'; '.join(differences)})")
+            if not args.ignore_environment:
+                parser.error(message + "; pass --ignore-environment to compare anyway")
+            print(f"WARNING: {message}; rate changes may not be regressions",
+                  file=sys.stderr)
+        baseline = saved["results"]
+
+    def report(key, rate):
+        line = f"  {key:<42} {rate:16,.0f}"
+        if key in baseline:
+            line += f"  {rate / baseline[key] - 1:+7.1%}"
+        print(line, flush=True)
+
+    print(f"Records per second (Python {platform.python_version()}, "
+          f"{'NumPy' if np is not None else 'no NumPy'}):")
+    results = run_suite(sizes, args.filter, args.repeat, report)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({**environment(), "results": results}, file, indent=2, sort_keys=True)
+            file.write("\n")
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for key, (old, new) in regressions.items():
+        print(f"REGRESSION {key}: {old:,.0f} -> {new:,.0f} records/s "
+              f"({new / old - 1:+.1%}, threshold -{args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+# benchmark_calculator_service.py
+
+# Load generator for calculator_service.py. Opens many connections, sends
+# pipelined requests in batches, checks every answer against calculate()
+# and reports requests per second and p50/p99 latency. Without --port or
+# --unix it starts the service in the same process, which then shares the
+# CPU with the load generator.
+
+import argparse
+import asyncio
+import random
+import time
+
+from calculator_service import calculate, start
+
+
+def make_requests(count, seed=0):
+    """
+    Build random requests with their expected answers
+
+    Parameters:
+    count (int): Number of requests
+    seed (int): Random seed
+
+    Returns:
+    list: (request line, expected answer) tuples; about 1% divide by zero
+    """
+    rng = random.Random(seed)
+    requests = []
+    for _ in range(count):
+        operation = rng.choice('+-*/')
+        num2 = 0 if rng.random() < 0.01 else rng.randint(1, 1000)
+        request = f"{rng.randint(-1000, 1000)} {operation} {num2}"
+        requests.append((request, calculate(request)))
+    return requests
+
+
+async def _client(open_connection, requests, depth, latencies):
+    """Send requests in pipelined batches of depth on one connection"""
+    reader, writer = await open_connection()
+    try:
+        for start_index in range(0, len(requests), depth):
+            batch = requests[start_index:start_index + depth]
+            sent = time.perf_counter()
+            writer.write(''.join(request + '\n' for request, _ in batch).encode())
+            for _, expected in batch:
+                answer = (await reader.readline()).decode().rstrip('\n')
+                if answer != expected:
+                    raise AssertionError(f"Expected {expected!r}, got {answer!r}")
+                latencies.append(time.perf_counter() - sent)
+    finally:
+        writer.close()
+
+
+def _percentile(ordered, percent):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+async def run_load(connections, requests_per_connection, depth, host, port, path):
+    """
+    Run the load test
+
+    Returns:
+    tuple: (requests per second, sorted latencies in seconds)
+    """
+    server = None
+    if port is None and path is None:
+        server = await start(port=0)
+        host, port = server.sockets[0].getsockname()[:2]
+    if path is not None:
+        open_connection = lambda: asyncio.open_unix_connection(path)
+    else:
+        open_connection = lambda: asyncio.open_connection(host, port)
+
+    requests = make_requests(requests_per_connection)
+    latencies = []
+    begin = time.perf_counter()
+    await asyncio.gather(*(_client(open_connection, requests, depth, latencies)
+                           for _ in range(connections)))
+    seconds = time.perf_counter() - begin
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+    return len(latencies) / seconds, sorted(latencies)
+
+
+def main():
+    """Run the load generator and print throughput and latency"""
+    parser = argparse.ArgumentParser(description="Load test the calculator service.")
+    parser.add_argument('--connections', type=int, default=50,
+                        help="concurrent connections (default: %(default)s)")
+    parser.add_argument('--requests', type=int, default=2000,
+                        help="requests per connection (default: %(default)s)")
+    parser.add_argument('--depth', type=int, default=16,
+                        help="requests sent before waiting for answers (default: %(default)s)")
+    parser.add_argument('--host', default='127.0.0.1', help="service address")
+    parser.add_argument('--port', type=int, help="service port; omit to start one in-process")
+    parser.add_argument('--unix', metavar='PATH', help="service Unix socket")
+    args = parser.parse_args()
+
+    rate, latencies = asyncio.run(run_load(args.connections, args.requests, args.depth,
+                                           args.host, args.port, args.unix))
+    print(f"{len(latencies):,} requests over {args.connections} connections, "
+          f"pipeline depth {args.depth}")
+    print(f"  requests/s  {rate:12,.0f}")
+    print(f"  p50         {_percentile(latencies, 50) * 1000:12.3f} ms")
+    print(f"  p99         {_percentile(latencies, 99) * 1000:12.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# benchmark_pattern_renderer.py
+
+# Compare the print loops of pattern_drawing.py and multiplication_table.py
+# with the chunked writes of pattern_renderer.py. Output goes to os.devnull.
+# At size 10,000 the pattern loop makes 100 million print calls, so by
+# default it is timed on its first rows only and the total is extrapolated.
+
+import argparse
+import os
+import time
+from contextlib import redirect_stdout
+
+from pattern_renderer import write_pattern, write_tables
+
+
+def _pattern_loop(size, rows):
+    # The loop from pattern_drawing.py, stopped after the given rows
+    row = 0
+    while row < rows:
+        for col in range(size):
+            print("*", end="")
+        print()
+        row += 1
+
+
+def _table_loop(numbers):
+    # The loop from multiplication_table.py, once per number
+    for number in numbers:
+        for i in range(1, 11):
+            product = number * i
+            print(f"{number} * {i} = {product}")
+
+
+def _seconds(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print the time taken by each path"""
+    parser = argparse.ArgumentParser(description="Benchmark pattern and table rendering.")
+    parser.add_argument('--size', type=int, default=10_000,
+                        help="pattern size and number of tables (default: 10,000)")
+    parser.add_argument('--sample-rows', type=int, default=100,
+                        help="pattern rows to time the print loop on; 0 times every row "
+                             "(default: 100)")
+    args = parser.parse_args()
+    sample = min(args.sample_rows or args.size, args.size)
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        results = {
+            "pattern, print loop": _seconds(_pattern_loop, args.size, sample) * args.size / sample,
+            "pattern, chunked writes": _seconds(write_pattern, args.size, devnull),
+            "pattern, chunked (cached)": _seconds(write_pattern, args.size, devnull),
+            "tables, print loop": _seconds(_table_loop, range(1, args.size + 1)),
+            "tables, chunked writes": _seconds(write_tables, range(1, args.size + 1), devnull),
+            "tables, chunked (cached)": _seconds(write_tables, range(1, args.size + 1), devnull),
+        }
+    print(f"Seconds at size {args.size:,}:")
+    for name, seconds in results.items():
+        note = (f"  (estimated from {sample:,} rows)"
+                if name == "pattern, print loop" and sample < args.size else "")
+        print(f"  {name:<26} {seconds:10.3f}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# calculator_service.py
+
+# Network version of match_case_calculator.py. Clients connect over TCP or
+# a Unix socket and send requests such as "3 * 4", one per line, and get
+# back the same messages the script prints, one line per request and in
+# the same order. Clients may send many requests without waiting for
+# answers (pipelining); every request that arrives in one read is answered
+# with a single write.
+
+import argparse
+import asyncio
+import operator
+
+RESULT = "The result is {}."
+DIVIDE_BY_ZERO = "Cannot divide by zero."
+INVALID_OPERATION = "Invalid operation. Please choose one of (+, -, *, /)."
+INVALID_REQUEST = "Invalid request. Please send: number operator number."
+
+OPERATIONS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+
+# Bytes read at a time, and the longest request line accepted
+READ_SIZE = 64 * 1024
+MAX_LINE = 64 * 1024
+
+
+def calculate(request):
+    """
+    Answer one request, as match_case_calculator.py would
+
+    Parameters:
+    request (str): "num1 op num2", separated by whitespace
+
+    Returns:
+    str: The result or error message
+    """
+    parts = request.split()
+    if len(parts) != 3:
+        return INVALID_REQUEST
+    num1, operation, num2 = parts
+    try:
+        num1 = float(num1)
+        num2 = float(num2)
+    except ValueError:
+        return INVALID_REQUEST
+    function = OPERATIONS.get(operation)
+    if function is None:
+        return INVALID_OPERATION
+    if function is operator.truediv and num2 == 0:
+        return DIVIDE_BY_ZERO
+    return RESULT.format(function(num1, num2))
+
+
+async def handle_connection(reader, writer):
+    """Answer the requests on one connection until the client disconnects"""
+    pending = b''
+    try:
+        while True:
+            data = await reader.read(READ_SIZE)
+            if not data:
+                break
+            *lines, pending = (pending + data).split(b'\n')
+            if lines:
+                writer.write(''.join([calculate(line.decode('utf-8', 'replace')) + '\n'
+                                      for line in lines]).encode())
+                await writer.drain()
+            if len(pending) > MAX_LINE:
+                # Answer the oversized line once and drop the connection.
+                writer.write((INVALID_REQUEST + '\n').encode())
+                pending = b''
+                break
+        if pending.strip():
+            # The last request was not followed by a newline.
+            writer.write((calculate(pending.decode('utf-8', 'replace')) + '\n').encode())
+        await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def start(host='127.0.0.1', port=8888, path=None):
+    """
+    Start the service
+
+    Parameters:
+    host (str): Address to listen on
+    port (int): TCP port; 0 picks a free one
+    path (str): Unix socket path; if given, host and port are ignored
+
+    Returns:
+    asyncio.Server: The running server
+    """
+    if path is not None:
+        return await asyncio.start_unix_server(handle_connection, path)
+    return await asyncio.start_server(handle_connection, host, port)
+
+
+async def _serve(host, port, path):
+    server = await start(host, port, path)
+    for socket in server.sockets:
+        print(f"Serving calculations on {socket.getsockname()}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    """Run the service until interrupted"""
+    parser = argparse.ArgumentParser(description="Serve calculations over TCP or a Unix socket.")
+    parser.add_argument('--host', default='127.0.0.1', help="address (default: %(default)s)")
+    parser.add_argument('--port', type=int, default=8888, help="TCP port (default: %(default)s)")
+    parser.add_argument('--unix', metavar='PATH', help="listen on a Unix socket instead")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
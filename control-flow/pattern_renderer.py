@@ -0,0 +1,145 @@
+# pattern_renderer.py
+
+# Bulk versions of multiplication_table.py and pattern_drawing.py. Instead
+# of one print call per line or per "*", every table and pattern row is
+# built once as a string, repeated rows and tables come from a cache, and
+# output is written in large chunks, so even a 10,000 x 10,000 pattern
+# takes about a hundred writes and never has to fit in memory at once.
+
+import argparse
+import sys
+from functools import lru_cache
+
+# Characters written per write call when streaming
+CHUNK_SIZE = 1 << 20
+
+
+@lru_cache(maxsize=16384)
+def multiplication_table(number, upto=10):
+    """
+    The multiplication table for a number, as multiplication_table.py prints it
+
+    Parameters:
+    number (int): The number to multiply
+    upto (int): Last multiplier
+
+    Returns:
+    str: One "number * i = product" line per multiplier, each ending in a newline
+    """
+    return ''.join([f"{number} * {i} = {number * i}\n" for i in range(1, upto + 1)])
+
+
+@lru_cache(maxsize=256)
+def pattern_row(size, char='*'):
+    """One row of a size x size pattern, including the newline"""
+    return char * size + '\n'
+
+
+@lru_cache(maxsize=16)
+def _pattern_chunk(size, char, rows):
+    return pattern_row(size, char) * rows
+
+
+def iter_pattern(size, char='*', chunk_size=CHUNK_SIZE):
+    """
+    Generate a square pattern, as pattern_drawing.py draws it, in chunks
+
+    Every chunk but the last is the same cached string, holding as many
+    whole rows as fit in chunk_size characters (at least one row).
+
+    Parameters:
+    size (int): Number of rows and columns
+    char (str): Character to draw with
+    chunk_size (int): Rough number of characters per chunk
+
+    Yields:
+    str: Consecutive pieces of the pattern
+    """
+    if size <= 0:
+        return
+    rows_per_chunk = min(size, max(1, chunk_size // (size + 1)))
+    full_chunks, remaining_rows = divmod(size, rows_per_chunk)
+    chunk = _pattern_chunk(size, char, rows_per_chunk)
+    for _ in range(full_chunks):
+        yield chunk
+    if remaining_rows:
+        yield _pattern_chunk(size, char, remaining_rows)
+
+
+def render_pattern(size, char='*'):
+    """
+    A whole square pattern as one string
+
+    Parameters:
+    size (int): Number of rows and columns
+    char (str): Character to draw with
+
+    Returns:
+    str: The pattern; use iter_pattern or write_pattern for large sizes
+    """
+    return pattern_row(size, char) * max(size, 0)
+
+
+def write_pattern(size, out=None, char='*', chunk_size=CHUNK_SIZE):
+    """
+    Write a square pattern in chunks
+
+    Parameters:
+    size (int): Number of rows and columns
+    out (file): Where to write; None means sys.stdout
+    char (str): Character to draw with
+    chunk_size (int): Rough number of characters per write
+    """
+    write = (sys.stdout if out is None else out).write
+    for chunk in iter_pattern(size, char, chunk_size):
+        write(chunk)
+
+
+def write_tables(numbers, out=None, upto=10, chunk_size=CHUNK_SIZE):
+    """
+    Write the multiplication tables for many numbers in chunks
+
+    Parameters:
+    numbers (iterable of int): The numbers, in output order
+    out (file): Where to write; None means sys.stdout
+    upto (int): Last multiplier of every table
+    chunk_size (int): Rough number of characters per write
+    """
+    write = (sys.stdout if out is None else out).write
+    pending = []
+    pending_size = 0
+    for number in numbers:
+        table = multiplication_table(number, upto)
+        pending.append(table)
+        pending_size += len(table)
+        if pending_size >= chunk_size:
+            write(''.join(pending))
+            pending.clear()
+            pending_size = 0
+    if pending:
+        write(''.join(pending))
+
+
+def main(argv=None):
+    """Print multiplication tables or a pattern"""
+    parser = argparse.ArgumentParser(description="Print multiplication tables or a square pattern.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    table = subparsers.add_parser('table', help="multiplication tables for 1..N or one number")
+    table.add_argument('number', type=int)
+    table.add_argument('--all', action='store_true',
+                       help="print the tables of every number from 1 to NUMBER")
+    table.add_argument('--upto', type=int, default=10, help="last multiplier (default: 10)")
+    pattern = subparsers.add_parser('pattern', help="a SIZE x SIZE square of characters")
+    pattern.add_argument('size', type=int)
+    pattern.add_argument('--char', default='*', help="character to draw with (default: *)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'table':
+        numbers = range(1, args.number + 1) if args.all else [args.number]
+        write_tables(numbers, upto=args.upto)
+    else:
+        write_pattern(args.size, char=args.char)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# reminder_scheduler.py
+
+# Many reminders at once, instead of daily_reminder.py's single task.
+# Reminders are kept in a heap ordered by when they are due and then by
+# priority, so adding one and taking the next are both O(log n). An
+# asyncio loop sleeps until the earliest reminder is due (or a new, earlier
+# one is added) and fires everything that is due in one batch, so nothing
+# is polled. Messages read exactly like daily_reminder.py's; their fixed
+# parts are built once per priority up front.
+
+import argparse
+import asyncio
+import csv
+import heapq
+import sys
+import time
+from itertools import count
+
+PRIORITIES = ('high', 'medium', 'low')
+
+_RANKS = {priority: rank for rank, priority in enumerate(PRIORITIES)}
+
+_OPENINGS = {
+    'high': "Reminder: '{}' is a high priority task",
+    'medium': "Reminder: '{}' is a medium priority task",
+    'low': "Note: '{}' is a low priority task",
+}
+_ENDINGS = {
+    True: " that requires immediate attention today!",
+    False: ".Consider completing it when you have free time.",
+}
+
+# (priority, time_bound) -> (text before the task, text after it)
+_TEMPLATES = {(priority, time_bound): tuple(("Reminder:" + opening + ending).split('{}'))
+              for priority, opening in _OPENINGS.items()
+              for time_bound, ending in _ENDINGS.items()}
+
+
+class Reminder:
+    """A scheduled task; returned by ReminderScheduler.add"""
+
+    __slots__ = ('task', 'priority', 'time_bound', 'due', 'cancelled')
+
+    def __init__(self, task, priority, time_bound, due):
+        self.task = task
+        self.priority = priority
+        self.time_bound = time_bound
+        self.due = due
+        self.cancelled = False
+
+    @property
+    def message(self):
+        """The reminder text, as daily_reminder.py would print it"""
+        before, after = _TEMPLATES[self.priority, self.time_bound]
+        return before + self.task + after
+
+    def __repr__(self):
+        return (f"Reminder({self.task!r}, {self.priority!r}, "
+                f"time_bound={self.time_bound}, due={self.due})")
+
+
+class ReminderScheduler:
+    """
+    A heap of reminders, ordered by due time and then by priority
+
+    Reminders due at the same moment come out high priority first, and in
+    the order they were added within a priority. Cancelled reminders are
+    left in the heap and skipped when they reach the top.
+    """
+
+    def __init__(self, clock=time.time):
+        """
+        Parameters:
+        clock (callable): Returns the current time, in the same units as
+            the due times given to add
+        """
+        self._clock = clock
+        self._heap = []
+        self._order = count()
+        self._live = 0
+        self._changed = None
+
+    def __len__(self):
+        return self._live
+
+    def add(self, task, priority, due=None, time_bound=False):
+        """
+        Schedule a reminder
+
+        Parameters:
+        task (str): What to be reminded of
+        priority (str): 'high', 'medium' or 'low'
+        due (float): When the reminder fires; None means now
+        time_bound (bool): Whether the task must be done today
+
+        Returns:
+        Reminder: The scheduled reminder, which can be passed to cancel
+        """
+        rank = _RANKS.get(priority)
+        if rank is None:
+            raise ValueError(f"Unknown priority {priority!r}; expected one of "
+                             f"{', '.join(PRIORITIES)}.")
+        if due is None:
+            due = self._clock()
+        reminder = Reminder(task, priority, bool(time_bound), due)
+        heap = self._heap
+        heapq.heappush(heap, (due, rank, next(self._order), reminder))
+        self._live += 1
+        if self._changed is not None and heap[0][3] is reminder:
+            # The loop in run() may be sleeping until a later reminder.
+            self._changed.set()
+        return reminder
+
+    def cancel(self, reminder):
+        """
+        Cancel a reminder that has not fired yet
+
+        Parameters:
+        reminder (Reminder): As returned by add
+
+        Returns:
+        bool: True if it was cancelled, False if it had already fired or
+            been cancelled
+        """
+        if reminder.cancelled or reminder.due is None:
+            return False
+        reminder.cancelled = True
+        self._live -= 1
+        return True
+
+    def _drop_cancelled(self):
+        heap = self._heap
+        while heap and heap[0][3].cancelled:
+            heapq.heappop(heap)
+
+    def peek(self):
+        """
+        Get the next reminder without removing it
+
+        Returns:
+        Reminder: The next reminder, or None if there are none
+        """
+        self._drop_cancelled()
+        return self._heap[0][3] if self._heap else None
+
+    def pop(self):
+        """
+        Remove and return the next reminder, whether or not it is due
+
+        Returns:
+        Reminder: The next reminder, or None if there are none
+        """
+        self._drop_cancelled()
+        if not self._heap:
+            return None
+        reminder = heapq.heappop(self._heap)[3]
+        reminder.due = None  # marks it as fired
+        self._live -= 1
+        return reminder
+
+    def pop_due(self, now=None):
+        """
+        Remove and return every reminder that is due
+
+        Parameters:
+        now (float): The current time; None asks the clock
+
+        Returns:
+        list: The due reminders, in firing order
+        """
+        if now is None:
+            now = self._clock()
+        heap = self._heap
+        due = []
+        while heap and heap[0][0] <= now:
+            reminder = heapq.heappop(heap)[3]
+            if not reminder.cancelled:
+                reminder.due = None
+                due.append(reminder)
+        self._live -= len(due)
+        return due
+
+    async def run(self, deliver, stop_when_empty=False):
+        """
+        Fire reminders as they fall due
+
+        Sleeps until the next reminder is due, or until add() schedules an
+        earlier one, then passes every due reminder to deliver in one call.
+
+        Parameters:
+        deliver (callable): Called with a list of due reminders
+        stop_when_empty (bool): Return once no reminders are left, instead
+            of waiting for new ones
+        """
+        self._changed = changed = asyncio.Event()
+        try:
+            while True:
+                changed.clear()
+                due = self.pop_due()
+                if due:
+                    deliver(due)
+                next_reminder = self.peek()
+                if next_reminder is None:
+                    if stop_when_empty:
+                        return
+                    await changed.wait()
+                    continue
+                try:
+                    await asyncio.wait_for(changed.wait(),
+                                           max(next_reminder.due - self._clock(), 0))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._changed = None
+
+
+def _print_batch(reminders):
+    """Write a batch of reminders with a single write"""
+    sys.stdout.write(''.join(reminder.message + '\n' for reminder in reminders))
+    sys.stdout.flush()
+
+
+def main(argv=None):
+    """Fire the reminders listed in a CSV file"""
+    parser = argparse.ArgumentParser(
+        description="Fire reminders from a CSV file with the columns "
+                    "delay (seconds from now), priority, time_bound (yes/no), task. "
+                    "A header row is skipped.")
+    parser.add_argument('file', help="CSV file of reminders ('-' for stdin)")
+    args = parser.parse_args(argv)
+
+    scheduler = ReminderScheduler()
+    start = time.time()
+    source = sys.stdin if args.file == '-' else open(args.file, newline='', encoding='utf-8')
+    try:
+        reader = csv.reader(source)
+        for row in reader:
+            if not row:
+                continue
+            where = f"{args.file}, line {reader.line_num}"
+            if len(row) != 4:
+                parser.error(f"{where}: expected 4 columns "
+                             f"(delay, priority, time_bound, task), got {len(row)}")
+            delay, priority, time_bound, task = row
+            try:
+                delay = float(delay)
+            except ValueError:
+                if reader.line_num == 1:
+                    continue  # a header row
+                parser.error(f"{where}: delay is not a number: {delay!r}")
+            try:
+                scheduler.add(task, priority.strip().lower(), start + delay,
+                              time_bound.strip().lower() == 'yes')
+            except ValueError as error:
+                parser.error(f"{where}: {error}")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    asyncio.run(scheduler.run(_print_batch, stop_when_empty=True))
+
+
+if __name__ == "__main__":
+    main()
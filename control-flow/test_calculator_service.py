@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for calculator_service, talking to a real server on a free
+local port.
+"""
+
+import asyncio
+import io
+import os
+import runpy
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+import calculator_service
+from calculator_service import INVALID_REQUEST, calculate, start
+
+MATCH_CASE_CALCULATOR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                     'match_case_calculator.py')
+
+
+class TestCalculate(unittest.TestCase):
+    """Test cases for calculate."""
+
+    def test_matches_match_case_calculator(self):
+        """Answers are the messages match_case_calculator.py prints."""
+        for num1, operation, num2 in [('3', '*', '4'), ('1.5', '+', '-2'), ('7', '/', '0'),
+                                      ('7', '/', '2'), ('5', '-', '9'), ('2', '%', '3')]:
+            with self.subTest(request=(num1, operation, num2)):
+                out = io.StringIO()
+                with mock.patch('builtins.input', side_effect=[num1, num2, operation]), \
+                        redirect_stdout(out):
+                    runpy.run_path(MATCH_CASE_CALCULATOR)
+                self.assertEqual(calculate(f"{num1} {operation} {num2}") + '\n', out.getvalue())
+
+    def test_invalid_requests(self):
+        """Requests that are not number, operator, number are rejected."""
+        for request in ('', '3 +', '3 + 4 5', 'three + 4'):
+            with self.subTest(request=request):
+                self.assertEqual(calculate(request), INVALID_REQUEST)
+
+
+class TestHandleConnection(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the service's connection handling."""
+
+    async def asyncSetUp(self):
+        """Start the service on a free port."""
+        self.server = await start(port=0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        """Stop the service."""
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def exchange(self, *chunks):
+        """Send chunks of bytes, close the sending side and read every answer."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        try:
+            for chunk in chunks:
+                writer.write(chunk)
+                await writer.drain()
+            writer.write_eof()
+            return (await asyncio.wait_for(reader.read(), 5)).decode().splitlines()
+        finally:
+            writer.close()
+
+    async def test_pipelined_requests(self):
+        """Every pipelined request is answered once, in order."""
+        requests = ['1 + 2', '6 / 0', '2 ^ 3', 'bad', '4 * 2.5']
+        self.assertEqual(await self.exchange(''.join(r + '\n' for r in requests).encode()),
+                         [calculate(request) for request in requests])
+
+    async def test_split_and_unterminated_lines(self):
+        """Lines split across reads, and a last line without a newline, are answered."""
+        self.assertEqual(await self.exchange(b'1 + ', b'1\n2 *', b' 3'),
+                         [calculate('1 + 1'), calculate('2 * 3')])
+
+    async def test_oversized_line_answered_once(self):
+        """A line over MAX_LINE is rejected once and the connection is closed."""
+        with mock.patch.object(calculator_service, 'MAX_LINE', 16), \
+                mock.patch.object(calculator_service, 'READ_SIZE', 8):
+            answers = await self.exchange(b'1 + 1\n' + b'9' * 40)
+        self.assertEqual(answers, [calculate('1 + 1'), INVALID_REQUEST])
+
+
+if __name__ == '__main__':
+    unittest.main()
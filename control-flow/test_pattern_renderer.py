@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for pattern_renderer, checked byte for byte against the output
+of pattern_drawing.py and multiplication_table.py.
+"""
+
+import io
+import os
+import runpy
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from pattern_renderer import (iter_pattern, main, multiplication_table, render_pattern,
+                              write_pattern, write_tables)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SIZES = (0, 1, 2, 7, 40)
+NUMBERS = (0, 1, 7, 12, -3, 123456789)
+
+
+def script_output(name, answer):
+    """Run one of the original scripts with a single typed answer."""
+    out = io.StringIO()
+    with mock.patch('builtins.input', return_value=str(answer)), redirect_stdout(out):
+        runpy.run_path(os.path.join(HERE, name))
+    return out.getvalue()
+
+
+def main_output(*argv):
+    """Run pattern_renderer's command line and return what it printed."""
+    out = io.StringIO()
+    with redirect_stdout(out):
+        main([str(arg) for arg in argv])
+    return out.getvalue()
+
+
+class TestPatterns(unittest.TestCase):
+    """Test cases comparing patterns with pattern_drawing.py."""
+
+    def test_render_pattern(self):
+        """render_pattern gives exactly what pattern_drawing.py prints."""
+        for size in SIZES:
+            with self.subTest(size=size):
+                self.assertEqual(render_pattern(size), script_output('pattern_drawing.py', size))
+
+    def test_chunked_pattern(self):
+        """Chunked output is the same whatever the chunk size."""
+        for size in SIZES:
+            expected = script_output('pattern_drawing.py', size)
+            for chunk_size in (1, 5, size + 1, 3 * size + 2, 1 << 20):
+                with self.subTest(size=size, chunk_size=chunk_size):
+                    self.assertEqual(''.join(iter_pattern(size, chunk_size=chunk_size)), expected)
+                    out = io.StringIO()
+                    write_pattern(size, out, chunk_size=chunk_size)
+                    self.assertEqual(out.getvalue(), expected)
+
+    def test_command_line(self):
+        """The pattern command prints what pattern_drawing.py prints."""
+        for size in SIZES:
+            with self.subTest(size=size):
+                self.assertEqual(main_output('pattern', size),
+                                 script_output('pattern_drawing.py', size))
+
+
+class TestTables(unittest.TestCase):
+    """Test cases comparing tables with multiplication_table.py."""
+
+    def test_multiplication_table(self):
+        """multiplication_table gives exactly what multiplication_table.py prints."""
+        for number in NUMBERS:
+            with self.subTest(number=number):
+                self.assertEqual(multiplication_table(number),
+                                 script_output('multiplication_table.py', number))
+
+    def test_write_tables(self):
+        """Many tables written in chunks are the scripts' outputs one after another."""
+        expected = ''.join(script_output('multiplication_table.py', number) for number in NUMBERS)
+        for chunk_size in (1, 50, 1 << 20):
+            with self.subTest(chunk_size=chunk_size):
+                out = io.StringIO()
+                write_tables(NUMBERS, out, chunk_size=chunk_size)
+                self.assertEqual(out.getvalue(), expected)
+
+    def test_command_line(self):
+        """The table command prints one or all tables like the script."""
+        self.assertEqual(main_output('table', 7), script_output('multiplication_table.py', 7))
+        self.assertEqual(main_output('table', 4, '--all'),
+                         ''.join(script_output('multiplication_table.py', number)
+                                 for number in range(1, 5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
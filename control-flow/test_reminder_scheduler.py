@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ReminderScheduler: firing order, cancellation, the
+asyncio loop in run() and reading reminders from a CSV file.
+"""
+
+import asyncio
+import io
+import os
+import runpy
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+from reminder_scheduler import PRIORITIES, ReminderScheduler, main
+
+DAILY_REMINDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'daily_reminder.py')
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestReminderScheduler(unittest.TestCase):
+    """Test cases for adding, popping and cancelling reminders."""
+
+    def setUp(self):
+        """Create a scheduler on a fake clock."""
+        self.clock = FakeClock(100.0)
+        self.scheduler = ReminderScheduler(self.clock)
+
+    def test_order(self):
+        """Reminders come out by due time, then priority, then insertion order."""
+        add = self.scheduler.add
+        add('late', 'high', 300)
+        add('low first', 'low', 200)
+        add('medium', 'medium', 200)
+        add('high', 'high', 200)
+        add('low second', 'low', 200)
+        add('now', 'low')
+        tasks = []
+        while (reminder := self.scheduler.pop()) is not None:
+            tasks.append(reminder.task)
+        self.assertEqual(tasks, ['now', 'high', 'medium', 'low first', 'low second', 'late'])
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_pop_due(self):
+        """pop_due returns only what is due, in firing order."""
+        for due in (150, 120, 180, 120):
+            self.scheduler.add(f'at {due}', 'medium', due)
+        self.assertEqual(self.scheduler.pop_due(), [])
+        self.clock.now = 150
+        self.assertEqual([reminder.task for reminder in self.scheduler.pop_due()],
+                         ['at 120', 'at 120', 'at 150'])
+        self.assertEqual(len(self.scheduler), 1)
+        self.assertEqual(self.scheduler.peek().task, 'at 180')
+
+    def test_cancel(self):
+        """Cancelled reminders are skipped and counted out straight away."""
+        first = self.scheduler.add('first', 'high', 110)
+        second = self.scheduler.add('second', 'high', 120)
+        self.scheduler.add('third', 'high', 130)
+        self.assertTrue(self.scheduler.cancel(first))
+        self.assertFalse(self.scheduler.cancel(first))
+        self.assertEqual(len(self.scheduler), 2)
+        self.assertIs(self.scheduler.peek(), second)
+        self.assertTrue(self.scheduler.cancel(second))
+        self.clock.now = 200
+        self.assertEqual([reminder.task for reminder in self.scheduler.pop_due()], ['third'])
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertIsNone(self.scheduler.pop())
+
+    def test_cancel_after_firing(self):
+        """A reminder that has already fired cannot be cancelled."""
+        reminder = self.scheduler.add('done', 'low', 100)
+        self.assertEqual(self.scheduler.pop_due(), [reminder])
+        self.assertFalse(self.scheduler.cancel(reminder))
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_unknown_priority(self):
+        """Priorities other than high, medium and low are rejected."""
+        with self.assertRaises(ValueError):
+            self.scheduler.add('task', 'urgent')
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_messages_match_daily_reminder(self):
+        """Every message reads exactly like daily_reminder.py's output."""
+        for priority in PRIORITIES:
+            for time_bound in (True, False):
+                with self.subTest(priority=priority, time_bound=time_bound):
+                    answers = ['Water the plants', priority, 'yes' if time_bound else 'no']
+                    out = io.StringIO()
+                    with mock.patch('builtins.input', side_effect=answers), redirect_stdout(out):
+                        runpy.run_path(DAILY_REMINDER)
+                    reminder = self.scheduler.add('Water the plants', priority,
+                                                  time_bound=time_bound)
+                    self.assertEqual(reminder.message + '\n', out.getvalue())
+
+
+class TestRun(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the asyncio loop in ReminderScheduler.run."""
+
+    async def test_fires_in_batches(self):
+        """Reminders due together are delivered together, in order."""
+        scheduler = ReminderScheduler(time.monotonic)
+        start = time.monotonic()
+        scheduler.add('b', 'low', start + 0.02)
+        scheduler.add('a', 'high', start + 0.02)
+        scheduler.add('c', 'medium', start + 0.05)
+        cancelled = scheduler.add('gone', 'high', start + 0.03)
+        scheduler.cancel(cancelled)
+        batches = []
+        await asyncio.wait_for(
+            scheduler.run(lambda due: batches.append([reminder.task for reminder in due]),
+                          stop_when_empty=True), 1)
+        self.assertEqual(batches, [['a', 'b'], ['c']])
+
+    async def test_earlier_reminder_wakes_loop(self):
+        """Adding a reminder due before the next one wakes the sleeping loop."""
+        scheduler = ReminderScheduler(time.monotonic)
+        scheduler.add('much later', 'low', time.monotonic() + 60)
+        delivered = asyncio.get_running_loop().create_future()
+        runner = asyncio.create_task(scheduler.run(
+            lambda due: delivered.done() or delivered.set_result([r.task for r in due])))
+        self.addCleanup(runner.cancel)
+        await asyncio.sleep(0.01)
+        scheduler.add('now', 'high')
+        self.assertEqual(await asyncio.wait_for(delivered, 1), ['now'])
+        self.assertEqual(len(scheduler), 1)
+
+    async def test_new_reminder_wakes_empty_loop(self):
+        """A loop waiting on an empty scheduler fires the first reminder added."""
+        scheduler = ReminderScheduler(time.monotonic)
+        delivered = asyncio.get_running_loop().create_future()
+        runner = asyncio.create_task(scheduler.run(delivered.set_result))
+        self.addCleanup(runner.cancel)
+        await asyncio.sleep(0.01)
+        reminder = scheduler.add('first', 'medium', time.monotonic() + 0.02)
+        self.assertEqual(await asyncio.wait_for(delivered, 1), [reminder])
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test cases for main reading reminders from a CSV file."""
+
+    def run_main(self, text):
+        """Run main on a CSV file holding text and return (exit status, stdout, stderr)."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'reminders.csv')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(text)
+            out, err = io.StringIO(), io.StringIO()
+            status = 0
+            with redirect_stdout(out), redirect_stderr(err):
+                try:
+                    main([path])
+                except SystemExit as error:
+                    status = error.code
+        return status, out.getvalue(), err.getvalue()
+
+    def test_fires_rows_and_skips_header(self):
+        """A header row is skipped and every other row is fired."""
+        status, out, _ = self.run_main("delay,priority,time_bound,task\n"
+                                       "0,low,no,Read\n\n0, High ,YES,Pay rent\n")
+        self.assertEqual(status, 0)
+        self.assertEqual(out.splitlines(), [
+            "Reminder:Reminder: 'Pay rent' is a high priority task"
+            " that requires immediate attention today!",
+            "Reminder:Note: 'Read' is a low priority task"
+            ".Consider completing it when you have free time.",
+        ])
+
+    def test_bad_rows_are_usage_errors(self):
+        """Unknown priorities, bad delays and wrong column counts name their line."""
+        cases = {
+            "0,low,no,Read\n0,urgent,no,Pay rent\n": "line 2: Unknown priority 'urgent'",
+            "0,low,no,Read\nsoon,high,no,Pay rent\n": "line 2: delay is not a number",
+            "0,low,no\n": "line 1: expected 4 columns",
+        }
+        for text, message in cases.items():
+            with self.subTest(text=text):
+                status, out, err = self.run_main(text)
+                self.assertEqual(status, 2)
+                self.assertEqual(out, "")
+                self.assertIn(message, err)
+
+
+if __name__ == '__main__':
+    unittest.main()
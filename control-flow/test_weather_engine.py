@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the weather rules engine, including reloading a rules file
+that has been changed or broken, and the command line.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+import weather_engine
+from weather_engine import WeatherAdvisor, load_rules, main
+
+RULES = {
+    "default": "No idea.",
+    "rules": {"sunny": "Sunglasses.", "Heavy  Rain": "Umbrella."},
+    "aliases": {"clear": "sunny", "downpour": "heavy rain"},
+}
+
+
+class RulesFileTestCase(unittest.TestCase):
+    """Base class writing rules files into a temporary directory."""
+
+    def setUp(self):
+        """Create a temporary directory holding RULES."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'rules.json')
+        self.version = 0
+        self.write(RULES)
+
+    def write(self, rules):
+        """Replace the rules file, making sure its signature changes."""
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write(rules if isinstance(rules, str) else json.dumps(rules))
+        self.version += 1
+        os.utime(self.path, ns=(self.version * 10**9, self.version * 10**9))
+
+
+class TestLoadRules(RulesFileTestCase):
+    """Test cases for load_rules."""
+
+    def test_lookup_table(self):
+        """Rules and aliases are keyed by normalized weather names."""
+        table, default = load_rules(self.path)
+        self.assertEqual(default, "No idea.")
+        self.assertEqual(table, {"sunny": "Sunglasses.", "heavy rain": "Umbrella.",
+                                 "clear": "Sunglasses.", "downpour": "Umbrella."})
+
+    def test_invalid_files(self):
+        """Files of the wrong shape are rejected with ValueError."""
+        broken = {
+            'not json': '{"rules": ',
+            'not an object': [],
+            'no default': {"rules": {}},
+            'rules not an object': {"default": "x", "rules": ["sunny"]},
+            'advice not a string': {"default": "x", "rules": {"sunny": 1}},
+            'aliases not an object': {**RULES, "aliases": ["clear"]},
+            'alias target not a string': {**RULES, "aliases": {"clear": ["sunny"]}},
+            'alias to unknown weather': {**RULES, "aliases": {"clear": "foggy"}},
+        }
+        for name, rules in broken.items():
+            with self.subTest(name):
+                self.write(rules)
+                with self.assertRaises(ValueError):
+                    load_rules(self.path)
+
+
+class TestWeatherAdvisor(RulesFileTestCase):
+    """Test cases for WeatherAdvisor lookups and reloading."""
+
+    def setUp(self):
+        """Create an advisor that checks the file before every lookup."""
+        super().setUp()
+        self.advisor = WeatherAdvisor(self.path, check_interval=0)
+
+    def test_advise_and_annotate(self):
+        """Lookups ignore case and spacing and fall back to the default."""
+        self.assertEqual(self.advisor.advise("  SUNNY "), "Sunglasses.")
+        self.assertEqual(self.advisor.annotate(["Downpour", "snow", "clear", "Downpour"]),
+                         ["Umbrella.", "No idea.", "Sunglasses.", "Umbrella."])
+        self.assertEqual(list(self.advisor.annotate_stream(["sunny", "snow", "clear"], 2)),
+                         [["Sunglasses.", "No idea."], ["Sunglasses."]])
+
+    def test_reloads_changed_file(self):
+        """A changed rules file is picked up on the next lookup."""
+        self.write({**RULES, "rules": {**RULES["rules"], "sunny": "Sun hat."}})
+        self.assertEqual(self.advisor.advise("clear"), "Sun hat.")
+        self.assertIsNone(self.advisor.last_error)
+
+    def test_broken_file_keeps_old_rules(self):
+        """A broken file is reported in last_error and the old rules stay in use."""
+        broken = ['{"rules": ', {**RULES, "aliases": ["clear"]},
+                  {**RULES, "aliases": {"clear": 5}}, {**RULES, "rules": {"sunny": None}}]
+        for rules in broken:
+            with self.subTest(rules=rules):
+                self.write(rules)
+                self.assertEqual(self.advisor.advise("clear"), "Sunglasses.")
+                self.assertIsInstance(self.advisor.last_error, ValueError)
+
+        self.write({**RULES, "default": "Still no idea."})
+        self.assertEqual(self.advisor.advise("snow"), "Still no idea.")
+        self.assertIsNone(self.advisor.last_error)
+
+    def test_missing_file_keeps_old_rules(self):
+        """A rules file that disappears leaves the old rules in use."""
+        os.remove(self.path)
+        self.assertEqual(self.advisor.advise("sunny"), "Sunglasses.")
+        self.assertIsInstance(self.advisor.last_error, OSError)
+
+
+class TestCommandLine(RulesFileTestCase):
+    """Test cases for main with a CSV input and --column."""
+
+    def run_main(self, text):
+        """Run main on a CSV file holding text and return (exit status, stdout, stderr)."""
+        source = os.path.join(os.path.dirname(self.path), 'weather.csv')
+        with open(source, 'w', encoding='utf-8') as file:
+            file.write(text)
+        out, err = io.StringIO(), io.StringIO()
+        status = 0
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                main([source, '--column', 'weather', '--rules', self.path])
+            except SystemExit as error:
+                status = error.code
+        return status, out.getvalue(), err.getvalue()
+
+    def test_adds_advice_column(self):
+        """Every row gets the advice for its condition."""
+        status, out, _ = self.run_main("day,weather\nmon,clear\ntue,snow\n")
+        self.assertEqual(status, 0)
+        self.assertEqual(out.splitlines(), ["day,weather,advice", "mon,clear,Sunglasses.",
+                                            "tue,snow,No idea."])
+
+    def test_bad_input_is_a_usage_error(self):
+        """Empty input, a missing column and short rows are reported without a traceback."""
+        cases = {
+            "": "the input is empty",
+            "day,temperature\nmon,20\n": "no column named 'weather'",
+            "day,weather\nmon,clear\ntue\n": "row 3 has no 'weather' column",
+        }
+        for text, message in cases.items():
+            with self.subTest(text=text):
+                status, _, err = self.run_main(text)
+                self.assertEqual(status, 2)
+                self.assertIn(message, err)
+
+    def test_short_row_in_later_chunk(self):
+        """A short row is reported with its number when the input spans chunks."""
+        text = "day,weather\n" + "mon,clear\n" * 5 + "tue\n"
+        with mock.patch.object(weather_engine, 'CHUNK_ROWS', 2):
+            status, _, err = self.run_main(text)
+        self.assertEqual(status, 2)
+        self.assertIn("row 7 has no 'weather' column", err)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,14 +1,9 @@
 # weather_advice.py
 
+from weather_engine import WeatherAdvisor
+
 # Prompt User for Weather Input
-weather = input("What's the weather like today? (sunny/rainy/cold): ").strip().lower()
+weather = input("What's the weather like today? (sunny/rainy/cold): ")
 
-# Provide Clothing Recommendations
-if weather == "sunny":
-    print("Wear a t-shirt and sunglasses.")
-elif weather == "rainy":
-    print("Don't forget your umbrella and a raincoat.")
-elif weather == "cold":
-    print("Make sure to wear a warm coat and a scarf.")
-else:
-    print("Sorry, I don't have recommendations for this weather.")
+# Provide Clothing Recommendations from the rules in weather_rules.json
+print(WeatherAdvisor(check_interval=None).advise(weather))
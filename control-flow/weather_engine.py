@@ -0,0 +1,225 @@
+# weather_engine.py
+
+# Importable version of weather_advice.py's if/elif chain. The advice for
+# each kind of weather lives in a rules file (weather_rules.json by
+# default) and is loaded into one dict keyed by normalized weather names,
+# so " Sunny " and "SUNNY" find the same rule. Columns or streams of
+# conditions are annotated in bulk, with a default for unknown weather,
+# and the rules file is reloaded when it changes, without a restart.
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+DEFAULT_RULES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'weather_rules.json')
+
+# Rows read at a time when annotating a stream
+CHUNK_ROWS = 100_000
+
+
+def normalize(condition):
+    """Lowercase a weather name and collapse its whitespace"""
+    return ' '.join(condition.split()).casefold()
+
+
+def load_rules(path):
+    """
+    Read a rules file into a lookup table
+
+    The file is a JSON object with "rules" (weather -> advice), an optional
+    "aliases" (weather -> the weather whose rule it shares) and "default"
+    (advice for anything else).
+
+    Parameters:
+    path (str): The rules file
+
+    Returns:
+    tuple: (table, default) where table maps normalized weather names to advice
+
+    Raises:
+    ValueError: If the file is not a valid rules file
+    """
+    with open(path, encoding='utf-8') as file:
+        data = json.load(file)
+    if not isinstance(data, dict) or not isinstance(data.get('rules'), dict) \
+            or not isinstance(data.get('default'), str):
+        raise ValueError(f"{path}: expected an object with 'rules' and 'default'.")
+    aliases = data.get('aliases', {})
+    if not isinstance(aliases, dict):
+        raise ValueError(f"{path}: 'aliases' must be an object.")
+    # JSON object keys are always strings; only the values need checking.
+    for section, entries in (('rules', data['rules']), ('aliases', aliases)):
+        for name, value in entries.items():
+            if not isinstance(value, str):
+                raise ValueError(f"{path}: {section} entry {name!r} must be a string, "
+                                 f"not {type(value).__name__}.")
+    table = {normalize(weather): advice for weather, advice in data['rules'].items()}
+    for alias, weather in aliases.items():
+        if normalize(weather) not in table:
+            raise ValueError(f"{path}: alias {alias!r} refers to unknown weather {weather!r}.")
+        table[normalize(alias)] = table[normalize(weather)]
+    return table, data['default']
+
+
+class WeatherAdvisor:
+    """
+    Weather advice from a rules file, reloaded when the file changes
+
+    The file's modification time is checked at most once every
+    check_interval seconds, before a lookup. If a changed file cannot be
+    loaded, the previous rules stay in use and the error is kept in
+    last_error.
+    """
+
+    def __init__(self, path=DEFAULT_RULES, check_interval=1.0):
+        """
+        Parameters:
+        path (str): The rules file
+        check_interval (float): Seconds between checks for a changed file;
+            None never checks (call reload() instead)
+        """
+        self.path = path
+        self.check_interval = check_interval
+        self.last_error = None
+        self._next_check = 0.0
+        self._signature = None
+        self.reload()
+
+    def _file_signature(self):
+        status = os.stat(self.path)
+        return status.st_mtime_ns, status.st_size
+
+    def reload(self):
+        """
+        Load the rules file again
+
+        Raises:
+        ValueError: If the file is not a valid rules file
+        """
+        signature = self._file_signature()
+        # Swapped in one assignment, so a lookup never sees a mix of the
+        # old and new rules.
+        self._rules = load_rules(self.path)
+        self._signature = signature
+        self.last_error = None
+
+    def _check_for_changes(self):
+        if self.check_interval is None:
+            return
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.check_interval
+        try:
+            if self._file_signature() != self._signature:
+                self.reload()
+        except (OSError, ValueError) as error:
+            self.last_error = error
+
+    def advise(self, condition):
+        """
+        Get the advice for one kind of weather
+
+        Parameters:
+        condition (str): The weather, e.g. "sunny"
+
+        Returns:
+        str: The advice, or the default advice for unknown weather
+        """
+        self._check_for_changes()
+        table, default = self._rules
+        return table.get(normalize(condition), default)
+
+    def annotate(self, conditions):
+        """
+        Get the advice for a whole column of weather conditions
+
+        Each distinct condition is normalized and looked up once.
+
+        Parameters:
+        conditions (iterable of str): The weather for each row
+
+        Returns:
+        list: The advice for each row
+        """
+        self._check_for_changes()
+        table, default = self._rules
+        conditions = conditions if isinstance(conditions, list) else list(conditions)
+        advice = {condition: table.get(normalize(condition), default)
+                  for condition in dict.fromkeys(conditions)}
+        return list(map(advice.__getitem__, conditions))
+
+    def annotate_stream(self, conditions, chunk_rows=CHUNK_ROWS):
+        """
+        Annotate a stream of conditions a chunk at a time
+
+        Rules reloaded while the stream is running apply from the next chunk.
+
+        Parameters:
+        conditions (iterable of str): The weather for each row
+        chunk_rows (int): Rows per chunk
+
+        Yields:
+        list: The advice for each chunk of rows
+        """
+        conditions = iter(conditions)
+        while True:
+            chunk = list(islice(conditions, chunk_rows))
+            if not chunk:
+                return
+            yield self.annotate(chunk)
+
+
+def main(argv=None):
+    """Add advice to a file of weather conditions"""
+    parser = argparse.ArgumentParser(description="Annotate weather conditions with advice.")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="file with one condition per line, or a CSV file with --column "
+                             "(default: stdin)")
+    parser.add_argument('--column', help="CSV column holding the conditions; the advice is "
+                                         "added as a new 'advice' column")
+    parser.add_argument('--rules', default=DEFAULT_RULES, help="rules file")
+    args = parser.parse_args(argv)
+
+    advisor = WeatherAdvisor(args.rules)
+    source = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    try:
+        if args.column is None:
+            lines = (line.rstrip('\r\n') for line in source)
+            for advice in advisor.annotate_stream(lines):
+                sys.stdout.write('\n'.join(advice) + '\n')
+            return
+        reader = csv.reader(source)
+        writer = csv.writer(sys.stdout)
+        header = next(reader, None)
+        if header is None:
+            parser.error("the input is empty; expected a header row")
+        if args.column not in header:
+            parser.error(f"no column named {args.column!r}")
+        index = header.index(args.column)
+        writer.writerow(header + ['advice'])
+        row_number = 1  # the header
+        while True:
+            rows = list(islice(reader, CHUNK_ROWS))
+            if not rows:
+                break
+            try:
+                conditions = [row[index] for row in rows]
+            except IndexError:
+                short = next(number for number, row in enumerate(rows, row_number + 1)
+                             if len(row) <= index)
+                parser.error(f"row {short} has no {args.column!r} column")
+            advice = advisor.annotate(conditions)
+            writer.writerows(row + [text] for row, text in zip(rows, advice))
+            row_number += len(rows)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+if __name__ == "__main__":
+    main()
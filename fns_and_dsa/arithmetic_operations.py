@@ -1,3 +1,26 @@
+import operator
+from array import array
+from itertools import compress, repeat, starmap
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the batch API falls back to the stdlib
+    np = None
+
+# Operation codes accepted by perform_operations, in code order. The names
+# double as the matching NumPy ufunc names.
+OPERATIONS = ('add', 'subtract', 'multiply', 'divide')
+ADD, SUBTRACT, MULTIPLY, DIVIDE = range(len(OPERATIONS))
+
+NAN = float('nan')
+
+_FUNCTIONS = (operator.add, operator.sub, operator.mul, operator.truediv)
+
+# Maps operation names and codes alike to codes.
+_CODES = {name: code for code, name in enumerate(OPERATIONS)}
+_CODES.update({code: code for code in range(len(OPERATIONS))})
+
+
 def perform_operation(num1, num2, operation):
     """
     Performs basic arithmetic operations on two numbers.
@@ -22,4 +45,136 @@ def perform_operation(num1, num2, operation):
             return "Error: Cannot divide by zero"
         return num1 / num2
     else:
-        return "Error: Invalid operation"
\ No newline at end of file
+        return "Error: Invalid operation"
+
+
+def _without_zero_divisors(numbers2, errors):
+    """Return numbers2 with the flagged divisors replaced by NaN, so that
+    dividing by them yields NaN instead of raising."""
+    if not any(errors):
+        return numbers2
+    numbers2 = list(numbers2)
+    for row in compress(range(len(errors)), errors):
+        numbers2[row] = NAN
+    return numbers2
+
+
+def _reject_bools(operations):
+    """Raise ValueError for True/False operations, which would otherwise be
+    taken as the codes 1 and 0."""
+    if isinstance(operations, bool):
+        raise ValueError(f"Invalid operation: {operations!r}")
+    if np is not None and isinstance(operations, np.ndarray):
+        is_bool = operations.dtype.kind == 'b'
+    else:
+        # array('b') and friends cannot hold bools, so only lists and the
+        # like need the extra pass.
+        is_bool = (not isinstance(operations, (str, int, array))
+                   and bool in set(map(type, operations)))
+    if is_bool:
+        raise ValueError("Invalid operation column: expected names or codes, not bools.")
+
+
+def perform_operations(numbers1, numbers2, operations):
+    """
+    Performs arithmetic operations on whole columns of numbers at once.
+    
+    Each row is evaluated like perform_operation, but the work is done on
+    whole columns: with NumPy when it is installed, otherwise with bulk
+    map/array operations from the standard library.
+    
+    Parameters:
+    numbers1 (sequence of float): First operand of each row
+    numbers2 (sequence of float): Second operand of each row
+    operations (string, int or sequence): One operation for every row, given
+        as a name ('add', ...) or code (ADD, ...), or one name or code per row
+    
+    Returns:
+    tuple: (results, errors) where results holds floats and errors marks
+        rows that divided by zero with True; those rows hold NaN in results.
+        With NumPy both are ndarrays, otherwise an array('d') and a list
+    
+    Raises:
+    ValueError: If the columns differ in length or an operation is unknown
+    """
+    if len(numbers1) != len(numbers2):
+        raise ValueError("Operand columns must have the same length.")
+    _reject_bools(operations)
+    if np is not None:
+        return _perform_operations_numpy(numbers1, numbers2, operations)
+
+    if isinstance(operations, (str, int)):
+        code = _CODES.get(operations)
+        if code is None:
+            raise ValueError(f"Invalid operation: {operations!r}")
+        if code == DIVIDE:
+            errors = list(map(operator.not_, numbers2))
+            numbers2 = _without_zero_divisors(numbers2, errors)
+        else:
+            errors = [False] * len(numbers1)
+        return array('d', map(_FUNCTIONS[code], numbers1, numbers2)), errors
+
+    if len(operations) != len(numbers1):
+        raise ValueError("Operation column must have the same length as the operands.")
+    try:
+        codes = list(map(_CODES.__getitem__, operations))
+    except KeyError as error:
+        raise ValueError(f"Invalid operation: {error.args[0]!r}") from None
+    errors = list(map(operator.and_, map(operator.eq, codes, repeat(DIVIDE)),
+                      map(operator.not_, numbers2)))
+    numbers2 = _without_zero_divisors(numbers2, errors)
+    results = array('d', starmap(lambda code, num1, num2: _FUNCTIONS[code](num1, num2),
+                                 zip(codes, numbers1, numbers2)))
+    return results, errors
+
+
+def _operation_codes_numpy(operations, rows):
+    """Convert a per-row operation column into an ndarray of codes."""
+    if len(operations) != rows:
+        raise ValueError("Operation column must have the same length as the operands.")
+    if isinstance(operations, np.ndarray) and operations.dtype.kind in 'iu':
+        codes = operations
+    elif isinstance(operations, np.ndarray):
+        # Look up each distinct name once rather than once per row.
+        names, inverse = np.unique(operations, return_inverse=True)
+        try:
+            codes = np.array([_CODES[name] for name in names.tolist()], dtype=np.intp)[inverse]
+        except KeyError as error:
+            raise ValueError(f"Invalid operation: {error.args[0]!r}") from None
+    else:
+        try:
+            codes = np.fromiter(map(_CODES.__getitem__, operations), dtype=np.intp, count=rows)
+        except KeyError as error:
+            raise ValueError(f"Invalid operation: {error.args[0]!r}") from None
+    invalid = (codes < 0) | (codes >= len(OPERATIONS))
+    if invalid.any():
+        raise ValueError(f"Invalid operation code: {int(codes[invalid][0])!r}")
+    return codes.reshape(rows)
+
+
+def _perform_operations_numpy(numbers1, numbers2, operations):
+    """NumPy implementation of perform_operations."""
+    numbers1 = np.asarray(numbers1, dtype=np.float64)
+    numbers2 = np.asarray(numbers2, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if isinstance(operations, (str, int)):
+            code = _CODES.get(operations)
+            if code is None:
+                raise ValueError(f"Invalid operation: {operations!r}")
+            results = getattr(np, OPERATIONS[code])(numbers1, numbers2)
+            if code == DIVIDE:
+                errors = numbers2 == 0
+                results[errors] = np.nan
+            else:
+                errors = np.zeros(len(numbers1), dtype=bool)
+            return results, errors
+
+        codes = _operation_codes_numpy(operations, len(numbers1))
+        # Evaluating every operation on every row and picking per row is
+        # cheaper than gathering and scattering each operation's rows.
+        results = np.choose(codes, [getattr(np, name)(numbers1, numbers2)
+                                    for name in OPERATIONS])
+        errors = (codes == DIVIDE) & (numbers2 == 0)
+        results[errors] = np.nan
+        return results, errors
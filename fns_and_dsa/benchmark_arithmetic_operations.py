@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing perform_operation called once per row with the
+column-at-a-time perform_operations.
+"""
+
+import argparse
+import random
+import time
+from array import array
+from arithmetic_operations import OPERATIONS, np, perform_operation, perform_operations
+
+
+def make_rows(count, seed=0):
+    """Build random operand and operation columns.
+
+    Parameters:
+    count (int): Number of rows
+    seed (int): Random seed
+
+    Returns:
+    tuple: (numbers1, numbers2, operations, codes) where the first three are
+        lists, codes is an array of operation codes matching operations, and
+        about 1% of the second operands are zero
+    """
+    rng = random.Random(seed)
+    numbers1 = [rng.uniform(-1000, 1000) for _ in range(count)]
+    numbers2 = [0.0 if rng.random() < 0.01 else rng.uniform(-1000, 1000) for _ in range(count)]
+    codes = array('b', [rng.randrange(len(OPERATIONS)) for _ in range(count)])
+    operations = [OPERATIONS[code] for code in codes]
+    return numbers1, numbers2, operations, codes
+
+
+def _rate(count, function):
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print rows per second for each path."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000,
+                        help="number of rows (default: 1,000,000)")
+    args = parser.parse_args()
+    numbers1, numbers2, operations, codes = make_rows(args.rows)
+    if np is not None:
+        # Feed the batch path the columns it would get from a NumPy pipeline.
+        columns1, columns2, codes = np.array(numbers1), np.array(numbers2), np.array(codes)
+    else:
+        columns1, columns2 = numbers1, numbers2
+
+    cases = {
+        "scalar, one operation": lambda: [perform_operation(a, b, 'divide')
+                                          for a, b in zip(numbers1, numbers2)],
+        "batch, one operation": lambda: perform_operations(columns1, columns2, 'divide'),
+        "scalar, per-row operation": lambda: list(map(perform_operation, numbers1,
+                                                      numbers2, operations)),
+        "batch, per-row operation": lambda: perform_operations(numbers1, numbers2, operations),
+        "batch, per-row code": lambda: perform_operations(columns1, columns2, codes),
+    }
+    print(f"Rows per second ({args.rows:,} rows, "
+          f"{'NumPy' if np is not None else 'no NumPy'}):")
+    for name, function in cases.items():
+        print(f"  {name:<26} {_rate(args.rows, function):14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
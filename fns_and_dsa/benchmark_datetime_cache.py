@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing raw strftime/strptime with the cached DateFormatter,
+on log-like timestamps where many records share the same second.
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from datetime_cache import DATETIME_FORMAT, DateFormatter
+
+
+def make_timestamps(count, seconds, seed=0):
+    """Build timestamps spread over a window of distinct seconds.
+
+    Parameters:
+    count (int): Number of timestamps
+    seconds (int): Number of distinct seconds they fall in
+    seed (int): Random seed
+
+    Returns:
+    tuple: (values, texts) as lists of datetimes and formatted strings
+    """
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    values = sorted(start + timedelta(seconds=rng.randrange(seconds)) for _ in range(count))
+    return values, [value.strftime(DATETIME_FORMAT) for value in values]
+
+
+def _rate(count, function):
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print calls per second for each path."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=1_000_000,
+                        help="number of calls (default: 1,000,000)")
+    parser.add_argument("--seconds", type=int, default=10_000,
+                        help="distinct seconds in the data (default: 10,000)")
+    args = parser.parse_args()
+    values, texts = make_timestamps(args.calls, args.seconds)
+    formatter = DateFormatter()
+    uncached = DateFormatter(maxsize=0)
+
+    cases = {
+        "strftime": lambda: [value.strftime(DATETIME_FORMAT) for value in values],
+        "format, ISO fast path only": lambda: list(map(uncached.format, values)),
+        "format, cached": lambda: list(map(formatter.format, values)),
+        "strptime": lambda: [datetime.strptime(text, DATETIME_FORMAT) for text in texts],
+        "parse, ISO fast path only": lambda: list(map(uncached.parse, texts)),
+        "parse, cached": lambda: list(map(formatter.parse, texts)),
+        "now().strftime": lambda: [datetime.now().strftime(DATETIME_FORMAT)
+                                   for _ in range(args.calls)],
+        "now, cached per second": lambda: [formatter.now() for _ in range(args.calls)],
+    }
+    print(f"Calls per second ({args.calls:,} calls over {args.seconds:,} distinct seconds):")
+    for name, function in cases.items():
+        print(f"  {name:<27} {_rate(args.calls, function):14,.0f}")
+    print("Hit rates:")
+    for name, stats in formatter.stats().items():
+        print(f"  {name:<27} {stats['hit_rate']:14.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing calculate_future_date-style arithmetic, one date at a
+time, with the batch add_days/format_dates and business-day functions.
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from explore_datetime import BusinessCalendar, add_days, format_dates, np
+
+
+def make_dates(count, seed=0):
+    """Build random dates and day offsets.
+
+    Parameters:
+    count (int): Number of records
+    seed (int): Random seed
+
+    Returns:
+    tuple: (dates, offsets) as lists of dates and ints
+    """
+    rng = random.Random(seed)
+    start = date(2000, 1, 1).toordinal()
+    dates = [date.fromordinal(start + rng.randrange(10_000)) for _ in range(count)]
+    offsets = [rng.randrange(1, 365) for _ in range(count)]
+    return dates, offsets
+
+
+def _scalar(dates, offsets):
+    # calculate_future_date without the print
+    return [(day + timedelta(days=offset)).strftime("%Y-%m-%d")
+            for day, offset in zip(dates, offsets)]
+
+
+def _rate(count, function):
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print dates per second for each path."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dates", type=int, default=1_000_000,
+                        help="number of dates (default: 1,000,000)")
+    args = parser.parse_args()
+    dates, offsets = make_dates(args.dates)
+    holidays = [date(year, month, day) for year in range(2000, 2030)
+                for month, day in ((1, 1), (7, 4), (12, 25), (12, 26))]
+    calendar = BusinessCalendar(holidays)
+    if np is not None:
+        # Feed the batch path the columns it would get from a NumPy pipeline.
+        columns, offset_column = np.array(dates, dtype='datetime64[D]'), np.array(offsets)
+    else:
+        columns, offset_column = dates, offsets
+
+    cases = {
+        "scalar timedelta + strftime": lambda: _scalar(dates, offsets),
+        "batch add + format": lambda: format_dates(add_days(columns, offset_column)),
+        "batch add, from date objects": lambda: add_days(dates, offsets),
+        "batch business days": lambda: calendar.add_business_days(columns, offset_column),
+    }
+    print(f"Dates per second ({args.dates:,} dates, "
+          f"{'NumPy' if np is not None else 'no NumPy'}):")
+    for name, function in cases.items():
+        print(f"  {name:<29} {_rate(args.dates, function):14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing the command-stream mode of shopping_list_manager with
+driving the interactive menu through redirected stdin/stdout.
+"""
+
+import argparse
+import io
+import random
+import sys
+import time
+from shopping_list_manager import run_commands, run_menu
+from shopping_list_store import ShoppingList
+
+
+def make_commands(count, distinct_items=1000, seed=0):
+    """
+    Build a random mix of add and remove commands
+
+    Parameters:
+    count (int): Number of commands
+    distinct_items (int): Number of different item names used
+    seed (int): Random seed
+
+    Returns:
+    list: (command, item) tuples
+    """
+    rng = random.Random(seed)
+    return [("add" if rng.random() < 0.6 else "remove", f"item {rng.randrange(distinct_items)}")
+            for _ in range(count)]
+
+
+def time_command_stream(commands):
+    """Seconds taken to apply the commands with run_commands"""
+    lines = [f"{command} {item}\n" for command, item in commands]
+    start = time.perf_counter()
+    run_commands(ShoppingList(), lines, io.StringIO())
+    return time.perf_counter() - start
+
+
+def time_menu(commands):
+    """Seconds taken to apply the commands by answering the menu's prompts"""
+    answers = "".join(f"{'1' if command == 'add' else '2'}\n{item}\n"
+                      for command, item in commands) + "4\n"
+    stdin, stdout = sys.stdin, sys.stdout
+    sys.stdin, sys.stdout = io.StringIO(answers), io.StringIO()
+    try:
+        start = time.perf_counter()
+        run_menu(ShoppingList())
+        return time.perf_counter() - start
+    finally:
+        sys.stdin, sys.stdout = stdin, stdout
+
+
+def main():
+    """Run the benchmark and print commands per minute for each mode"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--commands", type=int, default=1_000_000,
+                        help="number of commands (default: 1,000,000)")
+    args = parser.parse_args()
+    commands = make_commands(args.commands)
+
+    print(f"Commands per minute ({args.commands:,} commands):")
+    for name, timer in (("command stream", time_command_stream), ("interactive menu", time_menu)):
+        print(f"  {name:<17} {args.commands / timer(commands) * 60:16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing convert_to_celsius with the conversion registry, for
+single values and for whole arrays.
+"""
+
+import argparse
+import random
+import time
+from temp_conversion_tool import TEMPERATURE_UNITS, convert_to_celsius, np
+
+
+def _rate(count, function):
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print values per second for each path."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--values", type=int, default=1_000_000,
+                        help="number of values (default: 1,000,000)")
+    args = parser.parse_args()
+    rng = random.Random(0)
+    values = [rng.uniform(-40, 120) for _ in range(args.values)]
+    column = np.array(values) if np is not None else values
+    to_celsius = TEMPERATURE_UNITS.converter('F', 'C')
+
+    cases = {
+        "scalar, convert_to_celsius": lambda: [convert_to_celsius(value) for value in values],
+        "scalar, registry.convert": lambda: [TEMPERATURE_UNITS.convert(value, 'F', 'C')
+                                             for value in values],
+        "scalar, registry.converter": lambda: [to_celsius(value) for value in values],
+        "array, registry.convert_many": lambda: TEMPERATURE_UNITS.convert_many(column, 'F', 'C'),
+        "array, Rankine to Kelvin": lambda: TEMPERATURE_UNITS.convert_many(column, 'R', 'K'),
+    }
+    print(f"Values per second ({args.values:,} values, "
+          f"{'NumPy' if np is not None else 'no NumPy'}):")
+    for name, function in cases.items():
+        print(f"  {name:<30} {_rate(args.values, function):14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
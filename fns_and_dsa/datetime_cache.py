@@ -0,0 +1,155 @@
+import re
+import time
+from datetime import date, datetime
+from functools import lru_cache
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+DATE_FORMAT = "%Y-%m-%d"
+
+# Fixed formats that datetime's own ISO methods produce and parse exactly,
+# mapped to the only text layout handed to fromisoformat. fromisoformat
+# also takes week dates, ordinal dates and non-ASCII digits, which strptime
+# rejects, so anything else goes through strptime.
+_ISO_FORMATS = {
+    DATETIME_FORMAT: re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}'),
+    "%Y-%m-%dT%H:%M:%S": re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}'),
+    DATE_FORMAT: re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}'),
+}
+
+
+class DateFormatter:
+    """
+    Formats and parses timestamps in one fixed format, with caching
+
+    Timestamps in logs repeat a lot: many records share the same second.
+    Formatted strings and parsed values are kept in bounded LRU caches,
+    and the current time is formatted at most once per second. ISO formats
+    skip strftime/strptime entirely and use datetime's much faster
+    isoformat/fromisoformat. Hit rates are available from stats().
+    """
+
+    def __init__(self, fmt=DATETIME_FORMAT, maxsize=4096, clock=time.time):
+        """
+        Parameters:
+        fmt (str): strftime/strptime format used for every call
+        maxsize (int): Number of entries kept in each LRU cache
+        clock (callable): Returns the current time as a Unix timestamp
+        """
+        self.fmt = fmt
+        self._clock = clock
+        self._iso_layout = _ISO_FORMATS.get(fmt)
+        if self._iso_layout is None:
+            format_one, parse_one = self._strftime, self._strptime
+        elif fmt == DATE_FORMAT:
+            format_one, parse_one = self._format_iso_date, self._parse_iso
+        else:
+            self._separator = fmt[8]
+            format_one, parse_one = self._format_iso, self._parse_iso
+        # Without sub-second fields, values within the same second format
+        # alike, so they share one cache entry.
+        self._whole_seconds = '%f' not in fmt
+        self._format = lru_cache(maxsize)(format_one)
+        self._parse = lru_cache(maxsize)(parse_one)
+        self._now_second = None
+        self._now_text = None
+        self._now_hits = 0
+        self._now_misses = 0
+
+    def _strftime(self, value):
+        return value.strftime(self.fmt)
+
+    def _strptime(self, text):
+        return datetime.strptime(text, self.fmt)
+
+    def _format_iso(self, value):
+        # strftime does not zero-pad years before 1000; isoformat does.
+        # Plain dates have no time to give isoformat.
+        if value.year < 1000 or not isinstance(value, datetime):
+            return value.strftime(self.fmt)
+        return value.isoformat(self._separator, 'seconds')[:19]
+
+    def _format_iso_date(self, value):
+        if value.year < 1000:
+            return value.strftime(self.fmt)
+        return date.isoformat(value)
+
+    def _parse_iso(self, text):
+        if self._iso_layout.fullmatch(text) is None:
+            return self._strptime(text)
+        return datetime.fromisoformat(text)
+
+    def format(self, value):
+        """
+        Format a date or datetime
+
+        Parameters:
+        value (datetime): The value to format
+
+        Returns:
+        str: The same text as value.strftime(fmt)
+        """
+        if getattr(value, 'tzinfo', None) is not None:
+            # Aware datetimes in different zones can be equal yet format
+            # differently, so they cannot share cache entries.
+            return self._format.__wrapped__(value)
+        if self._whole_seconds and getattr(value, 'microsecond', 0):
+            value = value.replace(microsecond=0)
+        return self._format(value)
+
+    def parse(self, text):
+        """
+        Parse text written in this formatter's format
+
+        Parameters:
+        text (str): The text to parse
+
+        Returns:
+        datetime: The same value as datetime.strptime(text, fmt)
+
+        Raises:
+        ValueError: If the text does not match the format
+        """
+        return self._parse(text)
+
+    def now(self):
+        """
+        Format the current local time
+
+        The string is rebuilt only when the clock has moved on to a new
+        second, so this is only exact for formats without sub-second fields.
+
+        Returns:
+        str: The current time in this formatter's format
+        """
+        second = int(self._clock())
+        if second == self._now_second:
+            self._now_hits += 1
+            return self._now_text
+        self._now_misses += 1
+        self._now_text = datetime.fromtimestamp(second).strftime(self.fmt)
+        self._now_second = second
+        return self._now_text
+
+    def stats(self):
+        """
+        Report cache hits and misses
+
+        Returns:
+        dict: For each of 'format', 'parse' and 'now', a dict with the
+            number of hits and misses and the hit rate (0.0 if unused)
+        """
+        counts = {
+            'format': self._format.cache_info()[:2],
+            'parse': self._parse.cache_info()[:2],
+            'now': (self._now_hits, self._now_misses),
+        }
+        return {name: {'hits': hits, 'misses': misses,
+                       'hit_rate': hits / (hits + misses) if hits + misses else 0.0}
+                for name, (hits, misses) in counts.items()}
+
+    def clear(self):
+        """Empty the caches and reset the statistics"""
+        self._format.cache_clear()
+        self._parse.cache_clear()
+        self._now_second = self._now_text = None
+        self._now_hits = self._now_misses = 0
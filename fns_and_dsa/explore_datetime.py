@@ -1,19 +1,222 @@
-from datetime import datetime, timedelta
+import calendar
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+from itertools import repeat
+from numbers import Integral
+from operator import add
+
+from datetime_cache import DATE_FORMAT, DateFormatter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the batch API falls back to the stdlib
+    np = None
+
+# Business days as in numpy.busdaycalendar: Monday to Friday
+DEFAULT_WEEKMASK = '1111100'
+
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+_datetime_formatter = DateFormatter()
+_date_formatter = DateFormatter(DATE_FORMAT)
 
 def display_current_datetime():
     """Display the current date and time in a readable format"""
     current_date = datetime.now()
-    formatted_date = current_date.strftime("%Y-%m-%d %H:%M:%S")
+    formatted_date = _datetime_formatter.format(current_date)
     print(f"Current date and time: {formatted_date}")
     return current_date
 
 def calculate_future_date(current_date, days_to_add):
     """Calculate and display a future date by adding specified days"""
     future_date = current_date + timedelta(days=days_to_add)
-    formatted_future_date = future_date.strftime("%Y-%m-%d")
+    formatted_future_date = _date_formatter.format(future_date)
     print(f"Future date: {formatted_future_date}")
     return future_date
 
+def _to_days(dates):
+    """Convert dates to a datetime64[D] array (NumPy) or a list of ordinals"""
+    if np is not None:
+        if not isinstance(dates, np.ndarray) and len(dates) and isinstance(dates[0], date):
+            # Much faster than letting NumPy convert date objects one by one
+            ordinals = np.fromiter(map(date.toordinal, dates), np.int64, len(dates))
+            return (ordinals - _UNIX_EPOCH_ORDINAL).astype('datetime64[D]')
+        return np.asarray(dates).astype('datetime64[D]')
+    return [_date_formatter.parse(value[:10]).toordinal() if isinstance(value, str)
+            else value.toordinal() for value in dates]
+
+def _per_date(value):
+    """Repeat a single offset for every date, or pass a column through"""
+    return repeat(value) if isinstance(value, Integral) else value
+
+def add_days(dates, days):
+    """
+    Add day offsets to many dates at once
+
+    Parameters:
+    dates (sequence): date or datetime objects, ISO date strings, or a
+        datetime64 array; any time of day is dropped
+    days (int or sequence of int): One offset for every date, or one per date
+
+    Returns:
+    ndarray or list: datetime64[D] array with NumPy, otherwise a list of dates
+    """
+    if np is not None:
+        return _to_days(dates) + np.asarray(days, dtype='timedelta64[D]')
+    return list(map(date.fromordinal, map(add, _to_days(dates), _per_date(days))))
+
+def add_months(dates, months):
+    """
+    Add calendar months to many dates at once
+
+    Days past the end of the target month are moved back to its last day,
+    so adding one month to January 31 gives the last day of February.
+
+    Parameters:
+    dates (sequence): As for add_days
+    months (int or sequence of int): One offset for every date, or one per date
+
+    Returns:
+    ndarray or list: datetime64[D] array with NumPy, otherwise a list of dates
+    """
+    if np is not None:
+        days = _to_days(dates)
+        start = days.astype('datetime64[M]')
+        target = start + np.asarray(months, dtype='timedelta64[M]')
+        target_days = target.astype('datetime64[D]')
+        month_length = (target + 1).astype('datetime64[D]') - target_days
+        return target_days + np.minimum(days - start.astype('datetime64[D]'), month_length - 1)
+    results = []
+    for ordinal, offset in zip(_to_days(dates), _per_date(months)):
+        day = date.fromordinal(ordinal)
+        year, month = divmod(day.year * 12 + day.month - 1 + offset, 12)
+        month += 1
+        results.append(date(year, month, min(day.day, calendar.monthrange(year, month)[1])))
+    return results
+
+def format_dates(dates):
+    """
+    Format many dates as YYYY-MM-DD strings in one call
+
+    Parameters:
+    dates (sequence): As returned by add_days, or any input accepted by it
+
+    Returns:
+    list: One string per date
+    """
+    if np is not None:
+        return np.datetime_as_string(_to_days(dates), unit='D').tolist()
+    return [date.fromordinal(ordinal).isoformat() for ordinal in _to_days(dates)]
+
+class BusinessCalendar:
+    """
+    Working days and holidays, for business-day arithmetic on many dates
+
+    Holidays are indexed once, when the calendar is created. With NumPy the
+    index is a numpy.busdaycalendar; otherwise it is a sorted list of the
+    holidays that fall on working days, and every date is mapped to its
+    rank among business days with a little arithmetic and one binary search.
+    """
+
+    def __init__(self, holidays=(), weekmask=DEFAULT_WEEKMASK):
+        """
+        Parameters:
+        holidays (iterable): Dates that are not business days
+        weekmask (str): Seven '1'/'0' characters, Monday first, marking
+            the working days of the week
+        """
+        if len(weekmask) != 7 or set(weekmask) - {'0', '1'} or '1' not in weekmask:
+            raise ValueError("weekmask must be seven '0'/'1' characters with at least one '1'.")
+        self.weekmask = weekmask
+        if np is not None:
+            self._calendar = np.busdaycalendar(weekmask=weekmask,
+                                               holidays=_to_days(list(holidays)))
+            return
+        working = [flag == '1' for flag in weekmask]
+        # _before[weekday] counts the working days earlier in the same week.
+        self._before = [sum(working[:weekday]) for weekday in range(8)]
+        self._per_week = self._before[7]
+        # Ordinal 1 (January 1 of year 1) is a Monday.
+        self._rank_to_weekday = [weekday for weekday in range(7) if working[weekday]]
+        self._holidays = sorted({ordinal for ordinal in _to_days(list(holidays))
+                                 if working[(ordinal - 1) % 7]})
+        self._holiday_set = set(self._holidays)
+
+    def _rank(self, ordinal):
+        """Number of business days before a date"""
+        weeks, weekday = divmod(ordinal - 1, 7)
+        return (weeks * self._per_week + self._before[weekday]
+                - bisect_left(self._holidays, ordinal))
+
+    def _weekday_ordinal(self, rank):
+        """The working weekday with the given rank, ignoring holidays"""
+        weeks, index = divmod(rank, self._per_week)
+        return weeks * 7 + self._rank_to_weekday[index] + 1
+
+    def _ordinal(self, rank):
+        """The business day with the given rank"""
+        skipped = 0
+        while True:
+            ordinal = self._weekday_ordinal(rank + skipped)
+            holidays = bisect_right(self._holidays, ordinal)
+            if holidays == skipped and ordinal not in self._holiday_set:
+                return ordinal
+            skipped = holidays
+
+    def is_business_day(self, dates):
+        """
+        Check which dates are business days
+
+        Parameters:
+        dates (sequence): As for add_days
+
+        Returns:
+        ndarray or list: One bool per date
+        """
+        if np is not None:
+            return np.is_busday(_to_days(dates), busdaycal=self._calendar)
+        return [self._rank(ordinal + 1) > self._rank(ordinal) for ordinal in _to_days(dates)]
+
+    def add_business_days(self, dates, days):
+        """
+        Move dates by a number of business days
+
+        A date that is not a business day first rolls forward to the next
+        business day, so adding 0 days to a Saturday gives the Monday.
+
+        Parameters:
+        dates (sequence): As for add_days
+        days (int or sequence of int): One offset for every date, or one per date
+
+        Returns:
+        ndarray or list: datetime64[D] array with NumPy, otherwise a list of dates
+        """
+        if np is not None:
+            return np.busday_offset(_to_days(dates), np.asarray(days), roll='forward',
+                                    busdaycal=self._calendar)
+        return [date.fromordinal(self._ordinal(self._rank(ordinal) + offset))
+                for ordinal, offset in zip(_to_days(dates), _per_date(days))]
+
+    def count_business_days(self, starts, ends):
+        """
+        Count the business days from each start date up to (not including)
+        the matching end date
+
+        Parameters:
+        starts (sequence): As for add_days
+        ends (sequence): As for add_days, one per start date
+
+        Returns:
+        ndarray or list: One count per pair; negative if the end is earlier
+        """
+        if np is not None:
+            return np.busday_count(_to_days(starts), _to_days(ends), busdaycal=self._calendar)
+        # Like numpy.busday_count, a backwards range counts the days after
+        # its end up to and including its start.
+        return [self._rank(end) - self._rank(start) if start <= end
+                else self._rank(end + 1) - self._rank(start + 1)
+                for start, end in zip(_to_days(starts), _to_days(ends))]
+
 def main():
     """Main function to demonstrate datetime operations"""
     # Part 1: Display current date and time
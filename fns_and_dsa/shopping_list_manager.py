@@ -1,3 +1,12 @@
+import argparse
+import sys
+
+from shopping_list_store import ShoppingList
+
+# Command-stream output is written in one call per this many lines
+OUTPUT_BATCH_LINES = 8192
+
+
 def display_menu():
     """Display the main menu options"""
     print("Shopping List Manager")
@@ -6,10 +15,8 @@ def display_menu():
     print("3. View List")
     print("4. Exit")
 
-def main():
-    """Main function to manage the shopping list"""
-    shopping_list = []
-    
+def run_menu(shopping_list):
+    """Run the interactive menu over a ShoppingList"""
     while True:
         display_menu()
         choice = input("Enter your choice: ")
@@ -18,7 +25,7 @@ def main():
             # Prompt for and add an item
             item = input("Enter the item to add: ").strip()
             if item:  # Check if item is not empty
-                shopping_list.append(item)
+                shopping_list.add(item)
                 print(f"'{item}' has been added to your shopping list.")
             else:
                 print("Please enter a valid item name.")
@@ -29,8 +36,7 @@ def main():
                 print("Your shopping list is empty. Nothing to remove.")
             else:
                 item = input("Enter the item to remove: ").strip()
-                if item in shopping_list:
-                    shopping_list.remove(item)
+                if shopping_list.remove(item):
                     print(f"'{item}' has been removed from your shopping list.")
                 else:
                     print(f"'{item}' not found in your shopping list.")
@@ -41,8 +47,11 @@ def main():
                 print("Your shopping list is empty.")
             else:
                 print("\nYour Shopping List:")
-                for i, item in enumerate(shopping_list, 1):
-                    print(f"{i}. {item}")
+                for i, (item, quantity) in enumerate(shopping_list.items(), 1):
+                    if quantity > 1:
+                        print(f"{i}. {item} (x{quantity})")
+                    else:
+                        print(f"{i}. {item}")
                 print()  # Empty line for better formatting
                 
         elif choice == '4':
@@ -52,5 +61,82 @@ def main():
         else:
             print("Invalid choice. Please try again.")
 
+def run_commands(shopping_list, commands, out, quiet=False):
+    """
+    Apply a stream of commands to a ShoppingList without prompting
+    
+    Each line is "add ITEM", "remove ITEM" or "view"; blank lines and lines
+    starting with '#' are skipped. Messages match the interactive menu, but
+    are collected and written in large batches rather than printed one by
+    one.
+    
+    Parameters:
+    shopping_list (ShoppingList): The list to change
+    commands (iterable of str): Command lines, e.g. an open file
+    out (file): Where to write the messages
+    quiet (bool): Only write the output of "view" and error messages
+    
+    Returns:
+    int: Number of commands applied
+    """
+    lines = []
+    emit = lines.append
+    count = 0
+    for line in commands:
+        command, _, item = line.strip().partition(' ')
+        if not command or command.startswith('#'):
+            continue
+        count += 1
+        item = item.strip()
+        if command == 'add' and item:
+            shopping_list.add(item)
+            if not quiet:
+                emit(f"'{item}' has been added to your shopping list.")
+        elif command == 'remove' and item:
+            if not shopping_list:
+                emit("Your shopping list is empty. Nothing to remove.")
+            elif shopping_list.remove(item):
+                if not quiet:
+                    emit(f"'{item}' has been removed from your shopping list.")
+            else:
+                emit(f"'{item}' not found in your shopping list.")
+        elif command == 'view':
+            if not shopping_list:
+                emit("Your shopping list is empty.")
+            else:
+                emit("\nYour Shopping List:")
+                for i, (entry, quantity) in enumerate(shopping_list.items(), 1):
+                    emit(f"{i}. {entry} (x{quantity})" if quantity > 1 else f"{i}. {entry}")
+                emit("")
+        else:
+            emit(f"Invalid command: {line.strip()!r}")
+        if len(lines) >= OUTPUT_BATCH_LINES:
+            out.write("\n".join(lines) + "\n")
+            lines.clear()
+    if lines:
+        out.write("\n".join(lines) + "\n")
+    return count
+
+def main(argv=None):
+    """Main function to manage the shopping list"""
+    parser = argparse.ArgumentParser(description="Manage a shopping list.")
+    parser.add_argument('--store', metavar='PATH',
+                        help="log file that keeps the list between runs")
+    parser.add_argument('--commands', metavar='FILE',
+                        help="read add/remove/view commands from FILE ('-' for stdin) "
+                             "instead of showing the menu")
+    parser.add_argument('--quiet', action='store_true',
+                        help="with --commands, only print views and errors")
+    args = parser.parse_args(argv)
+
+    with ShoppingList(args.store) as shopping_list:
+        if args.commands is None:
+            run_menu(shopping_list)
+        elif args.commands == '-':
+            run_commands(shopping_list, sys.stdin, sys.stdout, args.quiet)
+        else:
+            with open(args.commands, encoding='utf-8') as commands:
+                run_commands(shopping_list, commands, sys.stdout, args.quiet)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,198 @@
+import json
+import os
+
+
+class ShoppingList:
+    """
+    A shopping list with quantities, optionally persisted to a log file
+
+    Items are kept in a dict that maps each item to its quantity, so adding,
+    removing and membership checks take constant time and the list keeps
+    the order in which items were first added. When a path is given, every
+    change is appended to a log file as one JSON line, and the log is
+    rewritten as a compact snapshot once it grows well past the size of
+    the list itself.
+    """
+
+    # Compact once the log has this many times more lines than there are
+    # items (and at least MIN_COMPACT_LINES lines).
+    COMPACT_RATIO = 2
+    MIN_COMPACT_LINES = 1000
+
+    # Bytes of the log parsed at a time when it is loaded
+    REPLAY_CHUNK_BYTES = 1 << 20
+
+    def __init__(self, path=None):
+        """
+        Open a shopping list, loading it from its log file if one exists
+
+        Parameters:
+        path (str): Log file to load from and append to; None keeps the
+            list in memory only
+        """
+        self.path = path
+        self._items = {}
+        self._log = None
+        self._log_lines = 0
+        if path is not None:
+            if os.path.exists(path):
+                self._replay(path)
+            self._log = open(path, 'a', encoding='utf-8')
+
+    def _replay(self, path):
+        """
+        Rebuild the list from the operations recorded in a log file
+
+        The log is read REPLAY_CHUNK_BYTES at a time. A last line without its
+        newline is a write cut short by a crash: it is replayed if it is a
+        complete record and cut off the file otherwise, so new records are
+        not appended onto the torn bytes.
+        """
+        lines_read = 0
+        complete = 0
+        tail = b''
+        with open(path, 'rb') as log:
+            while True:
+                lines = log.readlines(self.REPLAY_CHUNK_BYTES)
+                if not lines:
+                    break
+                if not lines[-1].endswith(b'\n'):
+                    # Only the last line of the file can lack a newline.
+                    tail = lines.pop()
+                complete += sum(map(len, lines))
+                lines = [line for line in lines if line.strip()]
+                # Parsing a chunk as one JSON array is much faster than
+                # calling json.loads once per line.
+                self._apply(json.loads(b'[' + b','.join(lines) + b']'))
+                lines_read += len(lines)
+        if tail.strip():
+            try:
+                record = json.loads(tail)
+            except ValueError:
+                record = None
+            with open(path, 'r+b') as log:
+                if isinstance(record, list) and len(record) == 3:
+                    self._apply([record])
+                    lines_read += 1
+                    log.seek(0, os.SEEK_END)
+                    log.write(b'\n')
+                else:
+                    log.truncate(complete)
+        self._log_lines = lines_read
+
+    def _apply(self, records):
+        """Apply [operation, item, quantity] records to the items"""
+        items = self._items
+        for operation, item, quantity in records:
+            if operation == 'add':
+                items[item] = items.get(item, 0) + quantity
+            else:
+                remaining = items.get(item, 0) - quantity
+                if remaining > 0:
+                    items[item] = remaining
+                else:
+                    items.pop(item, None)
+
+    def _record(self, operation, item, quantity):
+        if self._log is None:
+            return
+        self._log.write(json.dumps([operation, item, quantity]) + '\n')
+        self._log_lines += 1
+        if self._log_lines > max(self.MIN_COMPACT_LINES, self.COMPACT_RATIO * len(self._items)):
+            self.compact()
+
+    def add(self, item, quantity=1):
+        """
+        Add an item, or increase its quantity if it is already on the list
+
+        Parameters:
+        item (str): The item to add
+        quantity (int): How many to add
+        """
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive.")
+        self._items[item] = self._items.get(item, 0) + quantity
+        self._record('add', item, quantity)
+
+    def remove(self, item, quantity=1):
+        """
+        Decrease an item's quantity, removing it once none are left
+
+        Parameters:
+        item (str): The item to remove
+        quantity (int): How many to remove
+
+        Returns:
+        bool: True if the item was on the list, False otherwise
+        """
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive.")
+        current = self._items.get(item)
+        if current is None:
+            return False
+        if current > quantity:
+            self._items[item] = current - quantity
+        else:
+            del self._items[item]
+        self._record('remove', item, min(quantity, current))
+        return True
+
+    def quantity(self, item):
+        """
+        Get how many of an item are on the list
+
+        Parameters:
+        item (str): The item to look up
+
+        Returns:
+        int: The quantity, 0 if the item is not on the list
+        """
+        return self._items.get(item, 0)
+
+    def items(self):
+        """
+        Get the items in the order they were first added
+
+        Returns:
+        list: (item, quantity) tuples
+        """
+        return list(self._items.items())
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def compact(self):
+        """Rewrite the log file so it holds one line per item"""
+        if self._log is None:
+            return
+        self._log.close()
+        temporary = self.path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as log:
+            log.writelines(json.dumps(['add', item, quantity]) + '\n'
+                           for item, quantity in self._items.items())
+        os.replace(temporary, self.path)
+        self._log = open(self.path, 'a', encoding='utf-8')
+        self._log_lines = len(self._items)
+
+    def flush(self):
+        """Write any buffered changes to the log file"""
+        if self._log is not None:
+            self._log.flush()
+
+    def close(self):
+        """Flush and close the log file; the list stays usable in memory"""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
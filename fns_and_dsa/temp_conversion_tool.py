@@ -1,7 +1,173 @@
+import argparse
+import mmap
+import os
+import sys
+import time
+from array import array
+from contextlib import contextmanager
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; streaming falls back to the stdlib
+    np = None
+
 # Global conversion factors
 FAHRENHEIT_TO_CELSIUS_FACTOR = 5/9
 CELSIUS_TO_FAHRENHEIT_FACTOR = 9/5
 
+# array typecodes for the binary formats accepted by convert_binary_file
+BINARY_TYPECODES = {'float32': 'f', 'float64': 'd'}
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _exact(number):
+    """Turn an int, str, float or Fraction into an exact Fraction"""
+    if isinstance(number, float):
+        # Go through the decimal text so 273.15 means exactly 273.15
+        number = repr(number)
+    return Fraction(number)
+
+
+class ConversionRegistry:
+    """
+    Units stored as affine transforms to a shared base unit
+    
+    A unit is registered with the scale and offset that take its values to
+    the base unit (base = value * scale + offset). Converting between any
+    two units composes both transforms into a single scale and offset,
+    computed exactly with fractions and cached per pair, so each conversion
+    is one multiply and one add.
+    """
+
+    def __init__(self):
+        """Create an empty registry"""
+        self._units = {}
+        self._aliases = {}
+        self._transforms = {}
+
+    def register(self, unit, scale, offset=0, aliases=()):
+        """
+        Add a unit, or replace an existing one
+        
+        Parameters:
+        unit (str): Name of the unit, e.g. 'C'
+        scale (int, str, float or Fraction): Factor taking values to the base unit
+        offset (int, str, float or Fraction): Added after scaling
+        aliases (iterable of str): Other names for the unit, e.g. 'celsius'
+        """
+        unit = unit.strip().upper()
+        self._units[unit] = (_exact(scale), _exact(offset))
+        for name in (unit, *aliases):
+            self._aliases[name.strip().upper()] = unit
+        self._transforms.clear()
+
+    def units(self):
+        """
+        List the registered units
+        
+        Returns:
+        list: Unit names, in the order they were registered
+        """
+        return list(self._units)
+
+    def resolve(self, unit):
+        """
+        Find the registered unit a name or alias refers to
+        
+        Parameters:
+        unit (str): A unit name or alias, in any case
+        
+        Returns:
+        str: The registered unit name
+        """
+        try:
+            return self._aliases[unit.strip().upper()]
+        except KeyError:
+            raise ValueError(f"Unknown unit: {unit!r}") from None
+
+    def transform(self, source, target):
+        """
+        Get the scale and offset that convert source values to target values
+        
+        Parameters:
+        source (str): Unit of the input values
+        target (str): Unit to convert to
+        
+        Returns:
+        tuple: (scale, offset) floats with target = value * scale + offset
+        """
+        key = (source, target)
+        transform = self._transforms.get(key)
+        if transform is None:
+            source_scale, source_offset = self._units[self.resolve(source)]
+            target_scale, target_offset = self._units[self.resolve(target)]
+            transform = (float(source_scale / target_scale),
+                         float((source_offset - target_offset) / target_scale))
+            self._transforms[key] = transform
+        return transform
+
+    def convert(self, value, source, target):
+        """
+        Convert a single value
+        
+        Parameters:
+        value (float): Value in the source unit
+        source (str): Unit of the value
+        target (str): Unit to convert to
+        
+        Returns:
+        float: The value in the target unit
+        """
+        scale, offset = self._transforms.get((source, target)) or self.transform(source, target)
+        return value * scale + offset
+
+    def converter(self, source, target):
+        """
+        Get a function that converts single values between two units
+        
+        Parameters:
+        source (str): Unit of the input values
+        target (str): Unit to convert to
+        
+        Returns:
+        function: Takes a value and returns it converted, with the transform
+            looked up once instead of on every call
+        """
+        scale, offset = self.transform(source, target)
+        return lambda value: value * scale + offset
+
+    def convert_many(self, values, source, target):
+        """
+        Convert a whole sequence of values
+        
+        Parameters:
+        values (sequence of float): Values in the source unit
+        source (str): Unit of the values
+        target (str): Unit to convert to
+        
+        Returns:
+        ndarray or array: The converted values, as float64. An ndarray when
+            NumPy is installed, otherwise an array('d')
+        """
+        scale, offset = self.transform(source, target)
+        if np is not None:
+            values = np.asarray(values, dtype=np.float64)
+        else:
+            values = array('d', values)
+        return _convert_chunk(values, scale, offset)
+
+
+# Temperature units, with Kelvin as the base unit
+TEMPERATURE_UNITS = ConversionRegistry()
+TEMPERATURE_UNITS.register('K', 1, 0, aliases=('kelvin',))
+TEMPERATURE_UNITS.register('C', 1, '273.15', aliases=('celsius',))
+TEMPERATURE_UNITS.register('F', Fraction(5, 9), Fraction('459.67') * Fraction(5, 9),
+                           aliases=('fahrenheit',))
+TEMPERATURE_UNITS.register('R', Fraction(5, 9), 0, aliases=('rankine',))
+
+
 def convert_to_celsius(fahrenheit):
     """
     Convert Fahrenheit to Celsius using global conversion factor
@@ -49,5 +215,258 @@ def main():
     except ValueError:
         print("Invalid temperature. Please enter a numeric value.")
 
+def _convert_chunk(values, scale, offset):
+    """Apply value * scale + offset to a chunk (an ndarray or an array)"""
+    if np is not None:
+        converted = values * scale
+        converted += offset
+        return converted
+    return array(values.typecode, [value * scale + offset for value in values])
+
+
+# Target unit used by the file converters when none is given
+_DEFAULT_TARGETS = {'C': 'F', 'F': 'C'}
+
+
+def _stream_transform(from_unit, to_unit):
+    """Scale and offset for a file conversion; C and F default to each other"""
+    if to_unit is None:
+        to_unit = _DEFAULT_TARGETS.get(TEMPERATURE_UNITS.resolve(from_unit))
+        if to_unit is None:
+            raise ValueError(f"No default target unit for {from_unit!r}; pass to_unit.")
+    return TEMPERATURE_UNITS.transform(from_unit, to_unit)
+
+
+@contextmanager
+def _replacing(output_path, mode):
+    """
+    Open a temporary file that replaces output_path only if the block succeeds
+
+    On any error the temporary file is removed and output_path is left as it was.
+    """
+    temporary = output_path + '.tmp'
+    try:
+        with open(temporary, mode, **({} if 'b' in mode else {'encoding': 'utf-8'})) as target:
+            yield target
+        os.replace(temporary, output_path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def convert_binary_file(input_path, output_path, from_unit, dtype='float64',
+                        chunk_size=DEFAULT_CHUNK_SIZE, to_unit=None):
+    """
+    Convert a raw dump of native-endian floats, one chunk at a time
+    
+    The input file is memory-mapped, so only one chunk of values is held in
+    memory at once whatever the size of the file. As with text files, the
+    output replaces output_path only once the whole file has converted.
+    
+    Parameters:
+    input_path (str): File of packed float32 or float64 values
+    output_path (str): File to write the converted values to, same format
+    from_unit (str): Unit of the input values (see TEMPERATURE_UNITS)
+    dtype (str): 'float32' or 'float64'
+    chunk_size (int): Number of values converted per chunk
+    to_unit (str): Unit to convert to; defaults to F for C input and C for F input
+    
+    Returns:
+    int: Number of values converted
+    """
+    scale, offset = _stream_transform(from_unit, to_unit)
+    typecode = BINARY_TYPECODES[dtype]
+    itemsize = array(typecode).itemsize
+    size = os.path.getsize(input_path)
+    if size % itemsize:
+        raise ValueError(f"{input_path} is not a whole number of {dtype} values.")
+
+    with open(input_path, 'rb') as source, _replacing(output_path, 'wb') as target:
+        if size == 0:
+            return 0
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        step = chunk_size * itemsize
+        values = None
+        try:
+            for start in range(0, size, step):
+                if np is not None:
+                    # A view straight onto the mapping; no copy of the input
+                    values = np.frombuffer(mapped, dtype=dtype, offset=start,
+                                           count=min(step, size - start) // itemsize)
+                else:
+                    values = array(typecode)
+                    values.frombytes(mapped[start:start + step])
+                _convert_chunk(values, scale, offset).tofile(target)
+        finally:
+            # The mapping cannot be closed while a view onto it exists
+            values = None
+            try:
+                mapped.close()
+            except BufferError:
+                # The traceback of a failed chunk still holds its view; the
+                # mapping is closed once that is released, and the original
+                # error is the one to report.
+                pass
+    return size // itemsize
+
+
+def _is_number(text):
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_lines(lines, path, first_line):
+    """
+    Parse a chunk of lines into floats, skipping blank lines
+
+    Parameters:
+    lines (list of str): The chunk, as read from the file
+    path (str): The file, for error messages
+    first_line (int): Line number of the chunk's first line
+
+    Returns:
+    ndarray or array: The values, as float64
+
+    Raises:
+    ValueError: Naming the first line that is not a number
+    """
+    if not any(map(str.strip, lines)):
+        # np.loadtxt warns about input without any data
+        return array('d') if np is None else np.empty(0)
+    try:
+        if np is None:
+            return array('d', map(float, filter(str.strip, lines)))
+        values = np.loadtxt(lines, dtype=np.float64, comments=None, ndmin=1)
+        if values.ndim == 1:
+            return values
+    except ValueError:
+        pass
+    # np.loadtxt splits lines on whitespace and rejects some numbers float()
+    # accepts, such as "1_000", so a rejected chunk is parsed again a line at
+    # a time, which also finds the line to report.
+    values = array('d')
+    for number, line in enumerate(lines, first_line):
+        if line.strip():
+            try:
+                values.append(float(line))
+            except ValueError:
+                raise ValueError(f"{path}, line {number}: not a number: "
+                                 f"{line.strip()!r}") from None
+    return values if np is None else np.array(values)
+
+
+def convert_text_file(input_path, output_path, from_unit, chunk_size=DEFAULT_CHUNK_SIZE,
+                      to_unit=None):
+    """
+    Convert a text or single-column CSV file with one value per line
+    
+    Lines are read and written a chunk at a time; blank lines are skipped,
+    and so is a header on the first non-blank line (anything that is not a
+    number). The output is written to a temporary file that replaces
+    output_path once every line has converted, so a bad line never leaves
+    a partial output file behind.
+    
+    Parameters:
+    input_path (str): Text file of temperatures, one per line
+    output_path (str): File to write the converted values to, one per line
+    from_unit (str): Unit of the input values (see TEMPERATURE_UNITS)
+    chunk_size (int): Approximate number of lines converted per chunk
+    to_unit (str): Unit to convert to; defaults to F for C input and C for F input
+    
+    Returns:
+    int: Number of values converted
+
+    Raises:
+    ValueError: If a line after the header is not a number
+    """
+    scale, offset = _stream_transform(from_unit, to_unit)
+    count = 0
+    line_number = 1
+    # readlines() takes a size hint in characters; aim for chunk_size lines
+    hint = chunk_size * 16
+    with open(input_path, encoding='utf-8') as source, _replacing(output_path, 'w') as target:
+        lines = source.readlines(hint)
+        # Find the first non-blank line, however many chunks of blank lines
+        # come before it, and drop it too if it is a header.
+        while lines:
+            index = next((index for index, line in enumerate(lines) if line.strip()), None)
+            if index is not None:
+                if not _is_number(lines[index]):
+                    index += 1
+                del lines[:index]
+                line_number += index
+                if not lines:
+                    lines = source.readlines(hint)
+                break
+            line_number += len(lines)
+            lines = source.readlines(hint)
+        while lines:
+            values = _parse_lines(lines, input_path, line_number)
+            line_number += len(lines)
+            # str() of Python floats is faster than np.savetxt and
+            # writes the same shortest round-trip text on both paths
+            converted = _convert_chunk(values, scale, offset)
+            if np is not None:
+                converted = converted.tolist()
+            target.write('\n'.join(map(str, converted)))
+            if converted:
+                target.write('\n')
+            count += len(converted)
+            lines = source.readlines(hint)
+    return count
+
+
+def _unit_argument(name):
+    """argparse type for unit options: a registered unit name or alias"""
+    try:
+        return TEMPERATURE_UNITS.resolve(name)
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(
+            f"{error}; expected one of {', '.join(TEMPERATURE_UNITS.units())} "
+            f"or their names") from None
+
+
+def stream_main(argv):
+    """Convert a file of temperatures without prompting, and report throughput"""
+    parser = argparse.ArgumentParser(
+        description="Convert a file of temperatures between units.")
+    parser.add_argument('input', help="input file")
+    parser.add_argument('output', help="output file")
+    units = ', '.join(TEMPERATURE_UNITS.units())
+    parser.add_argument('--from-unit', required=True, type=_unit_argument, metavar='UNIT',
+                        help=f"unit of the input values ({units}, or a name such as celsius)")
+    parser.add_argument('--to-unit', type=_unit_argument, metavar='UNIT',
+                        help="unit to convert to (default: F for C input, C for F input; "
+                             "required for other units)")
+    parser.add_argument('--format', default='text', choices=['text'] + sorted(BINARY_TYPECODES),
+                        help="text (one value per line) or a raw binary float dump")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="values per chunk (default: %(default)s)")
+    args = parser.parse_args(argv)
+    if args.to_unit is None and args.from_unit not in _DEFAULT_TARGETS:
+        parser.error(f"--to-unit is required when converting from {args.from_unit}")
+
+    start = time.perf_counter()
+    try:
+        if args.format == 'text':
+            count = convert_text_file(args.input, args.output, args.from_unit,
+                                      args.chunk_size, args.to_unit)
+        else:
+            count = convert_binary_file(args.input, args.output, args.from_unit, args.format,
+                                        args.chunk_size, args.to_unit)
+    except ValueError as error:
+        parser.error(str(error))
+    seconds = time.perf_counter() - start
+    rate = count / seconds if seconds else float('inf')
+    print(f"Converted {count:,} values in {seconds:.3f} s ({rate:,.0f} values/s)")
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        stream_main(sys.argv[1:])
+    else:
+        main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Unit tests for perform_operation and its column variant perform_operations.
+"""
+
+import math
+import unittest
+from unittest import mock
+import arithmetic_operations
+from arithmetic_operations import (ADD, DIVIDE, MULTIPLY, SUBTRACT, perform_operation,
+                                   perform_operations)
+
+NUMPY = arithmetic_operations.np
+
+
+class TestPerformOperations(unittest.TestCase):
+    """Test cases for the column API, run with whatever backend is installed."""
+
+    numbers1 = [6.0, 6.0, 6.0, 6.0, 1.0, -3.5]
+    numbers2 = [3.0, 3.0, 3.0, 0.0, 0.0, 2.0]
+    operations = ['add', 'subtract', 'multiply', 'divide', 'add', 'divide']
+
+    def test_matches_perform_operation(self):
+        """Each row matches perform_operation, with NaN where it returns an error."""
+        results, errors = perform_operations(self.numbers1, self.numbers2, self.operations)
+        for row, operation in enumerate(self.operations):
+            expected = perform_operation(self.numbers1[row], self.numbers2[row], operation)
+            with self.subTest(row=row):
+                if isinstance(expected, str):
+                    self.assertTrue(errors[row])
+                    self.assertTrue(math.isnan(results[row]))
+                else:
+                    self.assertFalse(errors[row])
+                    self.assertEqual(results[row], expected)
+
+    def test_error_mask(self):
+        """Only rows that divide by zero are flagged."""
+        _, errors = perform_operations(self.numbers1, self.numbers2, self.operations)
+        self.assertEqual([bool(error) for error in errors], [False, False, False, True, False, False])
+        _, errors = perform_operations([1.0, 2.0], [0.0, 0.0], 'add')
+        self.assertEqual([bool(error) for error in errors], [False, False])
+        results, errors = perform_operations([1.0, 2.0], [0.0, 4.0], DIVIDE)
+        self.assertEqual([bool(error) for error in errors], [True, False])
+        self.assertTrue(math.isnan(results[0]))
+        self.assertEqual(results[1], 0.5)
+
+    def test_codes_and_names_agree(self):
+        """Operation codes give the same results as operation names."""
+        codes = [{'add': ADD, 'subtract': SUBTRACT, 'multiply': MULTIPLY,
+                  'divide': DIVIDE}[operation] for operation in self.operations]
+        by_name, _ = perform_operations(self.numbers1, self.numbers2, self.operations)
+        by_code, _ = perform_operations(self.numbers1, self.numbers2, codes)
+        self.assertEqual(str(list(by_name)), str(list(by_code)))
+
+    def test_invalid_input(self):
+        """Unknown operations, bools and mismatched columns are rejected."""
+        for operations in ('power', 7, True, False, ['add', 'power'], ['add', True]):
+            with self.subTest(operations=operations):
+                with self.assertRaises(ValueError):
+                    perform_operations([1.0, 2.0], [1.0, 2.0], operations)
+        with self.assertRaises(ValueError):
+            perform_operations([1.0], [1.0, 2.0], 'add')
+        with self.assertRaises(ValueError):
+            perform_operations([1.0, 2.0], [1.0, 2.0], ['add'])
+
+
+@unittest.skipIf(NUMPY is None, "the stdlib fallback is already tested")
+class TestPerformOperationsWithoutNumPy(TestPerformOperations):
+    """Runs the column test cases against the stdlib fallback and checks parity."""
+
+    def setUp(self):
+        """Hide NumPy from arithmetic_operations for the duration of each test."""
+        patcher = mock.patch.object(arithmetic_operations, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_parity_with_numpy(self):
+        """The fallback returns the same results and errors as the NumPy backend."""
+        fallback = perform_operations(self.numbers1, self.numbers2, self.operations)
+        with mock.patch.object(arithmetic_operations, "np", NUMPY):
+            results, errors = perform_operations(self.numbers1, self.numbers2, self.operations)
+        self.assertEqual(str(list(fallback[0])), str(results.tolist()))
+        self.assertEqual(list(fallback[1]), errors.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for DateFormatter, checked against plain strftime/strptime.
+"""
+
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from datetime_cache import DATE_FORMAT, DATETIME_FORMAT, DateFormatter
+
+FORMATS = (DATETIME_FORMAT, "%Y-%m-%dT%H:%M:%S", DATE_FORMAT, "%d/%m/%Y %H:%M")
+
+
+class TestDateFormatter(unittest.TestCase):
+    """Test cases for DateFormatter."""
+
+    def test_format_matches_strftime(self):
+        """Every format gives the same text as strftime, early years included."""
+        values = [datetime(2024, 2, 29, 23, 59, 58, 999999), datetime(999, 1, 2, 3, 4, 5),
+                  datetime(1, 1, 1), date(2024, 12, 31)]
+        for fmt in FORMATS:
+            formatter = DateFormatter(fmt)
+            for value in values:
+                with self.subTest(fmt=fmt, value=value):
+                    self.assertEqual(formatter.format(value), value.strftime(fmt))
+
+    def test_parse_matches_strptime(self):
+        """Text that strptime accepts parses to the same value."""
+        texts = {DATETIME_FORMAT: ['2024-02-29 23:59:58', '2024-1-5 7:08:09', '0999-01-02 03:04:05'],
+                 DATE_FORMAT: ['2024-02-29', '2024-1-5']}
+        for fmt, samples in texts.items():
+            formatter = DateFormatter(fmt)
+            for text in samples:
+                with self.subTest(fmt=fmt, text=text):
+                    self.assertEqual(formatter.parse(text), datetime.strptime(text, fmt))
+
+    def test_parse_rejects_what_strptime_rejects(self):
+        """Week dates, ordinal dates and other ISO variants are not accepted."""
+        texts = {DATETIME_FORMAT: ['2024-W01-1 10:00:00', '2024-001 10:00:00:0',
+                                   '2024-01-01T10:00:00', '2024-01-01 10:00:00.5',
+                                   '20240101 10:00:00'],
+                 DATE_FORMAT: ['2024-W01-1', '2024-W011', '2024-001', '20240101']}
+        for fmt, samples in texts.items():
+            formatter = DateFormatter(fmt)
+            for text in samples:
+                with self.subTest(fmt=fmt, text=text):
+                    with self.assertRaises(ValueError):
+                        datetime.strptime(text, fmt)
+                    with self.assertRaises(ValueError):
+                        formatter.parse(text)
+
+    def test_same_second_shares_cache_entry(self):
+        """Values that differ only in microseconds hit the same format entry."""
+        formatter = DateFormatter()
+        start = datetime(2024, 5, 1, 12, 0, 0)
+        texts = {formatter.format(start + timedelta(microseconds=step * 1000))
+                 for step in range(1000)}
+        self.assertEqual(texts, {'2024-05-01 12:00:00'})
+        self.assertEqual(formatter.stats()['format']['misses'], 1)
+
+    def test_sub_second_formats_keep_microseconds(self):
+        """Formats with %f still see every microsecond."""
+        formatter = DateFormatter("%H:%M:%S.%f")
+        value = datetime(2024, 5, 1, 12, 0, 0, 123456)
+        self.assertEqual(formatter.format(value), '12:00:00.123456')
+        self.assertEqual(formatter.format(value.replace(microsecond=7)), '12:00:00.000007')
+
+    def test_aware_datetimes_are_not_cached(self):
+        """Equal aware datetimes in different zones format differently."""
+        formatter = DateFormatter()
+        utc = datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+        local = utc.astimezone(timezone(timedelta(hours=2)))
+        self.assertEqual(formatter.format(utc), '2024-05-01 12:00:00')
+        self.assertEqual(formatter.format(local), '2024-05-01 14:00:00')
+
+    def test_now_changes_once_per_second(self):
+        """now() reformats only when the clock reaches a new second."""
+        times = iter([100.1, 100.9, 101.0])
+        formatter = DateFormatter(clock=lambda: next(times))
+        first, second, third = formatter.now(), formatter.now(), formatter.now()
+        self.assertEqual(first, second)
+        self.assertNotEqual(second, third)
+        self.assertEqual(formatter.stats()['now'], {'hits': 1, 'misses': 2, 'hit_rate': 1 / 3})
+
+
+if __name__ == '__main__':
+    unittest.main()
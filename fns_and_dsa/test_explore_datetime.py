@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the batch date helpers and BusinessCalendar. The stdlib
+rank arithmetic is checked against a day-by-day walk and against NumPy.
+"""
+
+import random
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+import explore_datetime
+from explore_datetime import BusinessCalendar, add_days, add_months, format_dates
+
+NUMPY = explore_datetime.np
+
+HOLIDAYS = [date(2024, 1, 1), date(2024, 3, 29), date(2024, 4, 1), date(2024, 4, 2),
+            date(2024, 4, 6), date(2024, 12, 25), date(2024, 12, 26), date(2025, 1, 1)]
+
+
+def as_dates(values):
+    """Turn datetime64 arrays or date lists into a list of dates."""
+    return [date.fromisoformat(text) for text in format_dates(values)]
+
+
+class ReferenceCalendar:
+    """Business-day arithmetic done the slow way, one day at a time."""
+
+    def __init__(self, holidays, weekmask):
+        self.holidays = set(holidays)
+        self.weekmask = weekmask
+
+    def is_business_day(self, day):
+        return self.weekmask[day.weekday()] == '1' and day not in self.holidays
+
+    def add_business_days(self, day, days):
+        while not self.is_business_day(day):
+            day += timedelta(1)
+        step = timedelta(1 if days >= 0 else -1)
+        for _ in range(abs(days)):
+            day += step
+            while not self.is_business_day(day):
+                day += step
+        return day
+
+    def count_business_days(self, start, end):
+        if start <= end:
+            return sum(self.is_business_day(start + timedelta(offset))
+                       for offset in range((end - start).days))
+        return -sum(self.is_business_day(end + timedelta(offset))
+                    for offset in range(1, (start - end).days + 1))
+
+
+class TestBusinessCalendar(unittest.TestCase):
+    """Test cases for BusinessCalendar, run with whatever backend is installed."""
+
+    weekmasks = ('1111100', '1111110', '0010000', '1010101')
+
+    def setUp(self):
+        """Pick random dates and offsets around the holidays."""
+        rng = random.Random(0)
+        first = date(2023, 12, 1)
+        self.starts = [first + timedelta(rng.randrange(450)) for _ in range(300)]
+        self.ends = [first + timedelta(rng.randrange(450)) for _ in range(300)]
+        self.offsets = [rng.randint(-40, 40) for _ in range(300)]
+
+    def test_matches_day_by_day_walk(self):
+        """Every operation agrees with stepping through the calendar one day at a time."""
+        for weekmask in self.weekmasks:
+            with self.subTest(weekmask=weekmask):
+                calendar = BusinessCalendar(HOLIDAYS, weekmask)
+                reference = ReferenceCalendar(HOLIDAYS, weekmask)
+                self.assertEqual([bool(flag) for flag in calendar.is_business_day(self.starts)],
+                                 [reference.is_business_day(day) for day in self.starts])
+                self.assertEqual(as_dates(calendar.add_business_days(self.starts, self.offsets)),
+                                 [reference.add_business_days(day, offset)
+                                  for day, offset in zip(self.starts, self.offsets)])
+                self.assertEqual([int(count) for count in
+                                  calendar.count_business_days(self.starts, self.ends)],
+                                 [reference.count_business_days(start, end)
+                                  for start, end in zip(self.starts, self.ends)])
+
+    def test_rolls_forward(self):
+        """A weekend or holiday start rolls forward before moving."""
+        calendar = BusinessCalendar(HOLIDAYS)
+        self.assertEqual(as_dates(calendar.add_business_days(
+            [date(2024, 3, 30), date(2024, 3, 29), date(2024, 12, 24)], [0, 1, 1])),
+            [date(2024, 4, 3), date(2024, 4, 4), date(2024, 12, 27)])
+
+    def test_single_offset_and_strings(self):
+        """One offset applies to every date, and ISO strings are accepted."""
+        calendar = BusinessCalendar()
+        self.assertEqual(as_dates(calendar.add_business_days(['2024-05-03', '2024-05-06'], 1)),
+                         [date(2024, 5, 6), date(2024, 5, 7)])
+
+    def test_invalid_weekmask(self):
+        """Weekmasks must be seven flags with at least one working day."""
+        for weekmask in ('11111', '0000000', '111110x'):
+            with self.subTest(weekmask=weekmask):
+                with self.assertRaises(ValueError):
+                    BusinessCalendar(weekmask=weekmask)
+
+
+class TestDateColumns(unittest.TestCase):
+    """Test cases for add_days, add_months and format_dates."""
+
+    def test_add_days(self):
+        """Offsets are added per date and times of day are dropped."""
+        self.assertEqual(format_dates(add_days(['2024-02-28', '2023-12-31T18:30'], [1, 1])),
+                         ['2024-02-29', '2024-01-01'])
+
+    def test_add_months_clamps_to_month_end(self):
+        """Days past the end of the target month move back to its last day."""
+        dates = [date(2024, 1, 31), date(2024, 3, 31), date(2023, 11, 15)]
+        self.assertEqual(format_dates(add_months(dates, [1, -1, 3])),
+                         ['2024-02-29', '2024-02-29', '2024-02-15'])
+
+
+@unittest.skipIf(NUMPY is None, "the stdlib fallback is already tested")
+class TestBusinessCalendarWithoutNumPy(TestBusinessCalendar):
+    """Runs the calendar test cases against the stdlib rank arithmetic."""
+
+    def setUp(self):
+        """Hide NumPy from explore_datetime for the duration of each test."""
+        patcher = mock.patch.object(explore_datetime, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def test_parity_with_numpy(self):
+        """The stdlib calendar gives the same answers as numpy.busdaycalendar."""
+        for weekmask in self.weekmasks:
+            with self.subTest(weekmask=weekmask):
+                fallback = BusinessCalendar(HOLIDAYS, weekmask)
+                answers = (fallback.is_business_day(self.starts),
+                           as_dates(fallback.add_business_days(self.starts, self.offsets)),
+                           fallback.count_business_days(self.starts, self.ends))
+                with mock.patch.object(explore_datetime, "np", NUMPY):
+                    calendar = BusinessCalendar(HOLIDAYS, weekmask)
+                    expected = (calendar.is_business_day(self.starts).tolist(),
+                                as_dates(calendar.add_business_days(self.starts, self.offsets)),
+                                calendar.count_business_days(self.starts, self.ends).tolist())
+                self.assertEqual(answers, expected)
+
+
+@unittest.skipIf(NUMPY is None, "the stdlib fallback is already tested")
+class TestDateColumnsWithoutNumPy(TestDateColumns):
+    """Runs the date column test cases against the stdlib fallback."""
+
+    def setUp(self):
+        """Hide NumPy from explore_datetime for the duration of each test."""
+        patcher = mock.patch.object(explore_datetime, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+if __name__ == '__main__':
+    unittest.main()
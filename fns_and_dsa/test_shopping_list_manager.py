@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shopping list command stream, checked against the
+messages of the interactive menu.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+import shopping_list_manager
+from shopping_list_manager import run_commands, run_menu
+from shopping_list_store import ShoppingList
+
+SCRIPT = """\
+view
+remove milk
+add milk
+add bread
+add  milk
+view
+remove tea
+remove milk
+remove milk
+remove bread
+view
+"""
+
+
+def menu_output(script):
+    """Run the interactive menu on the answers matching a command script.
+
+    Returns the menu's output without the menu itself and the final
+    "Goodbye!", which is what run_commands should print.
+    """
+    shadow = ShoppingList()
+    answers = []
+    for line in script.splitlines():
+        command, _, item = line.partition(' ')
+        item = item.strip()
+        if command == 'add':
+            answers += ['1', item]
+            shadow.add(item)
+        elif command == 'remove':
+            # The menu only asks which item when the list is not empty.
+            answers += ['2', item] if shadow else ['2']
+            shadow.remove(item)
+        else:
+            answers.append('3')
+    answers.append('4')
+
+    out = io.StringIO()
+    with mock.patch.object(shopping_list_manager, 'display_menu'), \
+            mock.patch('builtins.input', side_effect=answers), redirect_stdout(out):
+        run_menu(ShoppingList())
+    text = out.getvalue()
+    assert text.endswith("Goodbye!\n")
+    return text[:-len("Goodbye!\n")]
+
+
+class TestRunCommands(unittest.TestCase):
+    """Test cases for run_commands."""
+
+    def run_script(self, script, quiet=False):
+        """Apply a command script to a new list and return (count, output)."""
+        out = io.StringIO()
+        count = run_commands(ShoppingList(), io.StringIO(script), out, quiet)
+        return count, out.getvalue()
+
+    def test_messages_match_menu(self):
+        """Every message is the one the interactive menu prints."""
+        count, output = self.run_script(SCRIPT)
+        self.assertEqual(count, 11)
+        self.assertEqual(output, menu_output(SCRIPT))
+
+    def test_batched_output_matches(self):
+        """Output written over many batches is the same as in one batch."""
+        script = SCRIPT * 20
+        with mock.patch.object(shopping_list_manager, 'OUTPUT_BATCH_LINES', 3):
+            _, output = self.run_script(script)
+        self.assertEqual(output, menu_output(script))
+
+    def test_skips_blank_lines_and_comments(self):
+        """Blank lines and comments are neither counted nor answered."""
+        count, output = self.run_script("# groceries\n\n   \nadd tea\n")
+        self.assertEqual(count, 1)
+        self.assertEqual(output, "'tea' has been added to your shopping list.\n")
+
+    def test_invalid_commands(self):
+        """Unknown commands and missing items are reported."""
+        count, output = self.run_script("buy tea\nadd\nremove   \n")
+        self.assertEqual(count, 3)
+        self.assertEqual(output.splitlines(), ["Invalid command: 'buy tea'",
+                                               "Invalid command: 'add'",
+                                               "Invalid command: 'remove'"])
+
+    def test_quiet(self):
+        """Quiet mode keeps views and errors and drops confirmations."""
+        _, output = self.run_script("add tea\nadd tea\nremove milk\nview\n", quiet=True)
+        self.assertEqual(output, "'milk' not found in your shopping list.\n"
+                                 "\nYour Shopping List:\n1. tea (x2)\n\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ShoppingList and its log file: replay, compaction and
+recovery from a torn last line.
+"""
+
+import os
+import tempfile
+import unittest
+from shopping_list_store import ShoppingList
+
+
+class TestShoppingListStore(unittest.TestCase):
+    """Test cases for persisting a ShoppingList to its log file."""
+
+    def setUp(self):
+        """Create a scratch directory for the log file."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "shopping.log")
+
+    def read_log(self):
+        """Return the raw contents of the log file."""
+        with open(self.path, "rb") as file:
+            return file.read()
+
+    def test_replay(self):
+        """A reopened list has the same items, quantities and order."""
+        with ShoppingList(self.path) as shopping:
+            shopping.add("bread", 2)
+            shopping.add("milk")
+            shopping.add("eggs", 12)
+            shopping.remove("bread")
+            shopping.remove("milk")
+            self.assertFalse(shopping.remove("tea"))
+        with ShoppingList(self.path) as shopping:
+            self.assertEqual(shopping.items(), [("bread", 1), ("eggs", 12)])
+
+    def test_replay_in_chunks(self):
+        """Logs longer than one read chunk replay completely."""
+        with ShoppingList(self.path) as shopping:
+            for number in range(200):
+                shopping.add(f"item {number % 50}", number + 1)
+            expected = shopping.items()
+
+        class ChunkedShoppingList(ShoppingList):
+            REPLAY_CHUNK_BYTES = 64
+
+        with ChunkedShoppingList(self.path) as shopping:
+            self.assertEqual(shopping.items(), expected)
+
+    def test_compaction(self):
+        """The log is rewritten with one line per item once it grows too long."""
+        class SmallShoppingList(ShoppingList):
+            MIN_COMPACT_LINES = 10
+
+        with SmallShoppingList(self.path) as shopping:
+            for _ in range(11):
+                shopping.add("bread")
+            shopping.add("milk", 3)
+        self.assertEqual(self.read_log(), b'["add", "bread", 11]\n["add", "milk", 3]\n')
+        with SmallShoppingList(self.path) as shopping:
+            self.assertEqual(shopping.items(), [("bread", 11), ("milk", 3)])
+
+    def test_torn_last_line(self):
+        """A half-written last record is dropped and cut off the log."""
+        with ShoppingList(self.path) as shopping:
+            shopping.add("milk")
+        with open(self.path, "ab") as file:
+            file.write(b'["add", "bre')
+        with ShoppingList(self.path) as shopping:
+            self.assertEqual(shopping.items(), [("milk", 1)])
+            shopping.add("bread")
+        self.assertEqual(self.read_log(), b'["add", "milk", 1]\n["add", "bread", 1]\n')
+        with ShoppingList(self.path) as shopping:
+            self.assertEqual(shopping.items(), [("milk", 1), ("bread", 1)])
+
+    def test_missing_final_newline(self):
+        """A complete last record without its newline is kept."""
+        with open(self.path, "wb") as file:
+            file.write(b'["add", "milk", 1]\n["add", "tea", 2]')
+        with ShoppingList(self.path) as shopping:
+            self.assertEqual(shopping.items(), [("milk", 1), ("tea", 2)])
+            shopping.add("milk")
+        with ShoppingList(self.path) as shopping:
+            self.assertEqual(shopping.items(), [("milk", 2), ("tea", 2)])
+
+    def test_corrupt_line_in_the_middle(self):
+        """Damage before the last line is not silently skipped."""
+        with open(self.path, "wb") as file:
+            file.write(b'["add", "milk", 1]\n["add", "te\n["add", "eggs", 6]\n')
+        with self.assertRaises(ValueError):
+            ShoppingList(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
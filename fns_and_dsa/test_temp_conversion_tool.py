@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the temperature conversion registry and the file converters.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+import warnings
+from array import array
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+import temp_conversion_tool
+from temp_conversion_tool import (TEMPERATURE_UNITS, ConversionRegistry, convert_binary_file,
+                                  convert_text_file, stream_main)
+
+NUMPY = temp_conversion_tool.np
+
+
+class TestConversionRegistry(unittest.TestCase):
+    """Test cases for composing and caching unit transforms."""
+
+    def test_composed_conversions(self):
+        """Conversions between any two units go through the base unit."""
+        cases = [(0, 'C', 'F', 32), (212, 'F', 'C', 100), (491.67, 'R', 'K', 273.15),
+                 (32, 'F', 'K', 273.15), (0, 'K', 'R', 0), (100, 'celsius', 'kelvin', 373.15),
+                 (-40, 'f', 'c', -40)]
+        for value, source, target, expected in cases:
+            with self.subTest(source=source, target=target):
+                self.assertAlmostEqual(TEMPERATURE_UNITS.convert(value, source, target),
+                                       expected, places=9)
+                self.assertAlmostEqual(TEMPERATURE_UNITS.converter(source, target)(value),
+                                       expected, places=9)
+                self.assertAlmostEqual(
+                    TEMPERATURE_UNITS.convert_many([value, value], source, target)[1],
+                    expected, places=9)
+
+    def test_resolve(self):
+        """Names and aliases resolve in any case; unknown units raise ValueError."""
+        self.assertEqual(TEMPERATURE_UNITS.resolve(' Fahrenheit '), 'F')
+        self.assertEqual(TEMPERATURE_UNITS.resolve('r'), 'R')
+        with self.assertRaises(ValueError):
+            TEMPERATURE_UNITS.resolve('delisle')
+
+    def test_transforms_are_cached_until_register(self):
+        """Transforms are computed once per pair and recomputed after register."""
+        registry = ConversionRegistry()
+        registry.register('K', 1)
+        registry.register('C', 1, '273.15')
+        self.assertIs(registry.transform('C', 'K'), registry.transform('C', 'K'))
+        self.assertEqual(registry.convert(1, 'C', 'K'), 274.15)
+        registry.register('C', 2, 0)
+        self.assertEqual(registry.transform('C', 'K'), (2.0, 0.0))
+        self.assertEqual(registry.convert(1, 'C', 'K'), 2)
+
+
+class TestConvertTextFile(unittest.TestCase):
+    """Test cases for converting text files, run with whatever backend is installed."""
+
+    def setUp(self):
+        """Create a scratch directory for input and output files."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.input_path = os.path.join(directory.name, "input.txt")
+        self.output_path = os.path.join(directory.name, "output.txt")
+
+    def convert(self, text, *args, **kwargs):
+        """Write text to the input file and convert it."""
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write(text)
+        return convert_text_file(self.input_path, self.output_path, *args, **kwargs)
+
+    def read_output(self):
+        """Return the lines of the output file."""
+        with open(self.output_path, encoding="utf-8") as file:
+            return file.read().splitlines()
+
+    def test_converts_every_line(self):
+        """Blank lines are skipped and values are written one per line."""
+        self.assertEqual(self.convert("32\n\n 212 \n-40\n1_000\n", "F"), 4)
+        self.assertEqual(self.read_output(), ["0.0", "100.0", "-40.0", "537.7777777777777"])
+
+    def test_skips_header(self):
+        """A header on the first non-blank line is skipped."""
+        self.assertEqual(self.convert("\ncelsius\n100\n", "C", to_unit="K"), 1)
+        self.assertEqual(self.read_output(), ["373.15"])
+
+    def test_small_chunks(self):
+        """Values split across many chunks still convert in order."""
+        values = [str(value) for value in range(-50, 50)]
+        self.assertEqual(self.convert("temp\n" + "\n".join(values) + "\n", "C", chunk_size=1), 100)
+        to_fahrenheit = TEMPERATURE_UNITS.converter("C", "F")
+        self.assertEqual(self.read_output(),
+                         [str(to_fahrenheit(value)) for value in range(-50, 50)])
+
+    def test_header_filling_first_chunk(self):
+        """A header read on its own in the first chunk does not end the file early."""
+        self.assertEqual(self.convert("temperature_celsius\n0\n100\n", "C", chunk_size=1), 2)
+        self.assertEqual(self.read_output(), ["32.0", "212.0"])
+
+    def test_header_after_blank_chunks(self):
+        """A header after whole chunks of blank lines is still skipped."""
+        self.assertEqual(self.convert("\n" * 100 + "celsius\n\n" + "\n" * 100 + "0\n", "C",
+                                      chunk_size=1), 1)
+        self.assertEqual(self.read_output(), ["32.0"])
+
+    def test_blank_chunks_do_not_warn(self):
+        """Chunks holding only blank lines convert to nothing, silently."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            self.assertEqual(self.convert("0\n" + "\n" * 200 + "100\n", "C", chunk_size=1), 2)
+            self.assertEqual(self.convert("\n" * 50, "C", chunk_size=1), 0)
+        self.assertEqual(self.read_output(), [])
+
+    def test_bad_line(self):
+        """A bad line is reported by number and leaves no output file behind."""
+        with self.assertRaisesRegex(ValueError, r"line 4: not a number: '1 2'"):
+            self.convert("temp\n10\n\n1 2\n30\n", "C")
+        self.assertFalse(os.path.exists(self.output_path))
+        self.assertFalse(os.path.exists(self.output_path + ".tmp"))
+
+    def test_bad_line_keeps_old_output(self):
+        """A failed conversion leaves an existing output file untouched."""
+        with open(self.output_path, "w", encoding="utf-8") as file:
+            file.write("old\n")
+        with self.assertRaises(ValueError):
+            self.convert("10\nwarm\n", "C")
+        self.assertEqual(self.read_output(), ["old"])
+
+    def test_command_line_reports_bad_line(self):
+        """stream_main reports a bad line as a usage error."""
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write("10\nwarm\n")
+        stderr = io.StringIO()
+        with redirect_stderr(stderr), self.assertRaises(SystemExit) as raised:
+            stream_main([self.input_path, self.output_path, "--from-unit", "C"])
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn("line 2: not a number: 'warm'", stderr.getvalue())
+
+    def test_command_line_units(self):
+        """Unit options take names and aliases, and need --to-unit outside C and F."""
+        with open(self.input_path, "w", encoding="utf-8") as file:
+            file.write("491.67\n")
+        with redirect_stdout(io.StringIO()):
+            stream_main([self.input_path, self.output_path,
+                         "--from-unit", "rankine", "--to-unit", "Celsius"])
+        self.assertEqual([round(float(line), 9) for line in self.read_output()], [0.0])
+        for argv in (["--from-unit", "K"], ["--from-unit", "kelvinn", "--to-unit", "C"]):
+            with self.subTest(argv=argv):
+                stderr = io.StringIO()
+                with redirect_stderr(stderr), self.assertRaises(SystemExit) as raised:
+                    stream_main([self.input_path, self.output_path, *argv])
+                self.assertEqual(raised.exception.code, 2)
+
+
+class TestConvertBinaryFile(unittest.TestCase):
+    """Test cases for converting binary dumps."""
+
+    def setUp(self):
+        """Create a scratch directory for input and output files."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.input_path = os.path.join(directory.name, "input.bin")
+        self.output_path = os.path.join(directory.name, "output.bin")
+
+    def test_converts_and_replaces_output(self):
+        """Values are converted in chunks and replace the old output file."""
+        with open(self.output_path, "wb") as file:
+            file.write(b"old")
+        with open(self.input_path, "wb") as file:
+            array('d', [0.0, 100.0, -40.0]).tofile(file)
+        self.assertEqual(convert_binary_file(self.input_path, self.output_path, "C",
+                                             chunk_size=2), 3)
+        converted = array('d')
+        with open(self.output_path, "rb") as file:
+            converted.frombytes(file.read())
+        self.assertEqual(list(converted), [32.0, 212.0, -40.0])
+        self.assertEqual(sorted(os.listdir(os.path.dirname(self.output_path))),
+                         ["input.bin", "output.bin"])
+
+    def test_failure_keeps_old_output(self):
+        """A conversion that fails part way leaves the old output untouched."""
+        with open(self.output_path, "wb") as file:
+            file.write(b"old")
+        with open(self.input_path, "wb") as file:
+            array('d', [0.0] * 10).tofile(file)
+        with mock.patch.object(temp_conversion_tool, "_convert_chunk",
+                               side_effect=[array('d', [1.0]), OSError("disk full")]):
+            with self.assertRaises(OSError):
+                convert_binary_file(self.input_path, self.output_path, "C", chunk_size=5)
+        with open(self.output_path, "rb") as file:
+            self.assertEqual(file.read(), b"old")
+        self.assertFalse(os.path.exists(self.output_path + ".tmp"))
+
+
+@unittest.skipIf(NUMPY is None, "the stdlib fallback is already tested")
+class TestConvertTextFileWithoutNumPy(TestConvertTextFile):
+    """Runs the text file test cases against the stdlib fallback."""
+
+    def setUp(self):
+        """Hide NumPy from temp_conversion_tool for the duration of each test."""
+        patcher = mock.patch.object(temp_conversion_tool, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+
+if __name__ == '__main__':
+    unittest.main()
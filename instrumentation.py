@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Opt-in instrumentation for the project's hot entry points.
+
+An Instrumentation object wraps chosen functions and methods and records,
+per operation, how often it was called, how often it failed (and why) and
+a histogram of how long it took. Nothing is wrapped until install() or
+install_defaults() is called, and uninstall() puts the original functions
+back, so code runs untouched while instrumentation is off.
+
+Each thread records into its own buffer, so recording takes no locks.
+snapshot() adds the buffers up; numbers from threads that are still
+running may be a call or two behind. When a thread ends, its buffer is
+folded into a running total, so short-lived threads do not pile up.
+Snapshots can be written as Prometheus text or JSON, once or
+periodically from a background thread.
+
+    instrumentation = Instrumentation()
+    instrumentation.install_defaults()
+    instrumentation.start_export("metrics.prom", interval=10)
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from functools import wraps
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Upper bounds of the latency histogram buckets, in seconds. Slower calls
+# fall in a final +Inf bucket.
+DEFAULT_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                   1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+
+FORMATS = ('prometheus', 'json')
+
+
+def _divide_error(result):
+    if isinstance(result, str):
+        return 'divide_by_zero' if 'divide by zero' in result else 'invalid_operation'
+    return None
+
+
+def _when_false(error):
+    """Error classifier for methods that return False on failure"""
+    return lambda result: error if result is False else None
+
+
+def _fold(totals, buffer):
+    """Add a buffer's entries into totals of the same shape"""
+    for operation, (calls, seconds, buckets, errors) in list(buffer.items()):
+        total = totals.get(operation)
+        if total is None:
+            total = totals[operation] = [0, 0.0, [0] * len(buckets), {}]
+        total[0] += calls
+        total[1] += seconds
+        total[2] = [a + b for a, b in zip(total[2], buckets)]
+        total_errors = total[3]
+        for error, count in list(errors.items()):
+            total_errors[error] = total_errors.get(error, 0) + count
+
+
+def _retire(lock, buffers, retired, buffer):
+    """Fold the buffer of a thread that has ended into the retired totals"""
+    with lock:
+        del buffers[id(buffer)]
+        _fold(retired, buffer)
+
+
+class _ThreadToken:
+    """Lives in a thread's local storage, so it is freed when the thread ends"""
+
+    __slots__ = ('__weakref__',)
+
+
+def _default_targets():
+    """(owner, attribute, operation, classify) for the default entry points"""
+    for directory in ('fns_and_dsa', 'programming_paradigm'):
+        path = os.path.join(ROOT, directory)
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    import arithmetic_operations
+    from bank_account import AccountView, BankAccount
+    from library_management import CompactLibrary, Library
+
+    # ConcurrentLibrary calls Library's methods, so it is covered by them.
+    targets = [(arithmetic_operations, 'perform_operation', 'perform_operation', _divide_error)]
+    for owner in (BankAccount, AccountView):
+        targets += [
+            (owner, 'deposit', f'{owner.__name__}.deposit', None),
+            (owner, 'withdraw', f'{owner.__name__}.withdraw', _when_false('insufficient_funds')),
+        ]
+    for owner in (Library, CompactLibrary):
+        targets += [
+            (owner, 'check_out_book', f'{owner.__name__}.check_out_book',
+             _when_false('book_unavailable')),
+            (owner, 'return_book', f'{owner.__name__}.return_book',
+             _when_false('book_not_checked_out')),
+        ]
+    return targets
+
+
+class Instrumentation:
+    """Call counts, error counts and latency histograms per operation."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """Create an instrumentation that has not wrapped anything yet.
+
+        Args:
+            buckets (sequence): Increasing upper bounds of the latency
+                histogram buckets, in seconds.
+        """
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._buffers = {}  # id -> buffer, for threads still running
+        self._retired = {}  # the buffers of threads that have ended, added up
+        self._buffers_lock = threading.Lock()
+        self._installed = []
+        self._exporter = None
+        self._stop_export = None
+
+    def _buffer(self):
+        """This thread's buffer: operation -> [calls, seconds, buckets, errors]"""
+        try:
+            return self._local.buffer
+        except AttributeError:
+            buffer = self._local.buffer = {}
+            # Taken once per thread, never while recording.
+            with self._buffers_lock:
+                self._buffers[id(buffer)] = buffer
+            # Only the shared containers are passed, so threads that are
+            # still running do not keep this object alive.
+            token = self._local.token = _ThreadToken()
+            weakref.finalize(token, _retire, self._buffers_lock, self._buffers,
+                             self._retired, buffer).atexit = False
+            return buffer
+
+    def record(self, operation, seconds, error=None):
+        """Record one call.
+
+        Args:
+            operation (str): Name of the operation.
+            seconds (float): How long the call took.
+            error (str): Kind of failure, or None if the call succeeded.
+        """
+        buffer = self._buffer()
+        entry = buffer.get(operation)
+        if entry is None:
+            entry = buffer[operation] = [0, 0.0, [0] * (len(self.buckets) + 1), {}]
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2][bisect_left(self.buckets, seconds)] += 1
+        if error is not None:
+            errors = entry[3]
+            errors[error] = errors.get(error, 0) + 1
+
+    def wrap(self, function, operation, classify=None):
+        """Wrap a function so every call is recorded.
+
+        Args:
+            function (callable): The function to wrap.
+            operation (str): Name to record the calls under.
+            classify (callable): Takes the function's result and returns an
+                error kind, or None for success. Raised exceptions are
+                recorded as errors named after their class and re-raised.
+
+        Returns:
+            callable: The wrapper.
+        """
+        record = self.record
+        clock = time.perf_counter
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as exception:
+                record(operation, clock() - start, type(exception).__name__)
+                raise
+            record(operation, clock() - start,
+                   None if classify is None else classify(result))
+            return result
+        return wrapper
+
+    def install(self, owner, attribute, operation=None, classify=None):
+        """Replace a module function or class method with a recording wrapper.
+
+        Code that imported the function by name before this call keeps
+        using the original.
+
+        Args:
+            owner (module or class): Where the function is defined.
+            attribute (str): Its name.
+            operation (str): Name to record calls under; defaults to
+                "owner.attribute".
+            classify (callable): As for wrap.
+        """
+        if operation is None:
+            operation = f"{owner.__name__}.{attribute}"
+        original = owner.__dict__[attribute]
+        setattr(owner, attribute, self.wrap(original, operation, classify))
+        self._installed.append((owner, attribute, original))
+
+    def install_defaults(self):
+        """Instrument perform_operation, BankAccount and AccountView deposits
+        and withdrawals, and Library and CompactLibrary check-outs and returns.
+        """
+        for owner, attribute, operation, classify in _default_targets():
+            self.install(owner, attribute, operation, classify)
+
+    def uninstall(self):
+        """Put back every function replaced by install, newest first."""
+        while self._installed:
+            owner, attribute, original = self._installed.pop()
+            setattr(owner, attribute, original)
+
+    def snapshot(self):
+        """Add up the per-thread buffers.
+
+        Returns:
+            dict: operation -> {'calls', 'errors' (kind -> count),
+                'seconds' (total), 'buckets' (count per bucket, the last
+                one being +Inf)}
+        """
+        totals = {}
+        with self._buffers_lock:
+            # Together, so a thread ending now is counted exactly once.
+            _fold(totals, self._retired)
+            buffers = list(self._buffers.values())
+        for buffer in buffers:
+            _fold(totals, buffer)
+        return {operation: {'calls': calls, 'errors': errors, 'seconds': seconds,
+                            'buckets': buckets}
+                for operation, (calls, seconds, buckets, errors) in totals.items()}
+
+    def to_prometheus(self, snapshot=None):
+        """Render a snapshot in the Prometheus text exposition format.
+
+        Args:
+            snapshot (dict): As returned by snapshot(); None takes a new one.
+
+        Returns:
+            str: The metrics text.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        lines = ["# TYPE operation_calls_total counter"]
+        for operation, totals in sorted(snapshot.items()):
+            lines.append(f'operation_calls_total{{operation="{operation}"}} {totals["calls"]}')
+        lines.append("# TYPE operation_errors_total counter")
+        for operation, totals in sorted(snapshot.items()):
+            for error, count in sorted(totals['errors'].items()):
+                lines.append(f'operation_errors_total{{operation="{operation}",'
+                             f'error="{error}"}} {count}')
+        lines.append("# TYPE operation_latency_seconds histogram")
+        bounds = [repr(bound) for bound in self.buckets] + ['+Inf']
+        for operation, totals in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, totals['buckets']):
+                cumulative += count
+                lines.append(f'operation_latency_seconds_bucket{{operation="{operation}",'
+                             f'le="{bound}"}} {cumulative}')
+            lines.append(f'operation_latency_seconds_sum{{operation="{operation}"}} '
+                         f'{totals["seconds"]!r}')
+            lines.append(f'operation_latency_seconds_count{{operation="{operation}"}} '
+                         f'{totals["calls"]}')
+        return '\n'.join(lines) + '\n'
+
+    def to_json(self, snapshot=None):
+        """Render a snapshot as JSON.
+
+        Args:
+            snapshot (dict): As returned by snapshot(); None takes a new one.
+
+        Returns:
+            str: A JSON object with the time of the snapshot, the bucket
+                bounds and the totals per operation.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        return json.dumps({'timestamp': time.time(), 'buckets': list(self.buckets) + ['+Inf'],
+                           'operations': snapshot}, indent=2, sort_keys=True) + '\n'
+
+    def export(self, path, format='prometheus'):
+        """Write a snapshot to a file, replacing it atomically.
+
+        Args:
+            path (str): File to write.
+            format (str): 'prometheus' or 'json'.
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}; expected one of {', '.join(FORMATS)}.")
+        text = self.to_prometheus() if format == 'prometheus' else self.to_json()
+        temporary = path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as file:
+            file.write(text)
+        os.replace(temporary, path)
+
+    def start_export(self, path, interval=10.0, format='prometheus'):
+        """Export a snapshot every interval seconds from a daemon thread.
+
+        Args:
+            path (str): File to write.
+            interval (float): Seconds between exports.
+            format (str): 'prometheus' or 'json'.
+        """
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format {format!r}; expected one of {', '.join(FORMATS)}.")
+        self.stop_export()
+        stop = self._stop_export = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.export(path, format)
+            self.export(path, format)
+
+        self._exporter = threading.Thread(target=run, name="instrumentation-export", daemon=True)
+        self._exporter.start()
+
+    def stop_export(self):
+        """Stop periodic exports, after writing one last snapshot."""
+        if self._exporter is not None:
+            self._stop_export.set()
+            self._exporter.join()
+            self._exporter = self._stop_export = None
@@ -1,5 +1,125 @@
+import operator
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from itertools import count, repeat
+from numbers import Real
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; AccountBook falls back to array('d')
+    np = None
+
+# Gives every account a fixed position in the lock order used by transfer().
+_lock_order = count()
+
+
+class Ledger:
+    """An append-only record of postings with precomputed running balances.
+
+    Postings are stored in three parallel arrays (timestamps, signed amounts
+    and the balance after each posting), so the balance at any point in time
+    is a binary search rather than a replay.
+    """
+
+    def __init__(self, opening_balance=0):
+        """Initialize an empty ledger.
+
+        Args:
+            opening_balance (float): Balance before the first posting.
+        """
+        self.opening_balance = opening_balance
+        self._timestamps = array("d")
+        self._amounts = array("d")
+        self._balances = array("d")
+
+    def __len__(self):
+        return len(self._amounts)
+
+    def _next_timestamp(self, timestamp):
+        # Timestamps must be non-decreasing so they stay sorted for bisect.
+        last = self._timestamps[-1] if self._timestamps else None
+        if timestamp is None:
+            # The wall clock can be set back; such postings keep the last time.
+            timestamp = time.time()
+            return last if last is not None and timestamp < last else timestamp
+        if last is not None and timestamp < last:
+            raise ValueError(f"Timestamp {timestamp} is earlier than the last posting "
+                             f"({last}); postings must be recorded in time order.")
+        return timestamp
+
+    def append(self, amount, balance, timestamp=None):
+        """Record one posting.
+
+        Args:
+            amount (float): Signed amount (negative for withdrawals).
+            balance (float): Account balance after the posting.
+            timestamp (float): When it happened. Defaults to now, or to the
+                last posting's time if the clock has been set back since.
+
+        Raises:
+            ValueError: If timestamp is earlier than the last posting.
+        """
+        self._timestamps.append(self._next_timestamp(timestamp))
+        self._amounts.append(amount)
+        self._balances.append(balance)
+
+    def extend(self, amounts, balances, timestamp=None):
+        """Record many postings that share one timestamp.
+
+        Args:
+            amounts (array or list): Signed amounts.
+            balances (array or list): Account balance after each posting.
+            timestamp (float): When they happened. Defaults to now, or to the
+                last posting's time if the clock has been set back since.
+
+        Raises:
+            ValueError: If timestamp is earlier than the last posting.
+        """
+        timestamp = self._next_timestamp(timestamp)
+        self._timestamps.extend(array("d", [timestamp]) * len(amounts))
+        self._amounts.extend(amounts)
+        self._balances.extend(balances)
+
+    def balance_at(self, timestamp):
+        """Return the balance as of the given time.
+
+        Args:
+            timestamp (float): A time.time() style timestamp.
+
+        Returns:
+            float: Balance after every posting made at or before that time.
+        """
+        index = bisect_right(self._timestamps, timestamp)
+        return self._balances[index - 1] if index else self.opening_balance
+
+    def balance_after(self, count):
+        """Return the balance after the first count postings.
+
+        Args:
+            count (int): Number of postings to include.
+
+        Returns:
+            float: The running balance at that point.
+        """
+        return self._balances[count - 1] if count else self.opening_balance
+
+    def entries(self):
+        """Iterate over the recorded postings.
+
+        Yields:
+            tuple: (timestamp, amount, balance) for each posting, oldest first.
+        """
+        return zip(self._timestamps, self._amounts, self._balances)
+
+
 class BankAccount:
-    """A simple bank account class that manages deposits, withdrawals, and balance."""
+    """A simple bank account class that manages deposits, withdrawals, and balance.
+
+    Each account has its own lock, so it can be shared between threads.
+    Transfers lock both accounts in a fixed global order and cannot deadlock.
+    """
     
     def __init__(self, initial_balance=0):
         """Initialize the bank account with an optional initial balance.
@@ -8,6 +128,9 @@ class BankAccount:
             initial_balance (float): Starting balance for the account. Defaults to 0.
         """
         self.account_balance = initial_balance
+        self.ledger = Ledger(initial_balance)
+        self._lock = threading.Lock()
+        self._lock_position = next(_lock_order)
     
     def deposit(self, amount):
         """Add the specified amount to the account balance.
@@ -15,7 +138,9 @@ class BankAccount:
         Args:
             amount (float): The amount to deposit.
         """
-        self.account_balance += amount
+        with self._lock:
+            self.account_balance += amount
+            self.ledger.append(amount, self.account_balance)
     
     def withdraw(self, amount):
         """Deduct the amount from account balance if funds are sufficient.
@@ -26,11 +151,290 @@ class BankAccount:
         Returns:
             bool: True if withdrawal was successful, False if insufficient funds.
         """
-        if amount <= self.account_balance:
+        with self._lock:
+            if amount <= self.account_balance:
+                self.account_balance -= amount
+                self.ledger.append(-amount, self.account_balance)
+                return True
+            return False
+
+    def transfer(self, destination, amount):
+        """Move money to another account if funds are sufficient.
+
+        Both accounts are locked for the whole transfer, always in the same
+        global order, so concurrent transfers in opposite directions cannot
+        deadlock and money is never created or lost.
+
+        Args:
+            destination (BankAccount): The account to credit.
+            amount (float): The amount to move.
+
+        Returns:
+            bool: True if the transfer was made, False if insufficient funds.
+
+        Raises:
+            ValueError: If amount is not positive; a negative transfer would
+                debit the destination without checking its funds.
+        """
+        if not amount > 0:
+            raise ValueError(f"Transfer amount must be positive, got {amount!r}.")
+        if destination is self:
+            with self._lock:
+                return amount <= self.account_balance
+        first, second = sorted((self, destination), key=lambda account: account._lock_position)
+        with first._lock, second._lock:
+            if amount > self.account_balance:
+                return False
             self.account_balance -= amount
+            self.ledger.append(-amount, self.account_balance)
+            destination.account_balance += amount
+            destination.ledger.append(amount, destination.account_balance)
             return True
-        return False
+
+    def apply_batch(self, postings, timestamp=None):
+        """Apply many deposits and withdrawals in order.
+
+        Withdrawals follow the same rule as withdraw(): they only go through
+        if the balance at that point in the batch covers them. Successful
+        postings are added to the ledger in one step at the end.
+
+        Args:
+            postings (iterable): ("deposit" or "withdraw", amount) pairs.
+            timestamp (float): Ledger time for the batch. Defaults to now.
+
+        Returns:
+            list: One bool per posting, True if it was applied.
+
+        Raises:
+            ValueError: If a posting names an unknown operation, or timestamp
+                is earlier than the ledger's last posting. Nothing in the
+                batch is applied in that case.
+        """
+        with self._lock:
+            balance = self.account_balance
+            amounts = array("d")
+            balances = array("d")
+            applied = []
+            for operation, amount in postings:
+                if operation == "deposit":
+                    ok = True
+                elif operation == "withdraw":
+                    ok = amount <= balance
+                    amount = -amount
+                else:
+                    raise ValueError(f"Unknown operation: {operation!r}")
+                if ok:
+                    balance += amount
+                    amounts.append(amount)
+                    balances.append(balance)
+                applied.append(ok)
+            self.ledger.extend(amounts, balances, timestamp)
+            self.account_balance = balance
+            return applied
     
     def display_balance(self):
         """Print the current account balance in a user-friendly format."""
-        print(f"Current Balance: ${self.account_balance:.2f}")
\ No newline at end of file
+        print(f"Current Balance: ${self.account_balance:.2f}")
+
+
+class AccountView:
+    """A BankAccount-compatible handle on one account of an AccountBook.
+
+    The balance lives in the book's shared array; the view only remembers
+    which slot it refers to.
+    """
+
+    __slots__ = ("_book", "_index")
+
+    def __init__(self, book, index):
+        """Initialize a view over one account.
+
+        Args:
+            book (AccountBook): The book holding the balance.
+            index (int): The account's position in the book.
+        """
+        self._book = book
+        self._index = index
+
+    @property
+    def account_balance(self):
+        """float: The current balance, read from the book."""
+        return float(self._book._balances[self._index])
+
+    @account_balance.setter
+    def account_balance(self, value):
+        self._book._balances[self._index] = value
+
+    def deposit(self, amount):
+        """Add the specified amount to the account balance.
+
+        Args:
+            amount (float): The amount to deposit.
+        """
+        self._book._balances[self._index] += amount
+
+    def withdraw(self, amount):
+        """Deduct the amount from account balance if funds are sufficient.
+
+        Args:
+            amount (float): The amount to withdraw.
+
+        Returns:
+            bool: True if withdrawal was successful, False if insufficient funds.
+        """
+        balances = self._book._balances
+        if amount <= balances[self._index]:
+            balances[self._index] -= amount
+            return True
+        return False
+
+    def display_balance(self):
+        """Print the current account balance in a user-friendly format."""
+        print(f"Current Balance: ${self.account_balance:.2f}")
+
+
+class AccountBook:
+    """Balances for many accounts, stored in one contiguous array.
+
+    Deposits, withdrawals and interest can be applied to every account in a
+    single call, which runs as bulk array operations instead of one method
+    call per account: NumPy ufuncs when NumPy is installed, otherwise
+    map() over an array('d'). Individual accounts are reached through
+    AccountView handles.
+    """
+
+    def __init__(self, balances=()):
+        """Initialize the book with optional opening balances.
+
+        Args:
+            balances (iterable): Opening balance of each account.
+        """
+        if np is None:
+            self._balances = array("d", balances)
+            return
+        if not hasattr(balances, "__len__"):
+            balances = list(balances)
+        # _storage has spare room at the end so open_account does not copy
+        # every balance; _balances is a view of the slots in use.
+        self._storage = np.array(balances, dtype=np.float64).reshape(-1)
+        self._balances = self._storage[:]
+
+    def __len__(self):
+        return len(self._balances)
+
+    def _per_account(self, values):
+        # A single number applies to every account; otherwise one per account.
+        if isinstance(values, Real):
+            return values if np is not None else repeat(values)
+        if len(values) != len(self._balances):
+            raise ValueError(f"Expected {len(self._balances)} values, got {len(values)}.")
+        return np.asarray(values, dtype=np.float64) if np is not None else values
+
+    def open_account(self, initial_balance=0):
+        """Add an account to the book.
+
+        Args:
+            initial_balance (float): Starting balance for the account.
+
+        Returns:
+            AccountView: A handle on the new account.
+        """
+        index = len(self._balances)
+        if np is None:
+            self._balances.append(initial_balance)
+        else:
+            if index == len(self._storage):
+                storage = np.empty(max(8, 2 * index), dtype=np.float64)
+                storage[:index] = self._balances
+                self._storage = storage
+            self._storage[index] = initial_balance
+            self._balances = self._storage[:index + 1]
+        return AccountView(self, index)
+
+    def account(self, index):
+        """Return a handle on an existing account.
+
+        Args:
+            index (int): The account's position in the book.
+
+        Returns:
+            AccountView: A handle on that account.
+        """
+        if not -len(self._balances) <= index < len(self._balances):
+            raise IndexError("account index out of range")
+        return AccountView(self, index % len(self._balances))
+
+    def balances(self):
+        """Return a copy of every balance.
+
+        Returns:
+            ndarray or array: The balances, in account order; an ndarray
+                with NumPy, otherwise an array('d').
+        """
+        if np is not None:
+            return self._balances.copy()
+        return array("d", self._balances)
+
+    def total(self):
+        """Return the sum of every balance.
+
+        Returns:
+            float: The total held across all accounts.
+        """
+        if np is not None:
+            return float(self._balances.sum())
+        return sum(self._balances)
+
+    def deposit(self, amounts):
+        """Deposit into every account at once.
+
+        Args:
+            amounts (float or sequence): One amount for all accounts, or one
+                amount per account.
+        """
+        if np is not None:
+            self._balances += self._per_account(amounts)
+            return
+        self._balances[:] = array("d", map(operator.add, self._balances,
+                                           self._per_account(amounts)))
+
+    def withdraw(self, amounts):
+        """Withdraw from every account at once.
+
+        As with BankAccount.withdraw, an account is only debited if its
+        balance covers the amount; other accounts are left unchanged.
+
+        Args:
+            amounts (float or sequence): One amount for all accounts, or one
+                amount per account.
+
+        Returns:
+            ndarray or list: One bool per account, True where the withdrawal
+                went through; an ndarray with NumPy, otherwise a list.
+        """
+        if np is not None:
+            amounts = self._per_account(amounts)
+            applied = amounts <= self._balances
+            self._balances -= np.where(applied, amounts, 0.0)
+            return applied
+        applied = list(map(operator.le, self._per_account(amounts), self._balances))
+        self._balances[:] = array("d", [
+            balance - amount if ok else balance
+            for balance, amount, ok in zip(self._balances, self._per_account(amounts), applied)])
+        return applied
+
+    def apply_interest(self, rates):
+        """Grow every balance by an interest rate.
+
+        Args:
+            rates (float or sequence): One rate for all accounts, or one rate
+                per account (0.05 means 5%).
+        """
+        if np is not None:
+            self._balances *= 1 + self._per_account(rates)
+            return
+        if isinstance(rates, Real):
+            factors = repeat(1 + rates)
+        else:
+            factors = map(operator.add, repeat(1), self._per_account(rates))
+        self._balances[:] = array("d", map(operator.mul, self._balances, factors))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for concurrent BankAccount transfers.
+Checks that total money is conserved and reports transfers per second as
+the number of threads grows.
+"""
+
+import argparse
+import random
+import threading
+import time
+from bank_account import BankAccount
+
+
+def run_transfers(threads, accounts_per_thread=100, transfers=50_000, disjoint=True):
+    """Run random transfers from several threads and check the books balance.
+
+    Args:
+        threads (int): Number of threads making transfers.
+        accounts_per_thread (int): Accounts created per thread.
+        transfers (int): Transfers made by each thread.
+        disjoint (bool): If True, each thread only touches its own accounts;
+            otherwise every thread picks from all accounts.
+
+    Returns:
+        tuple: (transfers per second, True if total money was conserved).
+    """
+    accounts = [BankAccount(1_000) for _ in range(threads * accounts_per_thread)]
+    expected_total = sum(account.account_balance for account in accounts)
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index):
+        rng = random.Random(index)
+        pool = (accounts[index * accounts_per_thread:(index + 1) * accounts_per_thread]
+                if disjoint else accounts)
+        barrier.wait()
+        for _ in range(transfers):
+            source, destination = rng.sample(pool, 2)
+            source.transfer(destination, rng.randint(1, 500))
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    total = sum(account.account_balance for account in accounts)
+    return threads * transfers / seconds, total == expected_total
+
+
+def main():
+    """Run the transfer benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="thread counts to try")
+    parser.add_argument("--transfers", type=int, default=50_000,
+                        help="transfers per thread (default: 50,000)")
+    args = parser.parse_args()
+
+    print("Concurrent transfers:")
+    for disjoint in (True, False):
+        label = "disjoint accounts" if disjoint else "shared accounts"
+        for threads in args.threads:
+            rate, conserved = run_transfers(threads, transfers=args.transfers, disjoint=disjoint)
+            print(f"  {label:<17} {threads:>3} threads: {rate:12,.0f} transfers/s, "
+                  f"money conserved: {'yes' if conserved else 'NO'}")
+
+
+if __name__ == "__main__":
+    main()
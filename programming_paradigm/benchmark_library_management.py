@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Library classes.
+Reports the memory used per catalog record by each storage layout, how
+long each way of loading a catalog takes, and how concurrent check-outs
+scale with the number of threads.
+
+The race for copies is only run against ConcurrentLibrary. Library claims a
+copy by popping it off a heap, which is a single step under the GIL, so a
+zero for Library shows nothing about its thread-safety; it is not reported.
+"""
+
+import argparse
+import csv
+import gc
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from library_management import Book, CompactLibrary, ConcurrentLibrary, Library
+
+
+def make_records(count, copies_per_title=3, titles_per_author=10):
+    """Build (title, author) pairs for a synthetic catalog.
+
+    Args:
+        count (int): Number of records to build.
+        copies_per_title (int): How many copies share each title.
+        titles_per_author (int): How many titles each author has written.
+
+    Returns:
+        list: (title, author) tuples. Strings are shared between copies.
+    """
+    titles = [f"Title {i}" for i in range(count // copies_per_title + 1)]
+    authors = [f"Author {i}" for i in range(len(titles) // titles_per_author + 1)]
+    return [(titles[i // copies_per_title], authors[i // copies_per_title // titles_per_author])
+            for i in range(count)]
+
+
+def _measure(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        library = build()
+        used, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return library, used
+
+
+def bytes_per_record(records):
+    """Measure the memory each storage layout needs per record.
+
+    String data is created before measuring, so only the cost of the
+    layout itself is counted.
+
+    Args:
+        records (list): (title, author) tuples from make_records().
+
+    Returns:
+        dict: Bytes per record, keyed by layout name.
+    """
+    def build_objects():
+        library = Library()
+        for title, author in records:
+            library.add_book(Book(title, author))
+        return library
+
+    def build_columns():
+        library = CompactLibrary()
+        for title, author in records:
+            library.add_record(title, author)
+        return library
+
+    results = {}
+    for name, build in (("Library", build_objects), ("CompactLibrary", build_columns)):
+        library, used = _measure(build)
+        results[name] = used / len(records)
+        del library
+    return results
+
+
+def load_times(records):
+    """Time the ways of filling a library from disk.
+
+    Args:
+        records (list): (title, author) tuples from make_records().
+
+    Returns:
+        dict: Seconds taken, keyed by loader name.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "books.csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("title", "author"))
+            writer.writerows(records)
+
+        for name, load in (("Library.from_csv", lambda: Library.from_csv(csv_path)),
+                           ("CompactLibrary.from_csv",
+                            lambda: CompactLibrary.from_csv(csv_path))):
+            start = time.perf_counter()
+            library = load()
+            results[name] = time.perf_counter() - start
+
+        snapshot_path = os.path.join(directory, "books.snapshot")
+        library.save_snapshot(snapshot_path)
+        del library
+        start = time.perf_counter()
+        CompactLibrary.load_snapshot(snapshot_path).check_out_book(records[0][0])
+        results["CompactLibrary.load_snapshot"] = time.perf_counter() - start
+    return results
+
+
+def _run_threads(threads, target):
+    barrier = threading.Barrier(threads + 1)
+    results = [None] * threads
+
+    def worker(index):
+        barrier.wait()
+        results[index] = target(index)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return results, time.perf_counter() - start
+
+
+def count_double_checkouts(library_class, threads, titles=100, copies=5, attempts=2_000,
+                           switch_interval=1e-6):
+    """Race threads for a fixed pool of copies and count extra check-outs.
+
+    No book is returned, so at most titles * copies check-outs can succeed;
+    anything above that means two threads got the same copy. The
+    interpreter's switch interval is lowered for the race, so threads are
+    switched as often as possible inside each check-out.
+
+    Args:
+        library_class (type): The Library class to test.
+        threads (int): Number of threads checking out books.
+        titles (int): Number of distinct titles.
+        copies (int): Copies of each title.
+        attempts (int): Check-out attempts per thread.
+        switch_interval (float): Switch interval in seconds during the race.
+
+    Returns:
+        int: How many check-outs succeeded beyond the number of copies.
+    """
+    library = library_class()
+    library.add_records((f"Title {t}", "Author") for t in range(titles) for _ in range(copies))
+
+    def target(index):
+        rng = random.Random(index)
+        return sum(library.check_out_book(f"Title {rng.randrange(titles)}")
+                   for _ in range(attempts))
+
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(switch_interval)
+    try:
+        successes, _ = _run_threads(threads, target)
+    finally:
+        sys.setswitchinterval(previous)
+    return sum(successes) - titles * copies
+
+
+def checkout_throughput(library_class, threads, titles=10_000, operations=50_000):
+    """Measure check-out/return pairs per second across threads.
+
+    Args:
+        library_class (type): The Library class to test.
+        threads (int): Number of threads.
+        titles (int): Number of distinct titles, one copy each.
+        operations (int): Check-out/return pairs per thread.
+
+    Returns:
+        float: Check-out/return pairs completed per second.
+    """
+    library = library_class()
+    names = [f"Title {t}" for t in range(titles)]
+    library.add_records((name, "Author") for name in names)
+
+    def target(index):
+        rng = random.Random(index)
+        for _ in range(operations):
+            title = names[rng.randrange(titles)]
+            if library.check_out_book(title):
+                library.return_book(title)
+
+    _, seconds = _run_threads(threads, target)
+    return threads * operations / seconds
+
+
+def main():
+    """Run the benchmarks and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=1_000_000,
+                        help="number of catalog records (default: 1,000,000)")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="thread counts for the concurrency benchmark")
+    args = parser.parse_args()
+    records = make_records(args.records)
+
+    results = bytes_per_record(records)
+    print(f"Memory per record ({args.records:,} records):")
+    for name, used in results.items():
+        print(f"  {name:<15} {used:8.1f} bytes")
+    print(f"  Reduction       {results['Library'] / results['CompactLibrary']:8.1f}x")
+
+    print(f"Load time ({args.records:,} records):")
+    for name, seconds in load_times(records).items():
+        print(f"  {name:<29} {seconds * 1000:10.1f} ms")
+
+    print("Concurrent check-outs (ConcurrentLibrary):")
+    for threads in args.threads:
+        extra = count_double_checkouts(ConcurrentLibrary, threads)
+        rate = checkout_throughput(ConcurrentLibrary, threads)
+        print(f"  {threads:>3} threads: {rate:12,.0f} pairs/s, double check-outs {extra}")
+
+
+if __name__ == "__main__":
+    main()
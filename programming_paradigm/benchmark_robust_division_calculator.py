@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing safe_divide called once per row with the batch
+safe_divide_many, on string columns like those read from an upload.
+"""
+
+import argparse
+import random
+import time
+from robust_division_calculator import division_messages, safe_divide, safe_divide_many
+
+
+def make_columns(count, bad_fraction=0.05, seed=0):
+    """Build numerator and denominator columns of strings.
+
+    Args:
+        count (int): Number of rows.
+        bad_fraction (float): Share of rows with a non-numeric or zero value.
+        seed (int): Random seed.
+
+    Returns:
+        tuple: (numerators, denominators) as lists of strings.
+    """
+    rng = random.Random(seed)
+    bad_tokens = ["", "n/a", "abc", "0", "0.0"]
+    numerators = [f"{rng.uniform(-1000, 1000):.2f}" for _ in range(count)]
+    denominators = [rng.choice(bad_tokens) if rng.random() < bad_fraction
+                    else str(rng.randint(1, 500)) for _ in range(count)]
+    return numerators, denominators
+
+
+def _rate(count, function):
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print rows per second for each path."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000,
+                        help="number of rows (default: 1,000,000)")
+    args = parser.parse_args()
+    numerators, denominators = make_columns(args.rows)
+
+    cases = {
+        "safe_divide per row": lambda: list(map(safe_divide, numerators, denominators)),
+        "safe_divide_many": lambda: safe_divide_many(numerators, denominators),
+        "safe_divide_many + messages": lambda: division_messages(
+            *safe_divide_many(numerators, denominators)),
+    }
+    print(f"Rows per second ({args.rows:,} rows):")
+    for name, function in cases.items():
+        print(f"  {name:<28} {_rate(args.rows, function):14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,33 @@
+import csv
+import heapq
+import json
+import mmap
+import struct
+import sys
+import threading
+from array import array
+from contextlib import ExitStack
+from itertools import compress
+
+_TRUE_STRINGS = frozenset(("1", "true", "yes", "y"))
+
+
+def _parse_flag(value):
+    """Interpret a CSV/JSON checked-out field as a bool."""
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_STRINGS
+    return bool(value)
+
+
 class Book:
-    """Represents a book in the library with title, author, and availability status."""
+    """Represents a book in the library with title, author, and availability status.
+
+    A book remembers the Library (or, if shared, the tuple of libraries) it
+    was added to, and tells it when it is checked out or returned directly,
+    so the library's indexes stay in step with the book.
+    """
+
+    __slots__ = ("title", "author", "_is_checked_out", "_library")
     
     def __init__(self, title, author):
         """Initialize a book with title and author.
@@ -11,14 +39,39 @@ class Book:
         self.title = title
         self.author = author
         self._is_checked_out = False
+        self._library = None
     
     def check_out(self):
         """Mark the book as checked out."""
-        self._is_checked_out = True
+        if not self._is_checked_out:
+            self._is_checked_out = True
+            self._notify()
     
     def return_book(self):
         """Mark the book as returned (available)."""
-        self._is_checked_out = False
+        if self._is_checked_out:
+            self._is_checked_out = False
+            self._notify()
+
+    def _notify(self):
+        library = self._library
+        if library is None:
+            return
+        if isinstance(library, tuple):
+            for owner in library:
+                owner._book_changed(self)
+        else:
+            library._book_changed(self)
+
+    def _add_to(self, library):
+        """Record that the book has been added to a library."""
+        if self._library is None or self._library is library:
+            self._library = library
+        elif isinstance(self._library, tuple):
+            if library not in self._library:
+                self._library += (library,)
+        else:
+            self._library = (self._library, library)
     
     def is_available(self):
         """Check if the book is available.
@@ -30,11 +83,28 @@ class Book:
 
 
 class Library:
-    """Manages a collection of books with check-out and return functionality."""
+    """Manages a collection of books with check-out and return functionality.
+
+    Books are indexed by title and by author, and the library keeps track of
+    which copies are available, so lookups, check-outs and returns do not
+    need to scan the whole collection. Books checked out or returned
+    directly through Book.check_out() and Book.return_book() update the
+    indexes too.
+    """
     
     def __init__(self):
         """Initialize the library with an empty book collection."""
         self._books = []
+        self._by_title = {}
+        self._by_author = {}
+        # Catalog positions of available / checked-out copies, per title.
+        # Heaps keep the earliest-added copy first, matching a catalog scan.
+        # Entries go stale when a book changes state; they are dropped when
+        # they reach the top, or when a heap outgrows its title's copies.
+        self._available_by_title = {}
+        self._checked_out_by_title = {}
+        # One flag per catalog position: 1 if that copy is available.
+        self._available = bytearray()
     
     def add_book(self, book):
         """Add a book to the library collection.
@@ -42,32 +112,701 @@ class Library:
         Args:
             book (Book): A Book instance to add to the library.
         """
+        position = len(self._books)
         self._books.append(book)
+        self._by_title.setdefault(book.title, []).append(position)
+        self._by_author.setdefault(book.author, []).append(position)
+        self._available.append(0)
+        self._index(position)
+        book._add_to(self)
+
+    def _index(self, position):
+        """Bring the indexes in line with the book at position."""
+        book = self._books[position]
+        available = book.is_available()
+        self._available[position] = available
+        heaps = self._available_by_title if available else self._checked_out_by_title
+        heap = heaps.setdefault(book.title, [])
+        heapq.heappush(heap, position)
+        if len(heap) > 2 * len(self._by_title[book.title]):
+            # Mostly stale entries from books changed directly; a sorted
+            # list is a valid heap.
+            heap[:] = sorted({entry for entry in heap if self._available[entry] == available})
+
+    def _pop(self, heaps, title, available):
+        """Pop the earliest copy of title whose availability is as given, if any."""
+        heap = heaps.get(title)
+        while heap:
+            position = heapq.heappop(heap)
+            if self._available[position] == available:
+                return position
+        return None
+
+    def _book_changed(self, book):
+        """Called by a book of this library when it is checked out or returned."""
+        for position in self._by_title.get(book.title, ()):
+            if self._books[position] is book:
+                self._index(position)
+
+    def add_record(self, title, author, checked_out=False):
+        """Create a Book from its fields and add it to the collection.
+
+        Args:
+            title (str): The title of the book.
+            author (str): The author of the book.
+            checked_out (bool): Whether the copy starts out checked out.
+
+        Returns:
+            Book: The book that was added.
+        """
+        book = Book(title, author)
+        if checked_out:
+            book.check_out()
+        self.add_book(book)
+        return book
+
+    def add_records(self, records):
+        """Add many books in one pass, updating the indexes as it goes.
+
+        Args:
+            records (iterable): (title, author) or (title, author, checked_out)
+                tuples. The iterable is consumed lazily.
+
+        Returns:
+            int: The number of records added.
+        """
+        count = 0
+        add_record = self.add_record
+        for record in records:
+            add_record(*record)
+            count += 1
+        return count
+
+    @classmethod
+    def from_csv(cls, path):
+        """Build a library by streaming a CSV file.
+
+        The file needs a header row with "title" and "author" columns and
+        may have a "checked_out" column (1/true/yes for checked out).
+
+        Args:
+            path (str): Path of the CSV file.
+
+        Returns:
+            Library: A new library of the class this is called on.
+        """
+        library = cls()
+        with open(path, newline="", encoding="utf-8") as file:
+            library.add_records(
+                (row["title"], row["author"], _parse_flag(row.get("checked_out") or ""))
+                for row in csv.DictReader(file))
+        return library
+
+    @classmethod
+    def from_jsonl(cls, path):
+        """Build a library by streaming a JSON Lines file.
+
+        Each non-blank line is an object with "title" and "author" keys and
+        an optional "checked_out" key.
+
+        Args:
+            path (str): Path of the JSON Lines file.
+
+        Returns:
+            Library: A new library of the class this is called on.
+        """
+        library = cls()
+        with open(path, encoding="utf-8") as file:
+            library.add_records(
+                (row["title"], row["author"], _parse_flag(row.get("checked_out", False)))
+                for row in map(json.loads, filter(str.strip, file)))
+        return library
     
+    def _records(self):
+        """Yield (title, author, checked_out) for every copy, in catalog order."""
+        for book in self._books:
+            yield book.title, book.author, not book.is_available()
+
+    def save_snapshot(self, path):
+        """Write the catalog to a binary snapshot file.
+
+        The file uses CompactLibrary's snapshot format, so it can be
+        restored into any Library class.
+
+        Args:
+            path (str): Path of the snapshot file to write.
+
+        Raises:
+            ValueError: If a title or author contains a NUL character.
+        """
+        compact = CompactLibrary()
+        compact.add_records(self._records())
+        compact.save_snapshot(path)
+
+    @classmethod
+    def load_snapshot(cls, path):
+        """Restore a catalog written by save_snapshot.
+
+        The snapshot is memory-mapped into a CompactLibrary and its rows are
+        added in one pass. CompactLibrary.load_snapshot skips that pass and
+        is the fastest way to restart with a large catalog.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Returns:
+            Library: A new library of the class this is called on.
+
+        Raises:
+            ValueError: If the file is not a snapshot this version can read.
+        """
+        library = cls()
+        library.add_records(CompactLibrary.load_snapshot(path)._records())
+        return library
+
     def check_out_book(self, title):
         """Check out a book by its title.
         
+        The earliest-added available copy with that title is checked out.
+
         Args:
             title (str): The title of the book to check out.
+
+        Returns:
+            bool: True if a copy was checked out, False if none is available.
         """
-        for book in self._books:
-            if book.title == title and book.is_available():
-                book.check_out()
-                return
+        position = self._pop(self._available_by_title, title, True)
+        if position is None:
+            return False
+        # Updates the indexes through _book_changed.
+        self._books[position].check_out()
+        return True
     
     def return_book(self, title):
         """Return a book by its title.
         
+        The earliest-added checked-out copy with that title is returned.
+
         Args:
             title (str): The title of the book to return.
+
+        Returns:
+            bool: True if a copy was returned, False if none was checked out.
         """
-        for book in self._books:
-            if book.title == title:
-                book.return_book()
-                return
+        position = self._pop(self._checked_out_by_title, title, False)
+        if position is None:
+            return False
+        self._books[position].return_book()
+        return True
     
+    def find_books_by_title(self, title):
+        """Return every copy with the given title, in the order they were added.
+
+        Args:
+            title (str): The title to look up.
+
+        Returns:
+            list: The matching Book instances (empty if there are none).
+        """
+        return [self._books[position] for position in self._by_title.get(title, ())]
+
+    def find_books_by_author(self, author):
+        """Return every book by the given author, in the order they were added.
+
+        Args:
+            author (str): The author to look up.
+
+        Returns:
+            list: The matching Book instances (empty if there are none).
+        """
+        return [self._books[position] for position in self._by_author.get(author, ())]
+
+    def available_books(self):
+        """Return the available books in the order they were added.
+
+        Returns:
+            list: The Book instances that are not checked out.
+        """
+        return list(compress(self._books, self._available))
+
     def list_available_books(self):
         """Print all available books in the library."""
-        for book in self._books:
-            if book.is_available():
-                print(f"{book.title} by {book.author}")
\ No newline at end of file
+        for book in self.available_books():
+            print(f"{book.title} by {book.author}")
+
+
+class ConcurrentLibrary(Library):
+    """A Library that is safe to share between threads.
+
+    Each title maps to one of a fixed set of striped locks, so check-outs
+    and returns of different titles rarely wait on each other. Adding books
+    also takes a catalog lock, always before the striped lock.
+    """
+
+    def __init__(self, stripes=64):
+        """Initialize the library with an empty book collection.
+
+        Args:
+            stripes (int): Number of locks titles are spread over.
+        """
+        super().__init__()
+        self._catalog_lock = threading.Lock()
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _lock_for(self, title):
+        return self._locks[hash(title) % len(self._locks)]
+
+    def add_book(self, book):
+        """Add a book to the library collection.
+
+        Args:
+            book (Book): A Book instance to add to the library.
+        """
+        with self._catalog_lock, self._lock_for(book.title):
+            super().add_book(book)
+
+    def save_snapshot(self, path):
+        """Write the catalog to a binary snapshot file.
+
+        Every lock is held while the catalog is read, so the snapshot does
+        not catch a check-out or return half done.
+
+        Args:
+            path (str): Path of the snapshot file to write.
+        """
+        with self._catalog_lock, ExitStack() as stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            super().save_snapshot(path)
+
+    def check_out_book(self, title):
+        """Check out a book by its title.
+
+        Finding an available copy and marking it checked out happen under
+        the title's lock, so two threads never get the same copy.
+
+        Args:
+            title (str): The title of the book to check out.
+
+        Returns:
+            bool: True if a copy was checked out, False if none is available.
+        """
+        with self._lock_for(title):
+            return super().check_out_book(title)
+
+    def return_book(self, title):
+        """Return a book by its title.
+
+        Args:
+            title (str): The title of the book to return.
+
+        Returns:
+            bool: True if a copy was returned, False if none was checked out.
+        """
+        with self._lock_for(title):
+            return super().return_book(title)
+
+
+class BookView:
+    """A lightweight view of one row of a CompactLibrary.
+
+    Behaves like a Book, but reads and writes the library's columns instead
+    of holding its own title, author and availability status.
+    """
+
+    __slots__ = ("_library", "_position")
+
+    def __init__(self, library, position):
+        """Initialize a view over a row of the library.
+
+        Args:
+            library (CompactLibrary): The library holding the row.
+            position (int): The row's position in the catalog.
+        """
+        self._library = library
+        self._position = position
+
+    @property
+    def title(self):
+        """str: The title of the book."""
+        library = self._library
+        return library._title_table.strings[library._titles[self._position]]
+
+    @property
+    def author(self):
+        """str: The author of the book."""
+        library = self._library
+        return library._author_table.strings[library._authors[self._position]]
+
+    def check_out(self):
+        """Mark the book as checked out."""
+        self._library._set_checked_out(self._position, True)
+
+    def return_book(self):
+        """Mark the book as returned (available)."""
+        self._library._set_checked_out(self._position, False)
+
+    def is_available(self):
+        """Check if the book is available.
+
+        Returns:
+            bool: True if book is available, False if checked out.
+        """
+        return not self._library._is_checked_out(self._position)
+
+    def __eq__(self, other):
+        return (isinstance(other, BookView) and other._library is self._library
+                and other._position == self._position)
+
+    def __hash__(self):
+        return hash((id(self._library), self._position))
+
+
+class _StringTable:
+    """Interns strings as consecutive integer ids.
+
+    The ids live in an open-addressing hash table of 4-byte slots next to
+    the list of strings. A dict would cost a 24-byte entry plus, past 256,
+    an int object for every string.
+    """
+
+    __slots__ = ("strings", "_slots", "_mask")
+
+    _EMPTY = -1
+
+    def __init__(self, strings=()):
+        """Initialize the table.
+
+        Args:
+            strings (iterable): Distinct strings to start with; their ids
+                are their positions.
+        """
+        self.strings = list(strings)
+        # Built on the first lookup, so a loaded snapshot does not pay for
+        # it up front.
+        self._slots = None
+        self._mask = 0
+
+    def __len__(self):
+        return len(self.strings)
+
+    def _build(self):
+        """(Re)build the hash table, keeping it at most two thirds full."""
+        size = 8
+        while size * 2 < len(self.strings) * 3:
+            size *= 2
+        slots = array("i", [self._EMPTY]) * size
+        mask = size - 1
+        for string_id, string_hash in enumerate(map(hash, self.strings)):
+            index = string_hash & mask
+            while slots[index] != self._EMPTY:
+                index = (index + 1) & mask
+            slots[index] = string_id
+        self._slots, self._mask = slots, mask
+
+    def _probe(self, text):
+        """Return (id, slot index); id is None if text has not been interned."""
+        if self._slots is None:
+            self._build()
+        slots, mask, strings = self._slots, self._mask, self.strings
+        index = hash(text) & mask
+        while True:
+            string_id = slots[index]
+            if string_id == self._EMPTY:
+                return None, index
+            if strings[string_id] == text:
+                return string_id, index
+            index = (index + 1) & mask
+
+    def find(self, text):
+        """Return the id of text, or None if it has not been interned."""
+        return self._probe(text)[0]
+
+    def add(self, text):
+        """Return the id of text, interning it first if needed."""
+        string_id, index = self._probe(text)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(text)
+            self._slots[index] = string_id
+            if len(self.strings) * 3 > len(self._slots) * 2:
+                self._build()
+        return string_id
+
+
+class CompactLibrary(Library):
+    """A Library that stores its catalog in columns instead of Book objects.
+
+    Titles and authors are interned into separate string tables and stored
+    as integer ids, 2 bytes wide until a table passes 65,536 strings and 4
+    bytes after that. Checked-out flags live in a bitmap, and copies sharing
+    a title are chained through a per-row column linking each copy to the
+    one added before it. Books are handed out as BookView objects created
+    on demand.
+
+    Check-outs and returns walk the copies of one title, so they cost time
+    proportional to the number of copies. Looking books up by author and
+    listing available books scan a column.
+    """
+
+    _NO_ROW = -1
+
+    # Snapshot layout: header, the title and author tables as NUL-separated
+    # UTF-8, the columns below (id columns sized by _id_typecode), then the
+    # checked-out bitmap.
+    _SNAPSHOT_MAGIC = b"CLIB"
+    _SNAPSHOT_VERSION = 3
+    _SNAPSHOT_HEADER = struct.Struct("<4sHBxQQQQQ")
+    _SNAPSHOT_COLUMNS = ("_titles", "_authors", "_last_by_title", "_previous_by_title")
+
+    def __init__(self):
+        """Initialize the library with an empty catalog."""
+        self._title_table = _StringTable()
+        self._author_table = _StringTable()
+        self._titles = array("H")
+        self._authors = array("H")
+        self._checked_out = bytearray()
+        # Per-title latest row, and per-row link to the previous copy with
+        # the same title.
+        self._last_by_title = array("i")
+        self._previous_by_title = array("i")
+
+    def __len__(self):
+        return len(self._titles)
+
+    @staticmethod
+    def _id_typecode(strings):
+        """The id column typecode for a string table with this many strings."""
+        return "H" if strings <= 0x10000 else "I"
+
+    def _append_id(self, name, string_id):
+        column = getattr(self, name)
+        if string_id > 0xFFFF and column.typecode == "H":
+            column = array("I", column)
+            setattr(self, name, column)
+        column.append(string_id)
+
+    def _is_checked_out(self, position):
+        return self._checked_out[position >> 3] >> (position & 7) & 1
+
+    def _set_checked_out(self, position, checked_out):
+        if checked_out:
+            self._checked_out[position >> 3] |= 1 << (position & 7)
+        else:
+            self._checked_out[position >> 3] &= ~(1 << (position & 7)) & 0xFF
+
+    def _copies(self, title):
+        """Return the rows with the given title, in the order they were added."""
+        title_id = self._title_table.find(title)
+        if title_id is None:
+            return []
+        rows = []
+        position, links = self._last_by_title[title_id], self._previous_by_title
+        while position != self._NO_ROW:
+            rows.append(position)
+            position = links[position]
+        rows.reverse()
+        return rows
+
+    def add_record(self, title, author, checked_out=False):
+        """Add a book to the catalog without creating a Book object.
+
+        Args:
+            title (str): The title of the book.
+            author (str): The author of the book.
+            checked_out (bool): Whether the copy starts out checked out.
+
+        Returns:
+            BookView: A view over the new row.
+        """
+        position = len(self._titles)
+        title_id = self._title_table.add(title)
+        if title_id == len(self._last_by_title):
+            self._last_by_title.append(self._NO_ROW)
+        self._append_id("_titles", title_id)
+        self._append_id("_authors", self._author_table.add(author))
+        self._previous_by_title.append(self._last_by_title[title_id])
+        self._last_by_title[title_id] = position
+        if position & 7 == 0:
+            self._checked_out.append(0)
+        if checked_out:
+            self._set_checked_out(position, True)
+        return BookView(self, position)
+
+    def _records(self):
+        """Yield (title, author, checked_out) for every row, in catalog order."""
+        title_strings, author_strings = self._title_table.strings, self._author_table.strings
+        for position, (title_id, author_id) in enumerate(zip(self._titles, self._authors)):
+            yield (title_strings[title_id], author_strings[author_id],
+                   bool(self._is_checked_out(position)))
+
+    def add_book(self, book):
+        """Add a book to the library collection.
+
+        Only the book's title, author and availability are stored; later
+        changes to the Book object are not seen by the library.
+
+        Args:
+            book (Book): A Book instance to add to the library.
+        """
+        self.add_record(book.title, book.author, not book.is_available())
+
+    def check_out_book(self, title):
+        """Check out a book by its title.
+
+        The earliest-added available copy with that title is checked out.
+
+        Args:
+            title (str): The title of the book to check out.
+
+        Returns:
+            bool: True if a copy was checked out, False if none is available.
+        """
+        for position in self._copies(title):
+            if not self._is_checked_out(position):
+                self._set_checked_out(position, True)
+                return True
+        return False
+
+    def return_book(self, title):
+        """Return a book by its title.
+
+        The earliest-added checked-out copy with that title is returned.
+
+        Args:
+            title (str): The title of the book to return.
+
+        Returns:
+            bool: True if a copy was returned, False if none was checked out.
+        """
+        for position in self._copies(title):
+            if self._is_checked_out(position):
+                self._set_checked_out(position, False)
+                return True
+        return False
+
+    def find_books_by_title(self, title):
+        """Return every copy with the given title, in the order they were added.
+
+        Args:
+            title (str): The title to look up.
+
+        Returns:
+            list: BookView objects for the matching rows.
+        """
+        return [BookView(self, position) for position in self._copies(title)]
+
+    def find_books_by_author(self, author):
+        """Return every book by the given author, in the order they were added.
+
+        Args:
+            author (str): The author to look up.
+
+        Returns:
+            list: BookView objects for the matching rows.
+        """
+        author_id = self._author_table.find(author)
+        if author_id is None:
+            return []
+        return [BookView(self, position) for position in
+                compress(range(len(self._authors)), map(author_id.__eq__, self._authors))]
+
+    def available_books(self):
+        """Return the available books in the order they were added.
+
+        Returns:
+            list: BookView objects for the rows that are not checked out.
+        """
+        books = []
+        size = len(self._titles)
+        for index, flags in enumerate(self._checked_out):
+            if flags == 0xFF:
+                continue
+            base = index << 3
+            for bit in range(min(8, size - base)):
+                if not flags >> bit & 1:
+                    books.append(BookView(self, base + bit))
+        return books
+
+    def save_snapshot(self, path):
+        """Write the catalog to a binary snapshot file.
+
+        Args:
+            path (str): Path of the snapshot file to write.
+
+        Raises:
+            ValueError: If a title or author contains a NUL character.
+        """
+        title_strings, author_strings = self._title_table.strings, self._author_table.strings
+        if any("\0" in text for text in title_strings + author_strings):
+            raise ValueError("Titles and authors cannot contain NUL characters.")
+        title_blob = "\0".join(title_strings).encode("utf-8")
+        author_blob = "\0".join(author_strings).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(self._SNAPSHOT_HEADER.pack(
+                self._SNAPSHOT_MAGIC, self._SNAPSHOT_VERSION, sys.byteorder == "big",
+                len(self._titles), len(title_strings), len(title_blob),
+                len(author_strings), len(author_blob)))
+            file.write(title_blob)
+            file.write(author_blob)
+            for name in self._SNAPSHOT_COLUMNS:
+                getattr(self, name).tofile(file)
+            file.write(self._checked_out)
+
+    @classmethod
+    def load_snapshot(cls, path):
+        """Restore a catalog written by save_snapshot.
+
+        The file is memory-mapped and each column is copied straight out of
+        the mapping, so loading costs about as much as reading the file.
+
+        Args:
+            path (str): Path of the snapshot file.
+
+        Returns:
+            CompactLibrary: The restored library.
+
+        Raises:
+            ValueError: If the file is not a snapshot this version can read.
+        """
+        library = cls()
+        with open(path, "rb") as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            data = memoryview(mapped)
+            try:
+                header = cls._SNAPSHOT_HEADER
+                if len(data) < header.size:
+                    raise ValueError(f"{path} is not a library snapshot.")
+                (magic, version, big_endian, rows, titles, title_blob_size,
+                 authors, author_blob_size) = header.unpack_from(data)
+                if magic != cls._SNAPSHOT_MAGIC or version != cls._SNAPSHOT_VERSION:
+                    raise ValueError(f"{path} is not a version {cls._SNAPSHOT_VERSION} "
+                                     f"library snapshot.")
+                columns = list(zip(cls._SNAPSHOT_COLUMNS,
+                                   (cls._id_typecode(titles), cls._id_typecode(authors), "i", "i"),
+                                   (rows, rows, titles, rows)))
+                size = (header.size + title_blob_size + author_blob_size + (rows + 7) // 8
+                        + sum(array(typecode).itemsize * count for _, typecode, count in columns))
+                if len(data) != size:
+                    raise ValueError(f"{path} is truncated or corrupt.")
+
+                offset = header.size
+                for count, blob_size, table_name in (
+                        (titles, title_blob_size, "_title_table"),
+                        (authors, author_blob_size, "_author_table")):
+                    text = str(data[offset:offset + blob_size], "utf-8")
+                    setattr(library, table_name, _StringTable(text.split("\0") if count else ()))
+                    offset += blob_size
+                swap = bool(big_endian) != (sys.byteorder == "big")
+                for name, typecode, count in columns:
+                    column = array(typecode)
+                    end = offset + column.itemsize * count
+                    column.frombytes(data[offset:end])
+                    if swap:
+                        column.byteswap()
+                    setattr(library, name, column)
+                    offset = end
+                library._checked_out = bytearray(data[offset:])
+            finally:
+                data.release()
+        return library
@@ -1,3 +1,6 @@
+from array import array
+
+
 def safe_divide(numerator, denominator):
     """Perform division with robust error handling.
     
@@ -20,4 +23,107 @@ def safe_divide(numerator, denominator):
     except ZeroDivisionError:
         return "Error: Cannot divide by zero."
     except ValueError:
-        return "Error: Please enter numeric values only."
\ No newline at end of file
+        return "Error: Please enter numeric values only."
+
+
+# Per-row status codes returned by safe_divide_many.
+OK = 0
+ZERO_DIVISION = 1
+NON_NUMERIC = 2
+
+ERROR_MESSAGES = {
+    ZERO_DIVISION: "Error: Cannot divide by zero.",
+    NON_NUMERIC: "Error: Please enter numeric values only.",
+}
+
+NAN = float("nan")
+
+# Distinct tokens remembered per call before the token cache starts over.
+TOKEN_CACHE_SIZE = 100_000
+
+# float() ignores surrounding whitespace, and any ASCII text it accepts
+# (digits, signs, ".5", "inf", "nan") starts with one of these. It also
+# takes other Unicode digits and spaces, so only ASCII text is pre-checked.
+_NUMBER_STARTS = frozenset("0123456789+-.iInN")
+
+_UNSEEN = object()
+
+
+def _to_float(value):
+    """Convert a value like float() does, returning None instead of raising."""
+    if isinstance(value, str) and value.isascii():
+        first = value[:1]
+        if first not in _NUMBER_STARTS and value.lstrip()[:1] not in _NUMBER_STARTS:
+            # Rejecting common bad input ("", "abc") here avoids the cost
+            # of raising and catching ValueError.
+            return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def safe_divide_many(numerators, denominators):
+    """Divide whole columns of values, like safe_divide on every row.
+
+    Values may be numbers or strings, as read from an uploaded file. Each
+    distinct token is parsed once per call, and rows that fail get a status
+    code instead of an error string; use division_messages to turn the
+    results into safe_divide's messages when they are needed.
+
+    Args:
+        numerators (iterable): Numerator of each row.
+        denominators (iterable): Denominator of each row, the same length.
+
+    Returns:
+        tuple: (results, codes) where results is an array('d') holding NaN
+            for failed rows and codes is a bytearray of OK, ZERO_DIVISION or
+            NON_NUMERIC per row.
+
+    Raises:
+        ValueError: If the columns have different lengths.
+    """
+    cache = {}
+    get = cache.get
+    results = array("d")
+    codes = bytearray()
+    append_result = results.append
+    append_code = codes.append
+    for numerator, denominator in zip(numerators, denominators, strict=True):
+        num = get(numerator, _UNSEEN)
+        if num is _UNSEEN:
+            if len(cache) >= TOKEN_CACHE_SIZE:
+                cache.clear()
+            num = cache[numerator] = _to_float(numerator)
+        denom = get(denominator, _UNSEEN)
+        if denom is _UNSEEN:
+            if len(cache) >= TOKEN_CACHE_SIZE:
+                cache.clear()
+            denom = cache[denominator] = _to_float(denominator)
+        if num is None or denom is None:
+            append_result(NAN)
+            append_code(NON_NUMERIC)
+        elif denom == 0:
+            append_result(NAN)
+            append_code(ZERO_DIVISION)
+        else:
+            append_result(num / denom)
+            append_code(OK)
+    return results, codes
+
+
+def division_messages(results, codes, rows=None):
+    """Render safe_divide's messages for results from safe_divide_many.
+
+    Args:
+        results (sequence): Results returned by safe_divide_many.
+        codes (sequence): Status codes returned by safe_divide_many.
+        rows (iterable): Indexes of the rows to render; None renders all.
+
+    Returns:
+        list: One message per requested row.
+    """
+    if rows is None:
+        rows = range(len(codes))
+    return [f"The result of the division is {results[row]}" if codes[row] == OK
+            else ERROR_MESSAGES[codes[row]] for row in rows]
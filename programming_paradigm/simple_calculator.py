@@ -0,0 +1,183 @@
+import ast
+import operator
+from itertools import starmap
+
+
+class SimpleCalculator:
+    """A simple calculator class that supports basic arithmetic operations."""
+
+    def add(self, a, b):
+        """Return the addition of a and b."""
+        return a + b
+
+    def subtract(self, a, b):
+        """Return the subtraction of b from a."""
+        return a - b
+
+    def multiply(self, a, b):
+        """Return the multiplication of a and b."""
+        return a * b
+
+    def divide(self, a, b):
+        """Return the division of a by b. Returns None if b is zero.
+
+        Dividing one integer by another that goes into it exactly returns an
+        integer; any other division returns a float.
+        """
+        if b == 0:
+            return None
+        return _divide(a, b)
+
+    def compile(self, expression):
+        """Compile an arithmetic expression for repeated evaluation.
+
+        The expression may use numbers, variable names, parentheses, unary
+        minus and the operators + - * /, with the same results as chaining
+        this calculator's methods. It is parsed once, constant parts are
+        folded, and the result is turned into Python bytecode, so each later
+        evaluation is a single function call. Dividing by zero anywhere in
+        the expression makes it evaluate to None.
+
+        Args:
+            expression (str): The expression, e.g. "(price - discount) * qty / 100".
+
+        Returns:
+            CompiledExpression: The compiled expression.
+
+        Raises:
+            ValueError: If the expression is malformed or uses anything else.
+        """
+        return CompiledExpression(expression)
+
+
+def _divide(a, b):
+    """Divide like SimpleCalculator.divide, but raise ZeroDivisionError."""
+    if isinstance(a, int) and isinstance(b, int) and a % b == 0:
+        return a // b
+    return a / b
+
+
+class CompiledExpression:
+    """An arithmetic expression compiled by SimpleCalculator.compile."""
+
+    _OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub,
+                  ast.Mult: operator.mul, ast.Div: _divide}
+
+    def __init__(self, expression):
+        """Parse and compile an expression.
+
+        Args:
+            expression (str): The expression to compile.
+
+        Raises:
+            ValueError: If the expression is malformed, unsupported or too
+                deeply nested.
+        """
+        self.expression = expression
+        self._variables = []
+        try:
+            try:
+                tree = ast.parse(expression.strip(), mode="eval")
+            except SyntaxError as error:
+                raise ValueError(f"Invalid expression: {expression!r}") from error
+            try:
+                body = self._compile(tree.body)
+            except ZeroDivisionError:
+                # A constant part divides by zero, so every evaluation gives None.
+                body = ast.Constant(None)
+            self.variables = tuple(self._variables)
+            self._function = self._build(body)
+        except RecursionError as error:
+            raise ValueError("Expression is nested too deeply to compile "
+                             f"({len(expression)} characters).") from error
+
+    def _compile(self, node):
+        """Rewrite a parsed node into a checked node with constants folded."""
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            return ast.Constant(node.value)
+
+        if isinstance(node, ast.Name):
+            if node.id.startswith("_"):
+                raise ValueError(f"Variable names cannot start with '_': {node.id!r}")
+            if node.id not in self._variables:
+                self._variables.append(node.id)
+            return ast.Name(id=node.id, ctx=ast.Load())
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+            operand = self._compile(node.operand)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            if isinstance(operand, ast.Constant):
+                return ast.Constant(-operand.value)
+            return ast.UnaryOp(op=ast.USub(), operand=operand)
+
+        if isinstance(node, ast.BinOp) and type(node.op) in self._OPERATORS:
+            left = self._compile(node.left)
+            right = self._compile(node.right)
+            if isinstance(left, ast.Constant) and isinstance(right, ast.Constant):
+                return ast.Constant(self._OPERATORS[type(node.op)](left.value, right.value))
+            if isinstance(node.op, ast.Div):
+                # Plain "/" would turn exact integer division into a float.
+                return ast.Call(func=ast.Name(id="_divide", ctx=ast.Load()),
+                                args=[left, right], keywords=[])
+            return ast.BinOp(left=left, op=type(node.op)(), right=right)
+
+        raise ValueError(f"Unsupported syntax in expression: {ast.unparse(node)!r}")
+
+    def _build(self, body):
+        """Compile the rewritten expression into a Python function.
+
+        The function takes the variables as arguments, in order, and returns
+        None if evaluating the expression divides by zero.
+        """
+        function = ast.FunctionDef(
+            name="expression",
+            args=ast.arguments(posonlyargs=[], args=[ast.arg(arg=name) for name in self.variables],
+                               kwonlyargs=[], kw_defaults=[], defaults=[]),
+            body=[ast.Try(
+                body=[ast.Return(value=body)],
+                handlers=[ast.ExceptHandler(type=ast.Name(id="_ZeroDivisionError", ctx=ast.Load()),
+                                            body=[ast.Return(value=ast.Constant(None))])],
+                orelse=[], finalbody=[])],
+            decorator_list=[])
+        module = ast.fix_missing_locations(ast.Module(body=[function], type_ignores=[]))
+        # Variables may not start with "_", so they cannot shadow these names.
+        namespace = {"__builtins__": {}, "_ZeroDivisionError": ZeroDivisionError,
+                     "_divide": _divide}
+        exec(compile(module, "<expression>", "exec"), namespace)
+        return namespace["expression"]
+
+    def evaluate(self, **bindings):
+        """Evaluate the expression with the given variable values.
+
+        Args:
+            **bindings: A value for every variable in the expression.
+
+        Returns:
+            int, float or None: The result, or None if it divided by zero.
+        """
+        return self._function(**bindings)
+
+    __call__ = evaluate
+
+    def evaluate_many(self, rows):
+        """Evaluate the expression once per row of variable values.
+
+        Args:
+            rows (iterable): Either tuples of values in the order given by
+                self.variables, or dicts mapping variable names to values.
+
+        Returns:
+            list: One result per row.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        if first is None:
+            return []
+        function = self._function
+        if isinstance(first, dict):
+            return [function(**first)] + [function(**row) for row in rows]
+        return [function(*first)] + list(starmap(function, rows))
+
+    def __repr__(self):
+        return f"CompiledExpression({self.expression!r})"
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the BankAccount class.
+Tests single and batched postings and the ledger they produce.
+"""
+
+import threading
+import unittest
+from array import array
+from unittest import mock
+import bank_account
+from bank_account import AccountBook, BankAccount, Ledger
+
+
+class TestBankAccount(unittest.TestCase):
+    """Test cases for BankAccount class."""
+
+    def setUp(self):
+        """Set up an account with an opening balance of 100."""
+        self.account = BankAccount(100)
+
+    def test_deposit_and_withdraw(self):
+        """Test single deposits and withdrawals, including insufficient funds."""
+        self.account.deposit(50)
+        self.assertEqual(self.account.account_balance, 150)
+        self.assertTrue(self.account.withdraw(150))
+        self.assertEqual(self.account.account_balance, 0)
+        self.assertFalse(self.account.withdraw(1))
+        self.assertEqual(self.account.account_balance, 0)
+        self.assertEqual(len(self.account.ledger), 2)
+
+    def test_apply_batch(self):
+        """Test that a batch is applied in order with the insufficient-funds rule."""
+        applied = self.account.apply_batch([
+            ("withdraw", 80),
+            ("withdraw", 30),   # only 20 left
+            ("deposit", 40),
+            ("withdraw", 30),
+        ])
+        self.assertEqual(applied, [True, False, True, True])
+        self.assertEqual(self.account.account_balance, 30)
+        self.assertEqual([amount for _, amount, _ in self.account.ledger.entries()],
+                         [-80, 40, -30])
+
+    def test_apply_batch_rejects_unknown_operation(self):
+        """Test that an unknown operation leaves the account untouched."""
+        with self.assertRaises(ValueError):
+            self.account.apply_batch([("deposit", 10), ("transfer", 5)])
+        self.assertEqual(self.account.account_balance, 100)
+        self.assertEqual(len(self.account.ledger), 0)
+
+    def test_balance_history(self):
+        """Test balance queries by time and by posting count."""
+        self.account.apply_batch([("deposit", 10), ("deposit", 20)], timestamp=1000)
+        self.account.apply_batch([("withdraw", 50)], timestamp=2000)
+        ledger = self.account.ledger
+
+        self.assertEqual(ledger.balance_at(999), 100)
+        self.assertEqual(ledger.balance_at(1000), 130)
+        self.assertEqual(ledger.balance_at(1999), 130)
+        self.assertEqual(ledger.balance_at(2000), 80)
+        self.assertEqual(ledger.balance_after(0), 100)
+        self.assertEqual(ledger.balance_after(1), 110)
+
+    def test_out_of_order_timestamps(self):
+        """Test that backdated postings are rejected and leave the account untouched."""
+        self.account.apply_batch([("deposit", 10)], timestamp=2000)
+        with self.assertRaises(ValueError):
+            self.account.apply_batch([("deposit", 20)], timestamp=1999)
+        self.assertEqual(self.account.account_balance, 110)
+        self.assertEqual(len(self.account.ledger), 1)
+        self.account.apply_batch([("deposit", 20)], timestamp=2000)
+        self.assertEqual(self.account.ledger.balance_at(2000), 130)
+
+    def test_clock_set_back(self):
+        """Test that postings keep the last time if the wall clock goes backwards."""
+        ledger = Ledger()
+        ledger.append(5, 5, timestamp=2000)
+        with self.assertRaises(ValueError):
+            ledger.append(1, 6, timestamp=1000)
+        with mock.patch.object(bank_account.time, "time", return_value=1000.0):
+            ledger.append(1, 6)
+            ledger.extend([2], [8])
+        self.assertEqual([timestamp for timestamp, _, _ in ledger.entries()], [2000] * 3)
+        self.assertEqual(ledger.balance_at(2000), 8)
+
+    def test_transfer(self):
+        """Test transfers between accounts, including insufficient funds."""
+        other = BankAccount(20)
+        self.assertTrue(self.account.transfer(other, 60))
+        self.assertFalse(self.account.transfer(other, 41))
+        self.assertTrue(other.transfer(self.account, 80))
+        self.assertTrue(self.account.transfer(self.account, 120))
+        self.assertEqual((self.account.account_balance, other.account_balance), (120, 0))
+
+    def test_transfer_rejects_non_positive_amounts(self):
+        """Test that negative or zero transfers cannot pull money from the destination."""
+        other = BankAccount(10)
+        for amount in (-500, 0, -0.01, float("nan")):
+            with self.subTest(amount=amount):
+                with self.assertRaises(ValueError):
+                    self.account.transfer(other, amount)
+                with self.assertRaises(ValueError):
+                    self.account.transfer(self.account, amount)
+        self.assertEqual((self.account.account_balance, other.account_balance), (100, 10))
+        self.assertEqual((len(self.account.ledger), len(other.ledger)), (0, 0))
+
+    def test_concurrent_transfers_conserve_money(self):
+        """Test that opposing transfers from many threads neither deadlock nor leak money."""
+        accounts = [BankAccount(1000) for _ in range(4)]
+
+        def worker(offset):
+            for step in range(2000):
+                source = accounts[(step + offset) % 4]
+                destination = accounts[(step + offset + 1 + step % 2) % 4]
+                source.transfer(destination, 7)
+                destination.transfer(source, 5)
+
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+            self.assertFalse(thread.is_alive())
+
+        balances = [account.account_balance for account in accounts]
+        self.assertEqual(sum(balances), 4000)
+        self.assertTrue(all(balance >= 0 for balance in balances))
+
+
+
+class TestAccountBook(unittest.TestCase):
+    """Test cases for AccountBook class."""
+
+    def setUp(self):
+        """Set up a book with three accounts."""
+        self.book = AccountBook([100, 50, 0])
+
+    def test_bulk_operations(self):
+        """Test deposits, masked withdrawals and interest across all accounts."""
+        self.book.deposit(10)
+        self.assertEqual(list(self.book.balances()), [110, 60, 10])
+        self.book.deposit([0, 40, 0])
+        self.assertEqual(list(self.book.withdraw([110, 101, 10.5])), [True, False, False])
+        self.assertEqual(list(self.book.balances()), [0, 100, 10])
+        self.book.apply_interest(0.5)
+        self.assertEqual(list(self.book.balances()), [0, 150, 15])
+        self.book.apply_interest([0, 0.1, -1])
+        self.assertAlmostEqual(self.book.total(), 165)
+
+    def test_per_account_length_must_match(self):
+        """Test that per-account sequences must cover every account."""
+        with self.assertRaises(ValueError):
+            self.book.deposit([1, 2])
+
+    def test_account_views(self):
+        """Test that account handles read and write the shared balances."""
+        account = self.book.account(1)
+        new_account = self.book.open_account(5)
+        self.assertTrue(account.withdraw(50))
+        self.assertFalse(account.withdraw(1))
+        new_account.deposit(5)
+        self.book.deposit(1)
+        self.assertEqual(account.account_balance, 1)
+        self.assertEqual(new_account.account_balance, 11)
+        self.assertEqual(list(self.book.balances()), [101, 1, 1, 11])
+
+
+@unittest.skipIf(bank_account.np is None, "the stdlib fallback is already tested")
+class TestAccountBookWithoutNumPy(TestAccountBook):
+    """Runs the AccountBook test cases against the stdlib fallback."""
+
+    def setUp(self):
+        """Hide NumPy from bank_account for the duration of each test."""
+        patcher = mock.patch.object(bank_account, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def test_uses_stdlib_arrays(self):
+        """Test that balances are kept in an array('d') without NumPy."""
+        self.assertIsInstance(self.book.balances(), array)
+        self.assertEqual(self.book.withdraw(60), [True, False, False])
+
+
+if __name__ == '__main__':
+    unittest.main()
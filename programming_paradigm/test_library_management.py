@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the Book and Library classes.
+Tests indexed lookups, check-outs and returns, including shared titles.
+"""
+
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from library_management import Book, CompactLibrary, ConcurrentLibrary, Library
+
+
+class TestLibrary(unittest.TestCase):
+    """Test cases for Library class."""
+
+    library_class = Library
+
+    def setUp(self):
+        """Set up a Library with a few books, including two copies of one title."""
+        self.library = self.library_class()
+        self.library.add_book(Book("Brave New World", "Aldous Huxley"))
+        self.library.add_book(Book("1984", "George Orwell"))
+        self.library.add_book(Book("Animal Farm", "George Orwell"))
+        self.library.add_book(Book("1984", "George Orwell"))
+
+    def test_find_books(self):
+        """Test lookups by title and by author."""
+        self.assertEqual(len(self.library.find_books_by_title("1984")), 2)
+        self.assertEqual(
+            [book.title for book in self.library.find_books_by_author("George Orwell")],
+            ["1984", "Animal Farm", "1984"],
+        )
+        self.assertEqual(self.library.find_books_by_title("Dune"), [])
+        self.assertEqual(self.library.find_books_by_author("Frank Herbert"), [])
+
+    def test_check_out_and_return(self):
+        """Test checking out and returning copies that share a title."""
+        first, second = self.library.find_books_by_title("1984")
+
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertFalse(first.is_available())
+        self.assertTrue(second.is_available())
+
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertFalse(self.library.check_out_book("1984"))
+        self.assertFalse(self.library.check_out_book("Dune"))
+
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertTrue(first.is_available())
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertFalse(self.library.return_book("1984"))
+
+    def test_list_available_books(self):
+        """Test that available books are listed in catalog order."""
+        self.library.check_out_book("Brave New World")
+        self.library.check_out_book("1984")
+        self.library.return_book("Brave New World")
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.library.list_available_books()
+        self.assertEqual(output.getvalue().splitlines(), [
+            "Brave New World by Aldous Huxley",
+            "Animal Farm by George Orwell",
+            "1984 by George Orwell",
+        ])
+
+    def test_direct_book_changes(self):
+        """Test that books checked out or returned directly keep the library in step."""
+        first, second = self.library.find_books_by_title("1984")
+        first.check_out()
+        self.assertEqual([book.title for book in self.library.available_books()],
+                         ["Brave New World", "Animal Farm", "1984"])
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertFalse(second.is_available())
+        self.assertFalse(self.library.check_out_book("1984"))
+
+        first.return_book()
+        for _ in range(50):
+            second.return_book()
+            second.check_out()
+        self.assertTrue(self.library.check_out_book("1984"))
+        self.assertFalse(first.is_available())
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertTrue(first.is_available())
+        self.assertTrue(self.library.return_book("1984"))
+        self.assertFalse(self.library.return_book("1984"))
+        self.assertEqual(len(self.library.available_books()), 4)
+
+    def test_book_in_two_libraries(self):
+        """Test that a book shared by two libraries keeps both in step."""
+        book = Book("Dune", "Frank Herbert")
+        other = self.library_class()
+        self.library.add_book(book)
+        other.add_book(book)
+        self.assertTrue(self.library.check_out_book("Dune"))
+        self.assertFalse(other.check_out_book("Dune"))
+        self.assertEqual(other.available_books(), [])
+        self.assertTrue(other.return_book("Dune"))
+        self.assertTrue(self.library.check_out_book("Dune"))
+
+    def test_add_checked_out_book(self):
+        """Test adding a book that is already checked out."""
+        book = Book("Dune", "Frank Herbert")
+        book.check_out()
+        self.library.add_book(book)
+        self.assertFalse(self.library.check_out_book("Dune"))
+        self.assertTrue(self.library.return_book("Dune"))
+        self.assertTrue(self.library.find_books_by_title("Dune")[0].is_available())
+
+    def test_bulk_load(self):
+        """Test building a library from CSV and JSON Lines files."""
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "books.csv")
+            with open(csv_path, "w", encoding="utf-8") as file:
+                file.write("title,author,checked_out\n"
+                           "Dune,Frank Herbert,no\n"
+                           "\"Dune, Messiah\",Frank Herbert,yes\n")
+            jsonl_path = os.path.join(directory, "books.jsonl")
+            with open(jsonl_path, "w", encoding="utf-8") as file:
+                file.write(json.dumps({"title": "Dune", "author": "Frank Herbert"}) + "\n\n")
+                file.write(json.dumps({"title": "Dune, Messiah", "author": "Frank Herbert",
+                                       "checked_out": True}) + "\n")
+
+            for library in (self.library_class.from_csv(csv_path),
+                            self.library_class.from_jsonl(jsonl_path)):
+                with self.subTest(library=library):
+                    self.assertIsInstance(library, self.library_class)
+                    self.assertEqual(len(library.find_books_by_author("Frank Herbert")), 2)
+                    self.assertEqual([book.title for book in library.available_books()], ["Dune"])
+                    self.assertFalse(library.check_out_book("Dune, Messiah"))
+
+    def test_snapshot_restores_into_any_library(self):
+        """Test that a snapshot restores the catalog and check-outs into every class."""
+        self.library.check_out_book("1984")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "library.snapshot")
+            self.library.save_snapshot(path)
+            for library_class in (Library, CompactLibrary, ConcurrentLibrary):
+                with self.subTest(library_class=library_class):
+                    restored = library_class.load_snapshot(path)
+                    self.assertIsInstance(restored, library_class)
+                    self.assertEqual([(book.title, book.author)
+                                      for book in restored.available_books()],
+                                     [(book.title, book.author)
+                                      for book in self.library.available_books()])
+                    self.assertEqual(len(restored.find_books_by_author("George Orwell")), 3)
+                    self.assertTrue(restored.check_out_book("1984"))
+                    self.assertFalse(restored.check_out_book("1984"))
+                    self.assertTrue(restored.return_book("1984"))
+
+
+class TestCompactLibrary(TestLibrary):
+    """Runs the Library test cases against the columnar CompactLibrary."""
+
+    library_class = CompactLibrary
+
+    def test_book_view_writes_through(self):
+        """Test that BookView check-outs update the library's bitmap."""
+        view = self.library.find_books_by_author("Aldous Huxley")[0]
+        self.assertEqual(view.title, "Brave New World")
+        view.check_out()
+        self.assertFalse(self.library.check_out_book("Brave New World"))
+        view.return_book()
+        self.assertTrue(self.library.check_out_book("Brave New World"))
+
+    def test_book_in_two_libraries(self):
+        """Test that a CompactLibrary copies a book's fields instead of sharing it."""
+        book = Book("Dune", "Frank Herbert")
+        other = CompactLibrary()
+        self.library.add_book(book)
+        other.add_book(book)
+        self.assertTrue(self.library.check_out_book("Dune"))
+        book.check_out()
+        self.assertTrue(other.check_out_book("Dune"))
+        self.assertFalse(self.library.check_out_book("Dune"))
+
+    def test_snapshot_round_trip(self):
+        """Test saving and restoring a binary snapshot."""
+        self.library.check_out_book("1984")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "library.snapshot")
+            self.library.save_snapshot(path)
+            restored = CompactLibrary.load_snapshot(path)
+
+        self.assertEqual(len(restored), len(self.library))
+        self.assertEqual([book.title for book in restored.available_books()],
+                         [book.title for book in self.library.available_books()])
+        self.assertEqual(len(restored.find_books_by_author("George Orwell")), 3)
+        self.assertTrue(restored.check_out_book("1984"))
+        self.assertFalse(restored.check_out_book("1984"))
+        restored.add_record("Dune", "Frank Herbert")
+        self.assertTrue(restored.check_out_book("Dune"))
+
+    def test_snapshot_rejects_other_files(self):
+        """Test that loading something that is not a snapshot fails cleanly."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "library.snapshot")
+            self.library.save_snapshot(path)
+            with open(path, "r+b") as file:
+                file.truncate(os.path.getsize(path) - 1)
+            with self.assertRaises(ValueError):
+                CompactLibrary.load_snapshot(path)
+            with open(path, "wb") as file:
+                file.write(b"title,author\n")
+            with self.assertRaises(ValueError):
+                CompactLibrary.load_snapshot(path)
+
+    def test_many_titles(self):
+        """Test that lookups and snapshots still work once title ids need 4 bytes."""
+        library = CompactLibrary()
+        count = 0x10000 + 10
+        library.add_records((f"Title {index}", f"Author {index % 7}") for index in range(count))
+        library.add_record("Title 0", "Author 0")
+        self.assertEqual(library._titles.typecode, "I")
+        self.assertEqual(library._authors.typecode, "H")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "library.snapshot")
+            library.save_snapshot(path)
+            restored = CompactLibrary.load_snapshot(path)
+
+        for catalog in (library, restored):
+            self.assertEqual(len(catalog), count + 1)
+            self.assertEqual([book.title for book in catalog.find_books_by_title("Title 0")],
+                             ["Title 0", "Title 0"])
+            self.assertEqual(catalog.find_books_by_title(f"Title {count - 1}")[0].author,
+                             f"Author {(count - 1) % 7}")
+            self.assertEqual(len(catalog.find_books_by_author("Author 3")),
+                             len(range(3, count, 7)))
+            self.assertTrue(catalog.check_out_book(f"Title {count - 1}"))
+            self.assertFalse(catalog.check_out_book(f"Title {count - 1}"))
+
+
+class TestConcurrentLibrary(TestLibrary):
+    """Runs the Library test cases against ConcurrentLibrary, plus a threaded check."""
+
+    library_class = ConcurrentLibrary
+
+    def test_no_double_checkouts(self):
+        """Test that threads racing for the same copies never share one."""
+        library = ConcurrentLibrary(stripes=4)
+        for _ in range(50):
+            library.add_record("1984", "George Orwell")
+            library.add_record("Dune", "Frank Herbert")
+        successes = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            count = 0
+            for _ in range(100):
+                count += library.check_out_book("1984")
+                count += library.check_out_book("Dune")
+            successes.append(count)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(sum(successes), 100)
+        self.assertEqual(library.available_books(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
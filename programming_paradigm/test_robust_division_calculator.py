@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests for safe_divide and its batch variant safe_divide_many.
+"""
+
+import math
+import unittest
+import robust_division_calculator
+from robust_division_calculator import (NON_NUMERIC, OK, ZERO_DIVISION, division_messages,
+                                        safe_divide, safe_divide_many)
+
+
+class TestSafeDivideMany(unittest.TestCase):
+    """Test cases for the batch division API."""
+
+    def test_matches_safe_divide(self):
+        """Rendered messages match safe_divide row for row."""
+        numerators = ["10", "7.5", " 3 ", "-4", "abc", "", "1e3", "inf", "nan", "5", 8, 2.5, "1_000",
+                      "\uff11", "\u0663.5", "\u20036", "\uff41"]
+        denominators = ["2", "2.5", "0", "-0.0", "1", "2", "x", "2", "1", ".5", "4", 0, "10",
+                        "2", "\uff12", "\u00a03", "1"]
+        results, codes = safe_divide_many(numerators, denominators)
+        self.assertEqual(division_messages(results, codes),
+                         [safe_divide(n, d) for n, d in zip(numerators, denominators)])
+
+    def test_results_and_codes(self):
+        """Failed rows hold NaN and the matching error code."""
+        results, codes = safe_divide_many(["9", "1", "one", "1"], ["3", "0", "1", "two"])
+        self.assertEqual(list(codes), [OK, ZERO_DIVISION, NON_NUMERIC, NON_NUMERIC])
+        self.assertEqual(results[0], 3.0)
+        self.assertTrue(all(math.isnan(result) for result in results[1:]))
+
+    def test_selected_messages(self):
+        """Messages can be rendered for selected rows only."""
+        results, codes = safe_divide_many(["1", "1", "x"], ["4", "0", "1"])
+        self.assertEqual(division_messages(results, codes, [2, 0]),
+                         ["Error: Please enter numeric values only.",
+                          "The result of the division is 0.25"])
+
+    def test_repeated_tokens(self):
+        """Results stay correct when the token cache fills up and restarts."""
+        old_size = robust_division_calculator.TOKEN_CACHE_SIZE
+        robust_division_calculator.TOKEN_CACHE_SIZE = 3
+        try:
+            numerators = [str(i % 7) for i in range(50)]
+            denominators = [str(i % 5) for i in range(50)]
+            results, codes = safe_divide_many(numerators, denominators)
+        finally:
+            robust_division_calculator.TOKEN_CACHE_SIZE = old_size
+        self.assertEqual(division_messages(results, codes),
+                         [safe_divide(n, d) for n, d in zip(numerators, denominators)])
+
+    def test_empty_and_mismatched_columns(self):
+        """Empty columns give empty results; columns must be the same length."""
+        results, codes = safe_divide_many([], [])
+        self.assertEqual((len(results), len(codes)), (0, 0))
+        with self.assertRaises(ValueError):
+            safe_divide_many(["1", "2"], ["1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
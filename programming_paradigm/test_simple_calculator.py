@@ -211,5 +211,66 @@ class TestSimpleCalculator(unittest.TestCase):
         self.assertEqual(result_mul, original)
 
 
+
+class TestCompiledExpression(unittest.TestCase):
+    """Test cases for expressions compiled by SimpleCalculator.compile."""
+
+    def setUp(self):
+        """Set up the SimpleCalculator instance before each test."""
+        self.calc = SimpleCalculator()
+
+    def test_evaluate(self):
+        """Test evaluating an expression against several bindings."""
+        expression = self.calc.compile("(price - discount) * qty / 100")
+        self.assertEqual(expression.variables, ("price", "discount", "qty"))
+        self.assertEqual(expression.evaluate(price=10, discount=2, qty=25), 2)
+        self.assertEqual(expression(price=1.5, discount=0.5, qty=50), 0.5)
+        self.assertEqual(expression.evaluate_many([(10, 2, 25), (3, 1, 1)]), [2, 0.02])
+        self.assertEqual(expression.evaluate_many([{"price": 4, "discount": 2, "qty": 100}]), [2])
+
+    def test_matches_calculator_methods(self):
+        """Test that compiled results agree with chained calculator calls."""
+        expression = self.calc.compile("(a + b) * c - a / b")
+        for a, b, c in [(5, 3, 2), (-1.5, 2.5, 4), (8, 4, 0)]:
+            with self.subTest(a=a, b=b, c=c):
+                expected = self.calc.subtract(self.calc.multiply(self.calc.add(a, b), c),
+                                              self.calc.divide(a, b))
+                self.assertEqual(expression.evaluate(a=a, b=b, c=c), expected)
+
+    def test_division_by_zero(self):
+        """Test that dividing by zero anywhere makes the result None."""
+        self.assertIsNone(self.calc.compile("x / (y - y) + 1").evaluate(x=1, y=3))
+        self.assertIsNone(self.calc.compile("-(x / y) * 2").evaluate(x=1, y=0))
+        self.assertIsNone(self.calc.compile("x + 1 / 0").evaluate(x=1))
+        self.assertEqual(self.calc.compile("x / y").evaluate_many([(1, 0), (1, 2)]), [None, 0.5])
+
+    def test_constant_expression(self):
+        """Test expressions without variables."""
+        expression = self.calc.compile("10 / 2 - -3")
+        self.assertEqual(expression.variables, ())
+        self.assertEqual(expression.evaluate(), 8)
+
+    def test_invalid_expressions(self):
+        """Test that malformed or unsupported expressions are rejected."""
+        for source in ["1 +", "x ** 2", "f(x)", "x if y else z", "'a' + 'b'", "_x + 1"]:
+            with self.subTest(source=source):
+                with self.assertRaises(ValueError):
+                    self.calc.compile(source)
+
+    def test_builtin_names_as_variables(self):
+        """Test that variables named like builtins do not change how errors are caught."""
+        expression = self.calc.compile("ZeroDivisionError / x + len")
+        self.assertEqual(expression.variables, ("ZeroDivisionError", "x", "len"))
+        self.assertEqual(expression.evaluate(ZeroDivisionError=6, x=3, len=1), 3)
+        self.assertIsNone(expression.evaluate(ZeroDivisionError=6, x=0, len=1))
+
+    def test_deeply_nested_expressions(self):
+        """Test that expressions too deep to compile are rejected with ValueError."""
+        for source in ["+".join(["x"] * 3000), "(" * 3000 + "1" + ")" * 3000]:
+            with self.subTest(length=len(source)):
+                with self.assertRaises(ValueError):
+                    self.calc.compile(source)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,59 @@
+# benchmark_savings_projection.py
+
+# Compare scenarios per second for the vectorized projections in
+# savings_projection.py against computing one scenario at a time, the way
+# finance_calculator.py and simple_interest.py do.
+
+import argparse
+import random
+import time
+
+import savings_projection as projection
+
+
+def _scalar_projection(income, expenses, principal, rate, years):
+    monthly_savings = income - expenses
+    annual_savings = monthly_savings * 12
+    projected_savings = annual_savings + (annual_savings * 0.05)
+    interest = principal * rate * years
+    return monthly_savings, projected_savings, interest
+
+
+def _vectorized_projection(income, expenses, principal, rate, years):
+    savings = projection.monthly_savings(income, expenses)
+    return (savings, projection.projected_annual_savings(savings),
+            projection.simple_interest(principal, rate, years))
+
+
+def main():
+    """Run the benchmark and print scenarios per second for each path"""
+    parser = argparse.ArgumentParser(description="Benchmark savings projections.")
+    parser.add_argument('--scenarios', type=int, default=1_000_000,
+                        help="number of scenarios (default: 1,000,000)")
+    args = parser.parse_args()
+    rng = random.Random(0)
+    columns = [[rng.uniform(2000, 9000) for _ in range(args.scenarios)],
+               [rng.uniform(1000, 8000) for _ in range(args.scenarios)],
+               [rng.uniform(100, 100_000) for _ in range(args.scenarios)],
+               [rng.uniform(0.01, 0.1) for _ in range(args.scenarios)],
+               [rng.randint(1, 30) for _ in range(args.scenarios)]]
+    if projection.np is not None:
+        arrays = [projection.np.array(column) for column in columns]
+    else:
+        arrays = columns
+
+    cases = {
+        "one scenario at a time": lambda: list(map(_scalar_projection, *columns)),
+        "vectorized": lambda: _vectorized_projection(*arrays),
+    }
+    print(f"Scenarios per second ({args.scenarios:,} scenarios, "
+          f"{'NumPy' if projection.np is not None else 'no NumPy'}):")
+    for name, function in cases.items():
+        start = time.perf_counter()
+        function()
+        rate = args.scenarios / (time.perf_counter() - start)
+        print(f"  {name:<23} {rate:14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+# interest_schedule.py
+
+# Period-by-period schedules for simple_interest.py style calculations:
+# loan amortization, deposit growth and simple interest. Rows are
+# generated lazily, starting from a balance worked out in closed form, so
+# reading page 300 of a 30-year schedule does not compute pages 1 to 299,
+# and memory use does not depend on the length of the horizon. Summary
+# totals come straight from the closed-form formulas without generating
+# any rows.
+
+import argparse
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from itertools import islice
+
+# One line of a schedule. payment is the money paid in that period (the
+# loan payment or the deposit contribution), interest is the interest for
+# the period and balance is what is left (or saved) at its end. For loans
+# the principal repaid in a period is payment - interest.
+Row = namedtuple('Row', 'period payment interest balance')
+
+# Totals over a whole schedule
+Summary = namedtuple('Summary', 'periods total_paid total_interest final_balance')
+
+
+class Schedule(ABC):
+    """
+    Base class for a schedule over a fixed number of periods
+
+    Subclasses must give the balance after any period in closed form
+    (balance_at), the totals (summary) and how one period follows from the
+    previous one (_next_row); rows are then produced on demand from any
+    starting point.
+    """
+
+    def __init__(self, principal, rate, years, periods_per_year=12):
+        """
+        Parameters:
+        principal (float): Amount borrowed or initially deposited
+        rate (float): Annual interest rate (0.05 means 5%)
+        years (float): Length of the schedule in years
+        periods_per_year (int): Number of periods per year, 12 for monthly
+        """
+        if periods_per_year < 1:
+            raise ValueError("There must be at least one period per year.")
+        self.principal = principal
+        self.rate = rate
+        self.years = years
+        self.periods_per_year = periods_per_year
+        self.periods = round(years * periods_per_year)
+        if self.periods < 1:
+            raise ValueError("The schedule must cover at least one period.")
+        self.period_rate = rate / periods_per_year
+
+    def __len__(self):
+        return self.periods
+
+    def __iter__(self):
+        return self.rows()
+
+    def __getitem__(self, period):
+        """Get the row for one period, counting from 1"""
+        if not 1 <= period <= self.periods:
+            raise IndexError(f"Period must be between 1 and {self.periods}.")
+        return next(self.rows(period, period + 1))
+
+    def rows(self, start=1, stop=None):
+        """
+        Generate the rows for a range of periods
+
+        Parameters:
+        start (int): First period, counting from 1
+        stop (int): Period to stop before; None runs to the end
+
+        Yields:
+        Row: One row per period
+        """
+        stop = self.periods + 1 if stop is None else min(stop, self.periods + 1)
+        start = max(start, 1)
+        balance = self.balance_at(start - 1)
+        for period in range(start, stop):
+            row = self._next_row(period, balance)
+            balance = row.balance
+            yield row
+
+    def page(self, number, size=12):
+        """
+        Get one page of rows
+
+        Parameters:
+        number (int): Page number, counting from 1
+        size (int): Rows per page
+
+        Returns:
+        list: The rows on that page (empty past the end of the schedule)
+
+        Raises:
+        ValueError: If number or size is less than 1
+        """
+        if number < 1:
+            raise ValueError("Page numbers start at 1.")
+        if size < 1:
+            raise ValueError("A page must hold at least one row.")
+        start = (number - 1) * size + 1
+        return list(islice(self.rows(start), size))
+
+    @abstractmethod
+    def balance_at(self, period):
+        """
+        Get the balance at the end of a period, without generating rows
+
+        Parameters:
+        period (int): Period number; 0 is the start of the schedule
+
+        Returns:
+        float: The balance
+        """
+
+    @abstractmethod
+    def summary(self):
+        """
+        Get the schedule's totals, without generating rows
+
+        Returns:
+        Summary: Number of periods, total paid, total interest and final balance
+        """
+
+    @abstractmethod
+    def _next_row(self, period, balance):
+        """Get the row for a period, given the balance at the end of the one before"""
+
+    def _growth(self, period):
+        """(1 + r)^period for the period rate r"""
+        return (1 + self.period_rate) ** period
+
+
+class AmortizationSchedule(Schedule):
+    """A loan repaid with equal payments at the end of every period"""
+
+    def __init__(self, principal, rate, years, periods_per_year=12):
+        super().__init__(principal, rate, years, periods_per_year)
+        if self.period_rate:
+            self.payment = (principal * self.period_rate
+                            / (1 - (1 + self.period_rate) ** -self.periods))
+        else:
+            self.payment = principal / self.periods
+
+    def balance_at(self, period):
+        if period >= self.periods:
+            return 0.0
+        if not self.period_rate:
+            return self.principal - self.payment * period
+        growth = self._growth(period)
+        return self.principal * growth - self.payment * (growth - 1) / self.period_rate
+
+    def summary(self):
+        total_paid = self.payment * self.periods
+        return Summary(self.periods, total_paid, total_paid - self.principal, 0.0)
+
+    def _next_row(self, period, balance):
+        interest = balance * self.period_rate
+        if period == self.periods:
+            # The last payment clears whatever rounding has left over.
+            return Row(period, balance + interest, interest, 0.0)
+        return Row(period, self.payment, interest, balance + interest - self.payment)
+
+
+class DepositSchedule(Schedule):
+    """Savings growing with compound interest and a contribution every period"""
+
+    def __init__(self, principal, rate, years, periods_per_year=12, contribution=0.0):
+        """
+        Parameters:
+        principal (float): Initial deposit
+        rate (float): Annual interest rate
+        years (float): Length of the schedule in years
+        periods_per_year (int): Compounding periods per year
+        contribution (float): Amount added at the end of every period
+        """
+        super().__init__(principal, rate, years, periods_per_year)
+        self.contribution = contribution
+
+    def balance_at(self, period):
+        period = min(period, self.periods)
+        if not self.period_rate:
+            return self.principal + self.contribution * period
+        growth = self._growth(period)
+        return self.principal * growth + self.contribution * (growth - 1) / self.period_rate
+
+    def summary(self):
+        final_balance = self.balance_at(self.periods)
+        total_paid = self.contribution * self.periods
+        return Summary(self.periods, total_paid,
+                       final_balance - self.principal - total_paid, final_balance)
+
+    def _next_row(self, period, balance):
+        interest = balance * self.period_rate
+        return Row(period, self.contribution, interest, balance + interest + self.contribution)
+
+
+class SimpleInterestSchedule(Schedule):
+    """Simple interest: the same interest on the principal every period"""
+
+    def balance_at(self, period):
+        return self.principal + self.principal * self.period_rate * min(period, self.periods)
+
+    def summary(self):
+        interest = self.principal * self.period_rate * self.periods
+        return Summary(self.periods, 0.0, interest, self.principal + interest)
+
+    def _next_row(self, period, balance):
+        interest = self.principal * self.period_rate
+        return Row(period, 0.0, interest, balance + interest)
+
+
+SCHEDULES = {
+    'loan': AmortizationSchedule,
+    'deposit': DepositSchedule,
+    'simple': SimpleInterestSchedule,
+}
+
+
+def portfolio_summary(schedules):
+    """
+    Add up the summaries of many schedules
+
+    Parameters:
+    schedules (iterable of Schedule): The schedules; can be a generator,
+        so a large portfolio never has to be held in memory
+
+    Returns:
+    Summary: Combined totals (periods is the longest schedule's length)
+    """
+    periods = total_paid = total_interest = final_balance = 0
+    for schedule in schedules:
+        summary = schedule.summary()
+        periods = max(periods, summary.periods)
+        total_paid += summary.total_paid
+        total_interest += summary.total_interest
+        final_balance += summary.final_balance
+    return Summary(periods, total_paid, total_interest, final_balance)
+
+
+def main(argv=None):
+    """Print one page of a schedule, followed by its totals"""
+    parser = argparse.ArgumentParser(description="Print an interest or amortization schedule.")
+    parser.add_argument('kind', choices=SCHEDULES, help="type of schedule")
+    parser.add_argument('--principal', type=float, default=1000.0,
+                        help="amount borrowed or deposited (default: %(default)s)")
+    parser.add_argument('--rate', type=float, default=0.05,
+                        help="annual interest rate (default: %(default)s)")
+    parser.add_argument('--years', type=float, default=3,
+                        help="length in years (default: %(default)s)")
+    parser.add_argument('--periods-per-year', type=int, default=12,
+                        help="periods per year (default: %(default)s)")
+    parser.add_argument('--contribution', type=float, default=0.0,
+                        help="deposit added every period (deposit schedules only)")
+    parser.add_argument('--page', type=int, default=1, help="page to print (default: 1)")
+    parser.add_argument('--page-size', type=int, default=12,
+                        help="rows per page (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    settings = (args.principal, args.rate, args.years, args.periods_per_year)
+    try:
+        if args.kind == 'deposit':
+            schedule = DepositSchedule(*settings, contribution=args.contribution)
+        else:
+            schedule = SCHEDULES[args.kind](*settings)
+        page = schedule.page(args.page, args.page_size)
+    except ValueError as error:
+        parser.error(str(error))
+
+    print(f"{'Period':>6} {'Payment':>14} {'Interest':>14} {'Balance':>16}")
+    for row in page:
+        print(f"{row.period:>6} ${row.payment:>13,.2f} ${row.interest:>13,.2f} "
+              f"${row.balance:>15,.2f}")
+    summary = schedule.summary()
+    print(f"Total paid: ${summary.total_paid:,.2f}, total interest: "
+          f"${summary.total_interest:,.2f}, final balance: ${summary.final_balance:,.2f} "
+          f"over {summary.periods} periods")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+# savings_projection.py
+
+# Savings and interest formulas from finance_calculator.py and
+# simple_interest.py, for many scenarios at once. Every argument can be a
+# single number or a column of numbers (one per scenario).
+
+import argparse
+import csv
+import sys
+import time
+from array import array
+from itertools import islice, repeat
+from numbers import Real
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+# Interest rate used by finance_calculator.py for projected savings
+DEFAULT_ANNUAL_RATE = 0.05
+
+CHUNK_ROWS = 100_000
+
+
+def _vectorize(formula, *values):
+    """
+    Apply a formula to numbers or columns of numbers
+
+    The formula only uses arithmetic operators, so with NumPy it runs on
+    whole arrays at once; without NumPy it is mapped over the columns, with
+    single numbers repeated for every scenario.
+    """
+    if np is not None:
+        return formula(*(np.asarray(value, dtype=np.float64) for value in values))
+    if all(isinstance(value, Real) for value in values):
+        return formula(*values)
+    return array('d', map(formula, *(repeat(value) if isinstance(value, Real) else value
+                                     for value in values)))
+
+
+def _monthly_savings(income, expenses):
+    return income - expenses
+
+
+def _projected_annual_savings(savings, rate):
+    return savings * 12 * (1 + rate)
+
+
+def _simple_interest(principal, rate, years):
+    return principal * rate * years
+
+
+def _compound_interest(principal, rate, years, periods_per_year):
+    return principal * ((1 + rate / periods_per_year) ** (periods_per_year * years) - 1)
+
+
+def monthly_savings(income, expenses):
+    """
+    Monthly savings: income minus expenses
+
+    Parameters:
+    income (float or sequence): Monthly income
+    expenses (float or sequence): Monthly expenses
+
+    Returns:
+    float, ndarray or array: Monthly savings per scenario
+    """
+    return _vectorize(_monthly_savings, income, expenses)
+
+
+def projected_annual_savings(savings, rate=DEFAULT_ANNUAL_RATE):
+    """
+    Savings after one year, with interest added once on the year's total
+
+    Parameters:
+    savings (float or sequence): Monthly savings
+    rate (float or sequence): Annual interest rate (0.05 means 5%)
+
+    Returns:
+    float, ndarray or array: Projected savings per scenario
+    """
+    return _vectorize(_projected_annual_savings, savings, rate)
+
+
+def simple_interest(principal, rate, years):
+    """
+    Simple interest: principal * rate * years
+
+    Parameters:
+    principal (float or sequence): Initial investment
+    rate (float or sequence): Annual interest rate
+    years (float or sequence): Time in years
+
+    Returns:
+    float, ndarray or array: Interest earned per scenario
+    """
+    return _vectorize(_simple_interest, principal, rate, years)
+
+
+def compound_interest(principal, rate, years, periods_per_year=1):
+    """
+    Compound interest earned over the given time
+
+    Parameters:
+    principal (float or sequence): Initial investment
+    rate (float or sequence): Annual interest rate
+    years (float or sequence): Time in years
+    periods_per_year (int): How often interest is compounded each year
+
+    Returns:
+    float, ndarray or array: Interest earned per scenario (final amount
+        minus principal)
+    """
+    return _vectorize(_compound_interest, principal, rate, years, periods_per_year)
+
+
+# CSV columns read by project_csv and the columns computed from them
+INPUT_COLUMNS = {
+    ('income', 'expenses'): ('monthly_savings', 'projected_savings'),
+    ('principal', 'rate', 'time'): ('simple_interest', 'compound_interest'),
+}
+
+
+def _parse_column(rows, index, bad):
+    """
+    Read one column of a chunk as floats
+
+    Rows where the column is missing or not a number get NaN, and their
+    positions in the chunk are added to bad.
+    """
+    try:
+        return [float(row[index]) for row in rows]
+    except (ValueError, IndexError):
+        pass
+    values = []
+    for position, row in enumerate(rows):
+        try:
+            values.append(float(row[index]))
+        except (ValueError, IndexError):
+            values.append(float('nan'))
+            bad.add(position)
+    return values
+
+
+def _project_chunk(header, rows, annual_rate, periods_per_year):
+    """
+    Compute the output columns for a chunk of CSV rows
+
+    Returns:
+    tuple: (results, bad) where results is a list of output columns and bad
+        maps the position of every row with a missing or non-numeric input
+        to the output columns computed from that input
+    """
+    index = {name: position for position, name in enumerate(header)}
+    results = []
+    bad = {}
+    for inputs in INPUT_COLUMNS:
+        if not all(name in index for name in inputs):
+            continue
+        group_bad = set()
+        columns = [_parse_column(rows, index[name], group_bad) for name in inputs]
+        if inputs == ('income', 'expenses'):
+            savings = monthly_savings(*columns)
+            group = [savings, projected_annual_savings(savings, annual_rate)]
+        else:
+            group = [simple_interest(*columns), compound_interest(*columns, periods_per_year)]
+        # A bad value only blanks the results computed from its own group.
+        outputs = range(len(results), len(results) + len(group))
+        for position in group_bad:
+            bad.setdefault(position, []).extend(outputs)
+        results += group
+    return [result.tolist() for result in results], bad
+
+
+def project_csv(source, target, annual_rate=DEFAULT_ANNUAL_RATE, periods_per_year=1,
+                bad_rows=None):
+    """
+    Add projection columns to every row of a CSV file
+
+    The input needs an income and expenses column, a principal, rate and
+    time column, or both. Rows are processed in chunks, so memory use does
+    not grow with the size of the file. A row with a blank, missing or
+    non-numeric input is still written, with empty result columns for the
+    formulas that use that input; the other results are filled in.
+
+    Parameters:
+    source (file): CSV input with a header row
+    target (file): Where to write the input columns plus the results
+    annual_rate (float): Interest rate for the projected savings
+    periods_per_year (int): Compounding periods for compound interest
+    bad_rows (list): If given, receives the row number (the header being
+        row 1) of every row written with empty results
+
+    Returns:
+    int: Number of rows written
+
+    Raises:
+    ValueError: If the input is empty or lacks the input columns
+    """
+    reader = csv.reader(source)
+    writer = csv.writer(target)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("CSV input is empty; expected a header row.")
+    outputs = [output for inputs, names in INPUT_COLUMNS.items()
+               if all(name in header for name in inputs) for output in names]
+    if not outputs:
+        raise ValueError("CSV needs income/expenses or principal/rate/time columns.")
+    writer.writerow(header + outputs)
+
+    count = 0
+    while True:
+        rows = list(islice(reader, CHUNK_ROWS))
+        if not rows:
+            break
+        results, bad = _project_chunk(header, rows, annual_rate, periods_per_year)
+        lines = [row + list(values) for row, values in zip(rows, zip(*results))]
+        for position in sorted(bad):
+            row = rows[position]
+            values = [column[position] for column in results]
+            for output in bad[position]:
+                values[output] = ''
+            # Short rows are padded so the results line up with the header.
+            lines[position] = row + [''] * (len(header) - len(row)) + values
+            if bad_rows is not None:
+                bad_rows.append(count + position + 2)
+        writer.writerows(lines)
+        count += len(rows)
+    return count
+
+
+def main(argv=None):
+    """Run the CSV-in/CSV-out batch projection"""
+    parser = argparse.ArgumentParser(description="Project savings and interest for a CSV "
+                                                 "file of scenarios.")
+    parser.add_argument('input', help="input CSV file ('-' for stdin)")
+    parser.add_argument('output', help="output CSV file ('-' for stdout)")
+    parser.add_argument('--annual-rate', type=float, default=DEFAULT_ANNUAL_RATE,
+                        help="interest rate for projected savings (default: %(default)s)")
+    parser.add_argument('--compounding', type=int, default=1,
+                        help="compounding periods per year (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == '-' else open(args.input, newline='', encoding='utf-8')
+    target = (sys.stdout if args.output == '-'
+              else open(args.output, 'w', newline='', encoding='utf-8'))
+    bad_rows = []
+    start = time.perf_counter()
+    try:
+        count = project_csv(source, target, args.annual_rate, args.compounding, bad_rows)
+    except ValueError as error:
+        parser.error(str(error))
+    finally:
+        for file in (source, target):
+            if file not in (sys.stdin, sys.stdout):
+                file.close()
+    seconds = time.perf_counter() - start
+    print(f"Projected {count:,} scenarios in {seconds:.3f} s", file=sys.stderr)
+    if bad_rows:
+        shown = ', '.join(map(str, bad_rows[:10])) + (', ...' if len(bad_rows) > 10 else '')
+        print(f"{len(bad_rows):,} rows had missing or non-numeric values and were written "
+              f"without results: rows {shown}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+# savings_simulation.py
+
+# Monte Carlo version of finance_calculator.py. Instead of a fixed 5%
+# return, every simulated month draws a random investment return and may
+# hit an expense shock. Runs are split into fixed-size chunks, each with
+# its own seed, and spread over a process pool. Workers send back compact
+# percentile summaries rather than whole paths, so memory use does not
+# grow with the number of runs and results do not depend on the number of
+# workers.
+
+import argparse
+import math
+import os
+import random
+import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+CHUNK_RUNS = 10_000
+
+# Number of points kept in each percentile summary
+SUMMARY_POINTS = 1001
+
+DEFAULTS = {
+    'monthly_income': 5000.0,
+    'monthly_expenses': 3500.0,
+    'initial_balance': 0.0,
+    'years': 5,
+    'annual_return': 0.05,      # mean yearly investment return
+    'annual_volatility': 0.15,  # standard deviation of yearly returns
+    'shock_probability': 0.05,  # chance of an expense shock in any month
+    'shock_size': 0.5,          # mean extra expenses in a shock, as a fraction of expenses
+}
+
+
+class PercentileSummary:
+    """
+    Approximate distribution of many values, kept as evenly spaced quantiles
+
+    A summary holds SUMMARY_POINTS quantiles (including the minimum and
+    maximum) and the number of values behind them. Two summaries can be
+    merged into one of the same size, so results from any number of chunks
+    can be combined in constant memory.
+    """
+
+    def __init__(self, points, count):
+        """
+        Parameters:
+        points (list of float): Evenly spaced quantiles, lowest first
+        count (int): Number of values summarized
+        """
+        self.points = points
+        self.count = count
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Summarize a collection of values
+
+        Parameters:
+        values (iterable of float): The values
+
+        Returns:
+        PercentileSummary: Their summary
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            if not len(values):
+                return cls([], 0)
+            return cls(np.quantile(values, np.linspace(0, 1, SUMMARY_POINTS)).tolist(),
+                       len(values))
+        values = sorted(values)
+        if not values:
+            return cls([], 0)
+        last = len(values) - 1
+        return cls([_interpolate(values, i * last / (SUMMARY_POINTS - 1))
+                    for i in range(SUMMARY_POINTS)], len(values))
+
+    def merge(self, other):
+        """
+        Combine two summaries
+
+        Each summary is read as a piecewise-linear quantile function, that
+        is a piecewise-linear CDF. The merged CDF is the count-weighted
+        average of the two, and the new points are read off it by linear
+        interpolation, so repeated merging does not push the tails outward.
+
+        Parameters:
+        other (PercentileSummary): Summary of another set of values
+
+        Returns:
+        PercentileSummary: Approximate summary of both sets together
+        """
+        if not other.count:
+            return self
+        if not self.count:
+            return other
+        total = self.count + other.count
+        if np is not None:
+            return PercentileSummary(_merge_numpy(self, other), total)
+        # Both CDFs are linear between consecutive points of either
+        # summary, so the merged CDF is known exactly from its values just
+        # below and at each point (the two differ where points repeat).
+        cdf_values = []
+        cdf_fractions = []
+        for value in sorted(set(self.points).union(other.points)):
+            for side in (bisect_left, bisect_right):
+                cdf_values.append(value)
+                cdf_fractions.append((self.count * _cdf(self.points, value, side)
+                                      + other.count * _cdf(other.points, value, side)) / total)
+        last = len(cdf_values) - 1
+        points = []
+        for i in range(SUMMARY_POINTS):
+            fraction = i / (SUMMARY_POINTS - 1)
+            upper = min(bisect_left(cdf_fractions, fraction), last)
+            lower = max(upper - 1, 0)
+            low_fraction, high_fraction = cdf_fractions[lower], cdf_fractions[upper]
+            if high_fraction <= low_fraction:
+                points.append(cdf_values[upper])
+            else:
+                points.append(cdf_values[lower] + (cdf_values[upper] - cdf_values[lower])
+                              * (fraction - low_fraction) / (high_fraction - low_fraction))
+        points[0], points[-1] = cdf_values[0], cdf_values[-1]
+        return PercentileSummary(points, total)
+
+    def percentile(self, percent):
+        """
+        Estimate a percentile
+
+        Parameters:
+        percent (float): Between 0 and 100
+
+        Returns:
+        float: The estimated value at that percentile
+        """
+        if not self.count:
+            raise ValueError("No values have been summarized.")
+        return _interpolate(self.points, percent / 100 * (len(self.points) - 1))
+
+
+def _cdf(points, value, side):
+    """
+    Fraction of a summary's values below value (side=bisect_left) or at
+    most value (side=bisect_right), interpolating between its points
+    """
+    index = side(points, value)
+    if index == 0:
+        return 0.0
+    last = len(points) - 1
+    if index > last:
+        return 1.0
+    lower, upper = points[index - 1], points[index]
+    return (index - 1 + (value - lower) / (upper - lower)) / last
+
+
+def _merge_numpy(first, second):
+    """NumPy implementation of PercentileSummary.merge; returns the points"""
+    values = np.unique(np.concatenate([first.points, second.points]))
+    total = first.count + second.count
+    cdf_values = np.repeat(values, 2)
+    cdf_fractions = np.empty(len(cdf_values))
+    for start, side in ((0, 'left'), (1, 'right')):
+        cdf_fractions[start::2] = sum(summary.count * _cdf_numpy(summary.points, values, side)
+                                      for summary in (first, second)) / total
+    fractions = np.linspace(0, 1, SUMMARY_POINTS)
+    upper = np.minimum(np.searchsorted(cdf_fractions, fractions), len(cdf_values) - 1)
+    lower = np.maximum(upper - 1, 0)
+    rise = cdf_fractions[upper] - cdf_fractions[lower]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        step = np.where(rise > 0, (fractions - cdf_fractions[lower]) / rise, 1.0)
+    points = cdf_values[lower] + (cdf_values[upper] - cdf_values[lower]) * step
+    points[0], points[-1] = values[0], values[-1]
+    return points.tolist()
+
+
+def _cdf_numpy(points, values, side):
+    """_cdf for an array of values at once"""
+    points = np.asarray(points)
+    last = len(points) - 1
+    index = np.searchsorted(points, values, side)
+    lower = points[np.clip(index - 1, 0, last)]
+    upper = points[np.minimum(index, last)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fractions = (index - 1 + (values - lower) / (upper - lower)) / last
+    return np.where(index == 0, 0.0, np.where(index > last, 1.0, fractions))
+
+
+def _interpolate(values, position):
+    """Linearly interpolate a sorted list at a fractional index"""
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def _simulate_numpy(runs, seed, parameters):
+    """Simulate a chunk of runs with NumPy; returns balances at each year end"""
+    rng = np.random.default_rng(list(seed))
+    months = parameters['years'] * 12
+    returns = rng.normal(parameters['annual_return'] / 12,
+                         parameters['annual_volatility'] / math.sqrt(12), (months, runs))
+    shocks = rng.random((months, runs)) < parameters['shock_probability']
+    extra = rng.exponential(parameters['shock_size'], (months, runs)) * shocks
+    expenses = parameters['monthly_expenses'] * (1 + extra)
+    balance = np.full(runs, float(parameters['initial_balance']))
+    yearly = []
+    for month in range(months):
+        balance = balance * (1 + returns[month]) + parameters['monthly_income'] - expenses[month]
+        if month % 12 == 11:
+            yearly.append(balance)
+    return yearly
+
+
+def _simulate_stdlib(runs, seed, parameters):
+    """Simulate a chunk of runs with the random module"""
+    rng = random.Random(repr(seed))
+    mean = parameters['annual_return'] / 12
+    deviation = parameters['annual_volatility'] / math.sqrt(12)
+    income = parameters['monthly_income']
+    expenses = parameters['monthly_expenses']
+    shock_probability = parameters['shock_probability']
+    shock_rate = 1 / parameters['shock_size'] if parameters['shock_size'] else math.inf
+    yearly = [[] for _ in range(parameters['years'])]
+    for _ in range(runs):
+        balance = float(parameters['initial_balance'])
+        for month in range(parameters['years'] * 12):
+            spent = expenses
+            if rng.random() < shock_probability:
+                spent *= 1 + rng.expovariate(shock_rate)
+            balance = balance * (1 + rng.gauss(mean, deviation)) + income - spent
+            if month % 12 == 11:
+                yearly[month // 12].append(balance)
+    return yearly
+
+
+def simulate_chunk(runs, seed, parameters):
+    """
+    Simulate one chunk of runs and summarize it
+
+    Parameters:
+    runs (int): Number of runs in the chunk
+    seed (tuple): (base seed, chunk index); fixes the chunk's random numbers
+    parameters (dict): Simulation settings, as in DEFAULTS
+
+    Returns:
+    tuple: (summaries, below_zero) where summaries holds one
+        PercentileSummary of balances per year and below_zero counts the
+        runs that ended the horizon with a negative balance
+    """
+    simulate = _simulate_numpy if np is not None else _simulate_stdlib
+    yearly = simulate(runs, seed, parameters)
+    return ([PercentileSummary.from_values(balances) for balances in yearly],
+            sum(balance < 0 for balance in yearly[-1]) if np is None
+            else int(np.count_nonzero(yearly[-1] < 0)))
+
+
+def simulate_savings(runs, seed=0, workers=None, **settings):
+    """
+    Run a Monte Carlo savings simulation across a process pool
+
+    Parameters:
+    runs (int): Total number of simulated paths
+    seed (int): Base seed; the same seed always gives the same results
+    workers (int): Worker processes; None uses every CPU, 1 runs in-process
+    **settings: Overrides for any of the DEFAULTS
+
+    Returns:
+    dict: 'summaries' (one PercentileSummary per year), 'below_zero'
+        (fraction of runs with a negative final balance) and 'runs'
+    """
+    unknown = set(settings) - set(DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown settings: {', '.join(sorted(unknown))}")
+    parameters = {**DEFAULTS, **settings}
+    if parameters['years'] < 1:
+        raise ValueError("The horizon must be at least one year.")
+
+    sizes = [min(CHUNK_RUNS, runs - start) for start in range(0, runs, CHUNK_RUNS)]
+    seeds = [(seed, index) for index in range(len(sizes))]
+
+    summaries = [PercentileSummary([], 0) for _ in range(parameters['years'])]
+    below_zero = 0
+    executor = ProcessPoolExecutor(workers) if workers != 1 else None
+    try:
+        # Both map()s yield in chunk order, so merging is deterministic.
+        mapper = executor.map if executor is not None else map
+        for chunk_summaries, chunk_below_zero in mapper(simulate_chunk, sizes, seeds,
+                                                        [parameters] * len(sizes)):
+            summaries = [total.merge(chunk) for total, chunk in zip(summaries, chunk_summaries)]
+            below_zero += chunk_below_zero
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return {'summaries': summaries, 'below_zero': below_zero / runs if runs else 0.0,
+            'runs': runs}
+
+
+def main(argv=None):
+    """Run a simulation from the command line and print percentile bands"""
+    parser = argparse.ArgumentParser(description="Monte Carlo savings simulation.")
+    parser.add_argument('--runs', type=int, default=100_000,
+                        help="number of simulated paths (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=0, help="base random seed")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="worker processes (default: one per CPU)")
+    for name, value in DEFAULTS.items():
+        parser.add_argument('--' + name.replace('_', '-'), type=type(value), default=value,
+                            help="default: %(default)s")
+    args = vars(parser.parse_args(argv))
+    runs, seed, workers = args.pop('runs'), args.pop('seed'), args.pop('workers')
+
+    start = time.perf_counter()
+    result = simulate_savings(runs, seed, workers, **args)
+    seconds = time.perf_counter() - start
+
+    print(f"{'Year':>4} {'5th':>12} {'25th':>12} {'Median':>12} {'75th':>12} {'95th':>12}")
+    for year, summary in enumerate(result['summaries'], 1):
+        print(f"{year:>4} " + " ".join(f"${summary.percentile(p):>11,.0f}"
+                                       for p in (5, 25, 50, 75, 95)))
+    print(f"Runs ending below zero: {result['below_zero']:.2%}")
+    print(f"Simulated {runs:,} runs in {seconds:.2f} s with {workers} worker(s) "
+          f"({runs / seconds:,.0f} runs/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the interest schedules: rows walked period by period agree
+with the closed-form balances and totals.
+"""
+
+import io
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from interest_schedule import (AmortizationSchedule, DepositSchedule, SimpleInterestSchedule,
+                               main, portfolio_summary)
+
+SCHEDULES = [
+    AmortizationSchedule(250_000, 0.045, 30),
+    AmortizationSchedule(12_000, 0.0, 2),
+    AmortizationSchedule(5_000, 0.12, 1.5, periods_per_year=4),
+    DepositSchedule(1_000, 0.05, 10, contribution=200),
+    DepositSchedule(500, 0.0, 3, periods_per_year=1, contribution=50),
+    SimpleInterestSchedule(10_000, 0.03, 5),
+]
+
+
+class TestSchedules(unittest.TestCase):
+    """Test cases for the schedule classes."""
+
+    def test_rows_match_closed_form(self):
+        """Every row's balance and the totals match balance_at() and summary()."""
+        for schedule in SCHEDULES:
+            with self.subTest(schedule=type(schedule).__name__, periods=len(schedule)):
+                rows = list(schedule)
+                self.assertEqual([row.period for row in rows], list(range(1, len(schedule) + 1)))
+                scale = max(abs(schedule.principal), 1)
+                for row in rows:
+                    self.assertAlmostEqual(row.balance, schedule.balance_at(row.period),
+                                           delta=scale * 1e-9)
+                summary = schedule.summary()
+                self.assertEqual(summary.periods, len(rows))
+                self.assertAlmostEqual(sum(row.payment for row in rows), summary.total_paid,
+                                       delta=scale * 1e-9)
+                self.assertAlmostEqual(sum(row.interest for row in rows),
+                                       summary.total_interest, delta=scale * 1e-9)
+                self.assertAlmostEqual(rows[-1].balance, summary.final_balance,
+                                       delta=scale * 1e-9)
+
+    def test_rows_from_any_start(self):
+        """Rows generated from the middle match the same rows from the start."""
+        for schedule in SCHEDULES:
+            with self.subTest(schedule=type(schedule).__name__):
+                rows = list(schedule)
+                start = len(rows) // 2
+                for expected, row in zip(rows[start - 1:], schedule.rows(start)):
+                    self.assertEqual(row.period, expected.period)
+                    self.assertAlmostEqual(row.balance, expected.balance,
+                                           delta=schedule.principal * 1e-9)
+                self.assertEqual(schedule[start].period, start)
+
+    def test_last_payment_clears_loan(self):
+        """The last amortization payment leaves exactly nothing owed."""
+        for schedule in SCHEDULES:
+            if not isinstance(schedule, AmortizationSchedule):
+                continue
+            with self.subTest(principal=schedule.principal, rate=schedule.rate):
+                rows = list(schedule)
+                self.assertEqual(rows[-1].balance, 0.0)
+                self.assertEqual(schedule.balance_at(len(schedule)), 0.0)
+                self.assertAlmostEqual(sum(row.payment - row.interest for row in rows),
+                                       schedule.principal, places=6)
+                self.assertAlmostEqual(rows[-1].payment, schedule.payment, places=6)
+
+    def test_page_bounds(self):
+        """Pages count from 1, the last page may be short and later ones are empty."""
+        schedule = AmortizationSchedule(1_000, 0.05, 1)
+        self.assertEqual([row.period for row in schedule.page(1, 5)], [1, 2, 3, 4, 5])
+        self.assertEqual([row.period for row in schedule.page(3, 5)], [11, 12])
+        self.assertEqual(schedule.page(4, 5), [])
+        for number, size in ((0, 5), (-1, 5), (1, 0)):
+            with self.subTest(number=number, size=size):
+                with self.assertRaises(ValueError):
+                    schedule.page(number, size)
+        for period in (0, 13):
+            with self.subTest(period=period):
+                with self.assertRaises(IndexError):
+                    schedule[period]
+
+    def test_invalid_settings(self):
+        """Schedules need at least one period per year and one period overall."""
+        with self.assertRaises(ValueError):
+            AmortizationSchedule(1_000, 0.05, 0)
+        with self.assertRaises(ValueError):
+            DepositSchedule(1_000, 0.05, 1, periods_per_year=0)
+
+    def test_portfolio_summary(self):
+        """A portfolio's totals are the sums of its schedules' totals."""
+        total = portfolio_summary(iter(SCHEDULES))
+        summaries = [schedule.summary() for schedule in SCHEDULES]
+        self.assertEqual(total.periods, 360)
+        self.assertAlmostEqual(total.total_interest,
+                               sum(summary.total_interest for summary in summaries))
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test cases for main."""
+
+    def run_main(self, *argv):
+        """Run main and return (exit status, stdout, stderr)."""
+        out, err = io.StringIO(), io.StringIO()
+        status = 0
+        with redirect_stdout(out), redirect_stderr(err):
+            try:
+                main(list(argv))
+            except SystemExit as error:
+                status = error.code
+        return status, out.getvalue(), err.getvalue()
+
+    def test_prints_page_and_totals(self):
+        """A page of rows is printed, followed by the totals."""
+        status, out, _ = self.run_main('loan', '--years', '1', '--page-size', '3')
+        self.assertEqual(status, 0)
+        lines = out.splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[-1].startswith("Total paid: $"))
+
+    def test_invalid_arguments_are_usage_errors(self):
+        """Bad settings and page numbers are reported without a traceback."""
+        for argv in (['loan', '--years', '0'], ['deposit', '--periods-per-year', '0'],
+                     ['simple', '--page', '0'], ['loan', '--page-size', '0']):
+            with self.subTest(argv=argv):
+                status, out, err = self.run_main(*argv)
+                self.assertEqual(status, 2)
+                self.assertEqual(out, "")
+                self.assertIn("error:", err)
+
+
+if __name__ == '__main__':
+    unittest.main()
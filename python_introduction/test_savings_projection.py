@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the vectorized savings projections and the CSV batch
+projection, run with NumPy and with the stdlib fallback.
+"""
+
+import csv
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest import mock
+import savings_projection
+from savings_projection import (compound_interest, main, monthly_savings,
+                                projected_annual_savings, project_csv, simple_interest)
+
+NUMPY = savings_projection.np
+
+INCOMES = [5000.0, 3200.5, 0.0, 12000.0]
+EXPENSES = [3000.0, 3300.0, 0.0, 4500.25]
+
+
+def project(text, **kwargs):
+    """Run project_csv on CSV text and return (rows written, output rows)."""
+    target = io.StringIO()
+    count = project_csv(io.StringIO(text), target, **kwargs)
+    return count, list(csv.reader(io.StringIO(target.getvalue())))
+
+
+class TestFormulas(unittest.TestCase):
+    """Test cases for the vectorized formulas, run with whatever backend is installed."""
+
+    def test_columns_match_scalars(self):
+        """Each scenario in a column gets what the scalar formula gives."""
+        savings = monthly_savings(INCOMES, EXPENSES)
+        self.assertEqual(list(savings), [income - expenses
+                                         for income, expenses in zip(INCOMES, EXPENSES)])
+        self.assertEqual(list(projected_annual_savings(savings, 0.05)),
+                         [value * 12 * 1.05 for value in savings])
+
+    def test_numbers_and_columns_mix(self):
+        """Single numbers are applied to every scenario."""
+        self.assertEqual(list(simple_interest([1000, 2000], 0.05, 3)),
+                         [1000 * 0.05 * 3, 2000 * 0.05 * 3])
+        self.assertEqual(list(compound_interest(1000, [0.05, 0.1], 2, 12)),
+                         [1000 * ((1 + rate / 12) ** 24 - 1) for rate in (0.05, 0.1)])
+        self.assertEqual(float(monthly_savings(10, 4)), 6.0)
+
+
+class TestProjectCsv(unittest.TestCase):
+    """Test cases for project_csv, run with whatever backend is installed."""
+
+    def test_both_groups(self):
+        """Every row gets the savings and interest columns after its own."""
+        count, rows = project("name,income,expenses,principal,rate,time\n"
+                              "a,5000,3000,1000,0.05,2\n")
+        self.assertEqual(count, 1)
+        self.assertEqual(rows[0], ["name", "income", "expenses", "principal", "rate", "time",
+                                   "monthly_savings", "projected_savings",
+                                   "simple_interest", "compound_interest"])
+        self.assertEqual([float(value) for value in rows[1][6:]],
+                         [2000.0, 2000 * 12 * 1.05, 100.0, 1000 * (1.05 ** 2 - 1)])
+
+    def test_chunks(self):
+        """Rows split over many chunks come out in order."""
+        text = "income,expenses\n" + "".join(f"{index},1\n" for index in range(25))
+        with mock.patch.object(savings_projection, "CHUNK_ROWS", 4):
+            count, rows = project(text)
+        self.assertEqual(count, 25)
+        self.assertEqual([float(row[2]) for row in rows[1:]],
+                         [float(index - 1) for index in range(25)])
+
+    def test_bad_rows(self):
+        """A bad cell only blanks the results computed from it."""
+        bad_rows = []
+        count, rows = project("income,expenses,principal,rate,time\n"
+                              "5000,3000,1000,0.05,2\n"
+                              "lots,3000,1000,0.05,2\n"
+                              "5000,3000,1000,,2\n"
+                              "5000,3000\n"
+                              "5000,3000,1000,0.05,2\n", bad_rows=bad_rows)
+        self.assertEqual(count, 5)
+        self.assertEqual(bad_rows, [3, 4, 5])
+        good = rows[1][5:]
+        self.assertEqual(rows[2][5:], ["", ""] + good[2:])
+        self.assertEqual(rows[3][5:], good[:2] + ["", ""])
+        self.assertEqual(rows[4], ["5000", "3000", "", "", ""] + good[:2] + ["", ""])
+        self.assertEqual(rows[5][5:], good)
+
+    def test_invalid_input(self):
+        """Empty input and inputs without the needed columns are rejected."""
+        for text in ("", "name,income\nx,1\n"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    project(text)
+
+    def test_command_line_reports_errors(self):
+        """main reports an empty input file as a usage error."""
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "empty.csv")
+            open(source, "w").close()
+            stderr = io.StringIO()
+            with redirect_stderr(stderr), self.assertRaises(SystemExit) as raised:
+                main([source, os.path.join(directory, "out.csv")])
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn("CSV input is empty", stderr.getvalue())
+
+
+@unittest.skipIf(NUMPY is None, "the stdlib fallback is already tested")
+class TestFormulasWithoutNumPy(TestFormulas):
+    """Runs the formula test cases against the stdlib fallback."""
+
+    def setUp(self):
+        """Hide NumPy from savings_projection for the duration of each test."""
+        patcher = mock.patch.object(savings_projection, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+@unittest.skipIf(NUMPY is None, "the stdlib fallback is already tested")
+class TestProjectCsvWithoutNumPy(TestProjectCsv):
+    """Runs the CSV test cases against the stdlib fallback and checks parity."""
+
+    def setUp(self):
+        """Hide NumPy from savings_projection for the duration of each test."""
+        patcher = mock.patch.object(savings_projection, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_parity_with_numpy(self):
+        """The stdlib fallback writes the same rows and values as the NumPy path."""
+        text = "income,expenses,principal,rate,time\n" + "".join(
+            f"{1000 + index * 7.5},{index * 3.25},{index * 100},0.0{index % 9},{index % 7}\n"
+            for index in range(200))
+        count, rows = project(text, periods_per_year=12)
+        with mock.patch.object(savings_projection, "np", NUMPY):
+            expected_count, expected_rows = project(text, periods_per_year=12)
+        self.assertEqual(count, expected_count)
+        self.assertEqual(rows[0], expected_rows[0])
+        # NumPy's power can differ from ** in the last bit or two.
+        for row, expected in zip(rows[1:], expected_rows[1:]):
+            self.assertEqual(row[:5], expected[:5])
+            for value, expected_value in zip(row[5:], expected[5:]):
+                self.assertAlmostEqual(float(value), float(expected_value),
+                                       delta=abs(float(expected_value)) * 1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Unit tests for PercentileSummary, checked against numpy.percentile.
+"""
+
+import random
+import unittest
+from unittest import mock
+import savings_simulation
+from savings_simulation import PercentileSummary
+
+NUMPY = savings_simulation.np
+
+PERCENTS = (0, 1, 5, 25, 50, 75, 95, 99, 100)
+
+
+def make_chunks(count=60, size=2000, seed=0):
+    """Chunks of values from differently shaped and shifted distributions."""
+    rng = random.Random(seed)
+    chunks = []
+    for index in range(count):
+        if index % 3 == 0:
+            chunks.append([rng.gauss(index, 5) for _ in range(size)])
+        elif index % 3 == 1:
+            chunks.append([rng.expovariate(0.5) - 10 for _ in range(size)])
+        else:
+            chunks.append([float(rng.randint(-3, 3)) for _ in range(size)])
+    return chunks
+
+
+@unittest.skipIf(NUMPY is None, "NumPy is needed as the reference")
+class TestPercentileSummary(unittest.TestCase):
+    """Test cases for merging summaries, run with whatever backend is installed."""
+
+    def summarize(self, chunks):
+        """Merge one summary per chunk, in order, as simulate_savings does."""
+        summary = PercentileSummary([], 0)
+        for chunk in chunks:
+            summary = summary.merge(PercentileSummary.from_values(chunk))
+        return summary
+
+    def assert_close_to_numpy(self, summary, values):
+        """Every percentile is within 0.2% of the data's range of numpy's."""
+        tolerance = (max(values) - min(values)) * 0.002
+        for percent in PERCENTS:
+            with self.subTest(percent=percent):
+                self.assertAlmostEqual(summary.percentile(percent),
+                                       float(NUMPY.percentile(values, percent)),
+                                       delta=tolerance)
+
+    def test_single_chunk(self):
+        """A summary of one chunk matches numpy.percentile."""
+        chunk = make_chunks(1)[0]
+        self.assert_close_to_numpy(PercentileSummary.from_values(chunk), chunk)
+
+    def test_merged_chunks(self):
+        """Merging many chunks in sequence stays close to numpy.percentile."""
+        chunks = make_chunks()
+        summary = self.summarize(chunks)
+        self.assertEqual(summary.count, sum(map(len, chunks)))
+        self.assert_close_to_numpy(summary, [value for chunk in chunks for value in chunk])
+
+    def test_error_does_not_grow_with_chunks(self):
+        """Merging more chunks of the same size keeps every percentile close."""
+        chunks = make_chunks(64, 1000, seed=3)
+        for count in (4, 16, 64):
+            values = [value for chunk in chunks[:count] for value in chunk]
+            summary = self.summarize(chunks[:count])
+            tolerance = (max(values) - min(values)) * 0.005
+            for percent in PERCENTS:
+                with self.subTest(chunks=count, percent=percent):
+                    self.assertAlmostEqual(summary.percentile(percent),
+                                           float(NUMPY.percentile(values, percent)),
+                                           delta=tolerance)
+
+    def test_empty_summaries(self):
+        """Empty summaries merge away and cannot be queried."""
+        summary = PercentileSummary.from_values([1.0, 2.0, 3.0])
+        empty = PercentileSummary([], 0)
+        self.assertIs(summary.merge(empty), summary)
+        self.assertIs(empty.merge(summary), summary)
+        with self.assertRaises(ValueError):
+            empty.percentile(50)
+
+
+@unittest.skipIf(NUMPY is None, "NumPy is needed as the reference")
+class TestPercentileSummaryWithoutNumPy(TestPercentileSummary):
+    """Runs the summary test cases against the stdlib merge and checks parity."""
+
+    def setUp(self):
+        """Hide NumPy from savings_simulation for the duration of each test."""
+        patcher = mock.patch.object(savings_simulation, "np", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_parity_with_numpy(self):
+        """The stdlib merge gives the same points as the NumPy merge."""
+        chunks = make_chunks(10)
+        fallback = self.summarize(chunks)
+        with mock.patch.object(savings_simulation, "np", NUMPY):
+            summary = self.summarize(chunks)
+        for expected, actual in zip(summary.points, fallback.points):
+            self.assertAlmostEqual(actual, expected, places=9)
+
+
+if __name__ == '__main__':
+    unittest.main()
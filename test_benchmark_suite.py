@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the benchmark suite's baseline handling: regression
+detection, environment checks and the command-line options.
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+import benchmark_suite
+from benchmark_suite import (DEFAULT_SIZES, LARGE_SIZES, environment, environment_differences,
+                             find_regressions, main)
+
+
+class TestFindRegressions(unittest.TestCase):
+    """Test cases for find_regressions."""
+
+    def test_regression(self):
+        """A rate below the baseline by more than the threshold is reported."""
+        baseline = {'a@1': 1000.0, 'b@1': 1000.0}
+        results = {'a@1': 700.0, 'b@1': 1000.0}
+        self.assertEqual(find_regressions(results, baseline, 0.2), {'a@1': (1000.0, 700.0)})
+
+    def test_no_regression(self):
+        """Slowdowns within the threshold, speedups and unmatched keys pass."""
+        baseline = {'a@1': 1000.0, 'b@1': 1000.0, 'gone@1': 1000.0}
+        results = {'a@1': 800.0, 'b@1': 5000.0, 'new@1': 1.0}
+        self.assertEqual(find_regressions(results, baseline, 0.2), {})
+        self.assertEqual(find_regressions(results, {}), {})
+
+
+class TestEnvironment(unittest.TestCase):
+    """Test cases for environment and environment_differences."""
+
+    def test_same_environment(self):
+        """A baseline saved here has no differences."""
+        self.assertEqual(environment_differences({**environment(), 'results': {}}), [])
+
+    def test_environment_mismatch(self):
+        """Every changed or missing entry is listed as saved -> current."""
+        current = {'python': '3.12.1', 'numpy': True, 'machine': 'x86_64'}
+        saved = {'python': '3.11.4', 'numpy': True}
+        self.assertEqual(environment_differences(saved, current),
+                         ['python: 3.11.4 -> 3.12.1', 'machine: unknown -> x86_64'])
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test cases for main's baseline checks and sizes, without timing anything."""
+
+    def setUp(self):
+        """Replace run_suite so main returns straight away."""
+        patcher = mock.patch.object(benchmark_suite, 'run_suite', return_value={'a@1': 700.0})
+        self.run_suite = patcher.start()
+        self.addCleanup(patcher.stop)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'baseline.json')
+
+    def run_main(self, *argv):
+        """Run main and return (exit status, stderr)."""
+        err = io.StringIO()
+        with redirect_stdout(io.StringIO()), redirect_stderr(err):
+            try:
+                status = main(list(argv))
+            except SystemExit as error:
+                status = error.code
+        return status, err.getvalue()
+
+    def write_baseline(self, document):
+        """Write a baseline file."""
+        with open(self.path, 'w', encoding='utf-8') as file:
+            json.dump(document, file)
+
+    def test_sizes(self):
+        """--large adds the million-record tier to the sizes."""
+        self.assertEqual(self.run_main()[0], 0)
+        self.assertEqual(self.run_suite.call_args.args[0], list(DEFAULT_SIZES))
+        self.run_main('--large')
+        self.assertEqual(self.run_suite.call_args.args[0], list(DEFAULT_SIZES + LARGE_SIZES))
+
+    def test_regression_fails(self):
+        """A regression against the baseline makes the exit status 1."""
+        self.write_baseline({**environment(), 'results': {'a@1': 1000.0}})
+        self.assertEqual(self.run_main('--baseline', self.path)[0], 1)
+        self.write_baseline({**environment(), 'results': {'a@1': 800.0}})
+        self.assertEqual(self.run_main('--baseline', self.path)[0], 0)
+
+    def test_environment_mismatch(self):
+        """A baseline from another environment is refused unless told otherwise."""
+        self.write_baseline({**environment(), 'python': '2.7.18', 'results': {'a@1': 800.0}})
+        status, err = self.run_main('--baseline', self.path)
+        self.assertEqual(status, 2)
+        self.assertIn('python: 2.7.18 ->', err)
+        status, err = self.run_main('--baseline', self.path, '--ignore-environment')
+        self.assertEqual(status, 0)
+        self.assertIn('WARNING', err)
+
+    def test_invalid_baselines(self):
+        """Unreadable baselines and ones without results are usage errors."""
+        for text in ('{"results": ', '[]', json.dumps(environment()),
+                     json.dumps({**environment(), 'results': [1]})):
+            with self.subTest(text=text):
+                with open(self.path, 'w', encoding='utf-8') as file:
+                    file.write(text)
+                status, err = self.run_main('--baseline', self.path)
+                self.assertEqual(status, 2)
+                self.assertIn('baseline', err)
+        status, err = self.run_main('--baseline', self.path + '.missing')
+        self.assertEqual(status, 2)
+        self.run_suite.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Instrumentation: wrapping and unwrapping, error
+classification, histogram buckets, per-thread buffers and the Prometheus
+and JSON output.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import types
+import unittest
+from instrumentation import Instrumentation, _default_targets, _divide_error, _when_false
+
+
+class TestInstall(unittest.TestCase):
+    """Test cases for install, uninstall and what the wrappers record."""
+
+    def setUp(self):
+        """Create an instrumentation that is always uninstalled afterwards."""
+        self.instrumentation = Instrumentation()
+        self.addCleanup(self.instrumentation.uninstall)
+
+    def test_uninstall_restores_originals(self):
+        """Module functions and methods are wrapped, then put back exactly."""
+        module = types.ModuleType('example')
+        module.double = lambda value: value * 2
+
+        class Example:
+            def triple(self, value):
+                return value * 3
+
+        double, triple = module.double, Example.__dict__['triple']
+        self.instrumentation.install(module, 'double')
+        self.instrumentation.install(Example, 'triple', 'triple')
+        self.assertIsNot(module.double, double)
+        self.assertIsNot(Example.__dict__['triple'], triple)
+        self.assertEqual((module.double(2), Example().triple(2)), (4, 6))
+        self.assertEqual({operation: totals['calls'] for operation, totals
+                          in self.instrumentation.snapshot().items()},
+                         {'example.double': 1, 'triple': 1})
+
+        self.instrumentation.uninstall()
+        self.assertIs(module.double, double)
+        self.assertIs(Example.__dict__['triple'], triple)
+
+    def test_uninstall_restores_defaults(self):
+        """Every default entry point is back to its original after uninstall."""
+        originals = [(owner, attribute, owner.__dict__[attribute])
+                     for owner, attribute, _, _ in _default_targets()]
+        self.instrumentation.install_defaults()
+        for owner, attribute, original in originals:
+            self.assertIsNot(owner.__dict__[attribute], original)
+        self.instrumentation.uninstall()
+        for owner, attribute, original in originals:
+            with self.subTest(operation=f"{owner.__name__}.{attribute}"):
+                self.assertIs(owner.__dict__[attribute], original)
+
+    def test_default_error_kinds(self):
+        """Failures of the default entry points are recorded by kind."""
+        self.instrumentation.install_defaults()
+        import arithmetic_operations
+        from bank_account import BankAccount
+        from library_management import Book, Library
+
+        arithmetic_operations.perform_operation(1, 0, 'divide')
+        arithmetic_operations.perform_operation(1, 2, 'power')
+        arithmetic_operations.perform_operation(1, 2, 'add')
+        account = BankAccount(10)
+        account.deposit(5)
+        account.withdraw(100)
+        library = Library()
+        library.add_book(Book("Dune", "Frank Herbert"))
+        library.check_out_book("Dune")
+        library.check_out_book("Dune")
+        library.return_book("Dune")
+        library.return_book("Dune")
+
+        snapshot = self.instrumentation.snapshot()
+        self.assertEqual({operation: (totals['calls'], totals['errors'])
+                          for operation, totals in snapshot.items()},
+                         {'perform_operation': (3, {'divide_by_zero': 1,
+                                                    'invalid_operation': 1}),
+                          'BankAccount.deposit': (1, {}),
+                          'BankAccount.withdraw': (1, {'insufficient_funds': 1}),
+                          'Library.check_out_book': (2, {'book_unavailable': 1}),
+                          'Library.return_book': (2, {'book_not_checked_out': 1})})
+
+    def test_exceptions_recorded_by_class(self):
+        """Raised exceptions are counted under their class name and re-raised."""
+        def lookup(key):
+            return {'a': 1}[key]
+
+        wrapped = self.instrumentation.wrap(lookup, 'lookup')
+        self.assertEqual(wrapped('a'), 1)
+        with self.assertRaises(KeyError):
+            wrapped('b')
+        totals = self.instrumentation.snapshot()['lookup']
+        self.assertEqual((totals['calls'], totals['errors']), (2, {'KeyError': 1}))
+
+    def test_classifiers(self):
+        """The default classifiers tell successes from each kind of failure."""
+        self.assertEqual(_divide_error("Error: Cannot divide by zero"), 'divide_by_zero')
+        self.assertEqual(_divide_error("Error: Invalid operation"), 'invalid_operation')
+        self.assertIsNone(_divide_error(0.5))
+        classify = _when_false('missing')
+        self.assertEqual(classify(False), 'missing')
+        self.assertIsNone(classify(True))
+        self.assertIsNone(classify(None))
+        self.assertIsNone(classify(0))
+
+
+class TestRecording(unittest.TestCase):
+    """Test cases for histogram buckets, per-thread buffers and output."""
+
+    def setUp(self):
+        """Create an instrumentation with a few wide buckets."""
+        self.instrumentation = Instrumentation(buckets=(0.1, 0.25, 1.0))
+
+    def test_bucket_boundaries(self):
+        """A value equal to a bound falls in that bound's bucket."""
+        for seconds in (0.0, 0.1, 0.1000001, 0.25, 0.3, 1.0, 1.5, 60.0):
+            self.instrumentation.record('op', seconds)
+        totals = self.instrumentation.snapshot()['op']
+        self.assertEqual(totals['buckets'], [2, 2, 2, 2])
+        self.assertEqual(totals['calls'], 8)
+        self.assertAlmostEqual(totals['seconds'], 63.2500001)
+
+    def test_threads(self):
+        """Calls from many threads add up, and ended threads leave no buffers behind."""
+        def work():
+            for index in range(50):
+                self.instrumentation.record('op', 0.2, 'failed' if index % 10 == 0 else None)
+
+        for _ in range(3):
+            threads = [threading.Thread(target=work) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(self.instrumentation._buffers), 0)
+        work()
+        self.assertEqual(len(self.instrumentation._buffers), 1)
+        totals = self.instrumentation.snapshot()['op']
+        self.assertEqual(totals['calls'], 25 * 50)
+        self.assertEqual(totals['errors'], {'failed': 25 * 5})
+        self.assertEqual(totals['buckets'], [0, 25 * 50, 0, 0])
+
+    def test_prometheus(self):
+        """Prometheus text has counters and a cumulative histogram per operation."""
+        self.instrumentation.record('b', 0.5, 'timeout')
+        self.instrumentation.record('a', 0.05)
+        self.instrumentation.record('a', 2.0)
+        self.assertEqual(self.instrumentation.to_prometheus(), """\
+# TYPE operation_calls_total counter
+operation_calls_total{operation="a"} 2
+operation_calls_total{operation="b"} 1
+# TYPE operation_errors_total counter
+operation_errors_total{operation="b",error="timeout"} 1
+# TYPE operation_latency_seconds histogram
+operation_latency_seconds_bucket{operation="a",le="0.1"} 1
+operation_latency_seconds_bucket{operation="a",le="0.25"} 1
+operation_latency_seconds_bucket{operation="a",le="1.0"} 1
+operation_latency_seconds_bucket{operation="a",le="+Inf"} 2
+operation_latency_seconds_sum{operation="a"} 2.05
+operation_latency_seconds_count{operation="a"} 2
+operation_latency_seconds_bucket{operation="b",le="0.1"} 0
+operation_latency_seconds_bucket{operation="b",le="0.25"} 0
+operation_latency_seconds_bucket{operation="b",le="1.0"} 1
+operation_latency_seconds_bucket{operation="b",le="+Inf"} 1
+operation_latency_seconds_sum{operation="b"} 0.5
+operation_latency_seconds_count{operation="b"} 1
+""")
+
+    def test_json(self):
+        """JSON output holds the bucket bounds and the snapshot."""
+        self.instrumentation.record('a', 0.05, 'failed')
+        document = json.loads(self.instrumentation.to_json())
+        self.assertEqual(document['buckets'], [0.1, 0.25, 1.0, '+Inf'])
+        self.assertEqual(document['operations'],
+                         {'a': {'calls': 1, 'errors': {'failed': 1}, 'seconds': 0.05,
+                                'buckets': [1, 0, 0, 0]}})
+        self.assertIsInstance(document['timestamp'], float)
+
+    def test_export(self):
+        """Exports replace the file, and unknown formats are rejected."""
+        self.instrumentation.record('a', 0.05)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'metrics')
+            self.instrumentation.export(path)
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(file.read(), self.instrumentation.to_prometheus())
+            self.instrumentation.export(path, 'json')
+            with open(path, encoding='utf-8') as file:
+                self.assertEqual(json.load(file)['operations']['a']['calls'], 1)
+            self.assertEqual(os.listdir(directory), ['metrics'])
+            with self.assertRaises(ValueError):
+                self.instrumentation.export(path, 'xml')
+
+
+if __name__ == '__main__':
+    unittest.main()